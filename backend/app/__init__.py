@@ -3,10 +3,16 @@ from flask_cors import CORS
 import logging
 
 def create_app():
-    # Configure logging
-    logger = logging.getLogger(__name__)
+    # Configure logging once for the whole application; the core modules
+    # only create loggers and rely on this handler
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     
     app = Flask(__name__)
+    # Reject oversized uploads (PDF plus figures) before the body is read
+    app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024
     CORS(app)
     
     from app.routes.main import main
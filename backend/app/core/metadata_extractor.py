@@ -1,10 +1,161 @@
 import logging
 import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from functools import lru_cache
+from operator import itemgetter
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Dict
 from .pdf_extractor import ExtractedContent
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+try:
+    import hyperscan  # Optional: DFA-based multi-pattern scanning
+except ImportError:
+    hyperscan = None
+
+# Precompiled patterns for the regex fallbacks
+_ISSN_RE = re.compile(r'ISSN[:\s]*(\d{4}-\d{4})', re.IGNORECASE)
+_JOURNAL_TITLE_PREFIXES = (
+    'Journal', 'Annals', 'Archives', 'International Journal',
+    'British Journal', 'American Journal', 'BMC'
+)
+_JOURNAL_TITLE_RE = re.compile(
+    '(' + '|'.join(_JOURNAL_TITLE_PREFIXES) + r')\s+of\s+[A-Z][A-Za-z\s]{1,60}'
+)
+_KEYWORDS_RE = re.compile(r'(Key\s*words?|Keywords?)[:\-]+\s*(.+?)(?:\n\n|\n[A-Z]|\.\s+[A-Z])', re.IGNORECASE | re.DOTALL)
+_KEYWORD_SPLIT_RE = re.compile(r'[;,]')
+_PUBDATE_ISO_RE = re.compile(r'(?:Published|Received|Accepted)[:\s]+(\d{4})-(\d{2})-(\d{2})')
+_PUBDATE_LONG_RE = re.compile(r'(?:Published|Received|Accepted)\s+(?:on\s+)?([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})')
+_YEAR_RE = re.compile(r'©\s*(\d{4})|((?:19|20)\d{2})\D')
+_DOI_RE = re.compile(r'(?:doi|DOI)[:\s]*(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)')
+_DOI_ALT_RE = re.compile(r'(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)')
+_PUBLISHER_RE = re.compile(r'Publisher:\s*(.+)')
+
+# Author dicts from PDFExtractor._extract_authors always carry these keys
+_AUTHOR_FIELDS = itemgetter('surname', 'given_names', 'email', 'affiliations', 'is_corresponding')
+
+# Dated patterns always start with one of these words, so they are located
+# with str.find and matched only inside a short window after each hit
+_PUBDATE_KEYWORDS = ('Published', 'Received', 'Accepted')
+_PUBDATE_WINDOW = 64
+_PUBDATE_PATTERNS = {
+    'pubdate_iso': _PUBDATE_ISO_RE,
+    'pubdate_long': _PUBDATE_LONG_RE,
+}
+
+# Patterns folded into the single-pass article metadata scan
+_META_SCAN_PATTERNS = {
+    'keywords': _KEYWORDS_RE,
+    'year': _YEAR_RE,
+    'doi': _DOI_RE,
+    'doi_alt': _DOI_ALT_RE,
+}
+# Once these are found nothing later in the text can change the result; the
+# bare year only matters when no full date was found
+_META_SCAN_DONE = frozenset(('keywords', 'doi'))
+_META_SCAN_DONE_WITH_YEAR = _META_SCAN_DONE | {'year'}
+
+# A header-only scan is final once it has these: the preferred date and DOI
+# forms, and the keywords
+_SCAN_COMPLETE_NAMES = ('keywords', 'pubdate_iso', 'doi')
+
+
+def _find_all(text: str, literals: Tuple[str, ...]) -> List[int]:
+    """Sorted offsets of every occurrence of any of the literals in text."""
+    positions = []
+    for literal in literals:
+        pos = text.find(literal)
+        while pos != -1:
+            positions.append(pos)
+            pos = text.find(literal, pos + 1)
+    positions.sort()
+    return positions
+
+
+def _scoped(pattern: re.Pattern) -> str:
+    """Inline a compiled pattern's flags so it can be joined into an alternation."""
+    flags = ''.join(
+        char for flag, char in ((re.IGNORECASE, 'i'), (re.DOTALL, 's'))
+        if pattern.flags & flag
+    )
+    return f'(?{flags}:{pattern.pattern})' if flags else pattern.pattern
+
+
+# Each branch is a zero-width lookahead so overlapping hits are not consumed
+_COMBINED_META_RE = re.compile('|'.join(
+    f'(?=(?P<{name}>{_scoped(pattern)}))'
+    for name, pattern in _META_SCAN_PATTERNS.items()
+))
+
+
+def _build_hyperscan_db():
+    """Compile _META_SCAN_PATTERNS into a Hyperscan database, or None if unavailable."""
+    if hyperscan is None:
+        return None
+
+    flags = []
+    for pattern in _META_SCAN_PATTERNS.values():
+        flag = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8
+        if pattern.flags & re.IGNORECASE:
+            flag |= hyperscan.HS_FLAG_CASELESS
+        if pattern.flags & re.DOTALL:
+            flag |= hyperscan.HS_FLAG_DOTALL
+        flags.append(flag)
+
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.pattern.encode('utf-8') for p in _META_SCAN_PATTERNS.values()],
+            ids=list(range(len(_META_SCAN_PATTERNS))),
+            elements=len(_META_SCAN_PATTERNS),
+            flags=flags
+        )
+        return db
+    except hyperscan.error:
+        # Pattern not supported by this Hyperscan build - stay on the re path
+        return None
+
+
+_HS_NAMES = tuple(_META_SCAN_PATTERNS)
+_HS_DB = _build_hyperscan_db()
+
+
+def _normalize_text(text: str) -> str:
+    """Undo UTF-8 that was decoded as Latin-1 (e.g. "Â©" for "©") before scanning."""
+    if not text or 'Â©' not in text:
+        return text
+    try:
+        return text.encode('latin-1').decode('utf-8')
+    except UnicodeError:
+        # Mixed or partially broken text - repair just the copyright sign
+        return text.replace('Â©', '©')
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern repeated metadata strings (journal titles, affiliations) across a batch."""
+    # str() first: lxml hands back str subclasses, which sys.intern rejects
+    return sys.intern(str(value)) if value else value
+
+
+@lru_cache(maxsize=256)
+def _journal_id_for(title: str) -> str:
+    """Initials of the words in a journal title; batches see the same few titles."""
+    # e.g. "Journal of Biology" => "JOB"; one pass over the characters, no word list
+    letters = "".join(
+        char for prev, char in zip(" " + title, title)
+        if prev.isspace() and char.isalpha()
+    )
+    return letters.upper() if letters else "UNKNOWN"
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class JournalMetadata:
     """Journal-specific metadata required by PubMed (simplified)."""
     journal_id: str
@@ -12,7 +163,7 @@ class JournalMetadata:
     issn: Optional[str] = None
     publisher: Optional[str] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AuthorMetadata:
     """Structured author information."""
     surname: str
@@ -21,7 +172,7 @@ class AuthorMetadata:
     email: Optional[str] = None
     affiliations: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ArticleMetadata:
     """Extended article metadata for PubMed requirements."""
     article_type: str
@@ -46,23 +197,21 @@ class MetadataExtractor:
     but can fall back to regex-based approaches when needed.
     """
 
+    # DOIs, dates and keywords almost always sit in the first or last few KB
+    _HEADER_WINDOW = 4096
+
+    # Number of (journal_meta, article_meta) results kept for re-processed PDFs
+    _RESULT_CACHE_SIZE = 1024
+
     def __init__(self, default_article_type: str = "research-article"):
         """
         Args:
             default_article_type: Default article type if none is detected or provided by user.
         """
         self.default_article_type = default_article_type
-        self._setup_logging()
-
-    def _setup_logging(self) -> None:
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            ))
-            self.logger.addHandler(handler)
+        self._result_cache: "OrderedDict[bytes, Tuple[JournalMetadata, ArticleMetadata]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self.logger = logger
 
     def extract_metadata(
         self, 
@@ -83,14 +232,65 @@ class MetadataExtractor:
         """
         self.logger.info("Starting metadata extraction from GROBID data.")
         
+        # Re-ingested PDFs (e.g. corrections) skip the extraction entirely
+        key = self._cache_key(extracted_content, user_article_type)
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+        if cached is not None:
+            self.logger.info("Metadata extraction served from cache.")
+            return cached
+        
         # 1. Journal metadata from GROBID
         journal_meta = self._extract_journal_metadata(extracted_content)
 
         # 2. Article metadata from GROBID
         article_meta = self._extract_article_metadata(extracted_content, user_article_type)
 
+        result = (journal_meta, article_meta)
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            if len(self._result_cache) > self._RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
         self.logger.info("Metadata extraction complete.")
-        return journal_meta, article_meta
+        return result
+
+    def _cache_key(self, content: ExtractedContent, user_article_type: Optional[str]) -> bytes:
+        """Digest of every ExtractedContent field the metadata is derived from."""
+        digest = blake2b(digest_size=16)
+        for part in (
+            content.raw_text, content.title, content.abstract,
+            content.authors, content.journal_metadata, user_article_type
+        ):
+            digest.update(repr(part).encode('utf-8', 'surrogatepass'))
+            digest.update(b'\0')
+        return digest.digest()
+
+    def extract_metadata_batch(
+        self,
+        contents: List[ExtractedContent],
+        max_workers: int = 8,
+        user_article_type: Optional[str] = None
+    ) -> List[Tuple[JournalMetadata, ArticleMetadata]]:
+        """
+        Run extract_metadata over many documents with a thread pool.
+
+        Args:
+            contents: ExtractedContent objects, e.g. one per PDF in a batch.
+            max_workers: Thread pool size. Keep it in line with the number of
+                         concurrent GROBID requests feeding the batch.
+            user_article_type: Article type override applied to every document.
+
+        Returns:
+            (journal_meta, article_meta) tuples in the same order as contents.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda content: self.extract_metadata(content, user_article_type),
+                contents
+            ))
 
     def _extract_journal_metadata(self, content: ExtractedContent) -> JournalMetadata:
         """
@@ -107,10 +307,10 @@ class MetadataExtractor:
             journal_id = self._generate_journal_id(journal_title)
             
             return JournalMetadata(
-                journal_id=journal_id,
-                journal_title=journal_title,
-                issn=issn,
-                publisher=publisher
+                journal_id=_intern(journal_id),
+                journal_title=_intern(journal_title),
+                issn=_intern(issn),
+                publisher=_intern(publisher)
             )
             
         # Fallback to regex methods if GROBID didn't extract journal metadata
@@ -122,14 +322,14 @@ class MetadataExtractor:
         journal_id = self._generate_journal_id(journal_title)
 
         # If you need a publisher, you can do a naive search for "Publisher: X"
-        publisher_match = re.search(r'Publisher:\s*(.+)', chunk)
+        publisher_match = _PUBLISHER_RE.search(chunk)
         publisher = publisher_match.group(1).strip() if publisher_match else None
 
         return JournalMetadata(
-            journal_id=journal_id,
-            journal_title=journal_title,
-            issn=issn,
-            publisher=publisher
+            journal_id=_intern(journal_id),
+            journal_title=_intern(journal_title),
+            issn=_intern(issn),
+            publisher=_intern(publisher)
         )
 
     def _extract_article_metadata(
@@ -149,56 +349,50 @@ class MetadataExtractor:
 
         # 3. Authors - convert GROBID authors to AuthorMetadata
         authors = []
-        for author_data in content.authors:
-            affiliations = author_data.get('affiliations', [])
-            email = author_data.get('email')
-            
-            author = AuthorMetadata(
-                surname=author_data.get('surname', ''),
-                given_names=author_data.get('given_names', ''),
+        corresponding_author: Optional[str] = None
+        for surname, given_names, email, affiliations, is_corresponding in map(_AUTHOR_FIELDS, content.authors):
+            authors.append(AuthorMetadata(
+                surname=surname,
+                given_names=given_names,
                 email=email,
-                affiliations=affiliations
-            )
-            authors.append(author)
+                affiliations=[_intern(aff) for aff in affiliations]
+            ))
             
             # Set corresponding author if marked as such
-            if author_data.get('is_corresponding', False) and email:
-                corresponding_author = f"{author.given_names} {author.surname} ({email})"
-            elif not corresponding_author and author_data.get('is_corresponding', False):
-                corresponding_author = f"{author.given_names} {author.surname}"
+            if is_corresponding and email:
+                corresponding_author = f"{given_names} {surname} ({email})"
+            elif is_corresponding and not corresponding_author:
+                corresponding_author = f"{given_names} {surname}"
 
-        # 4. Abstract - use GROBID-extracted abstract
-        abstract = content.abstract
-            
-        # 5. Publication info from GROBID journal metadata
-        volume = content.journal_metadata.get('volume')
-        issue = content.journal_metadata.get('issue')
-        fpage = content.journal_metadata.get('fpage')
-        lpage = content.journal_metadata.get('lpage')
-        
-        # 6. Publication date - try to find in GROBID metadata or fall back to regex
-        pub_date = self._find_publication_date(content.raw_text)
+        # 4-5. Abstract and volume/issue/pagination straight from GROBID
+        grobid_meta = content.journal_metadata
+        article_kwargs = {
+            'article_type': article_type,
+            'title': title,
+            'authors': authors,
+            'corresponding_author': corresponding_author,
+            'abstract': content.abstract,
+            'volume': grobid_meta.get('volume'),
+            'issue': grobid_meta.get('issue'),
+            'fpage': grobid_meta.get('fpage'),
+            'lpage': grobid_meta.get('lpage'),
+        }
         
-        # 7. DOI - try to find in GROBID metadata or fall back to regex
-        doi = self._find_doi(content.raw_text)
-        
-        # 8. Keywords - try to find in text since GROBID doesn't always extract keywords
-        keywords = self._find_keywords(content.raw_text)
-
-        return ArticleMetadata(
-            article_type=article_type,
-            title=title,
-            authors=authors,
-            corresponding_author=corresponding_author if 'corresponding_author' in locals() else None,
-            abstract=abstract,
-            keywords=keywords,
-            publication_date=pub_date,
-            volume=volume,
-            issue=issue,
-            fpage=fpage,
-            lpage=lpage,
-            doi=doi
-        )
+        # 6-8. Publication date, DOI and keywords - use GROBID's values and only
+        #      scan the raw text for whichever of them it did not provide
+        pub_date = grobid_meta.get('pub_date')
+        doi = grobid_meta.get('doi')
+        keywords = grobid_meta.get('keywords')
+        if not (pub_date and doi and keywords):
+            matches = self._scan_bounded(_normalize_text(content.raw_text))
+            pub_date = pub_date or self._pubdate_from_matches(matches)
+            doi = doi or self._doi_from_matches(matches)
+            keywords = keywords or self._keywords_from_match(matches.get('keywords'))
+        article_kwargs['publication_date'] = pub_date
+        article_kwargs['doi'] = doi
+        article_kwargs['keywords'] = keywords
+
+        return ArticleMetadata(**article_kwargs)
 
     # ----------------------------------------------------------------------
     # Fallback methods for when GROBID data is insufficient
@@ -206,14 +400,11 @@ class MetadataExtractor:
 
     def _generate_journal_id(self, title: str) -> str:
         """Simple ID from journal title."""
-        words = title.split()
-        # e.g. "Journal of Biology" => "JOB"
-        letters = [w[0].upper() for w in words if w and w[0].isalpha()]
-        return "".join(letters) if letters else "UNKNOWN"
+        return _journal_id_for(title)
 
     def _find_issn(self, text: str) -> Optional[str]:
         """Regex search for an ISSN pattern."""
-        match = re.search(r'ISSN[:\s]*(\d{4}-\d{4})', text, re.IGNORECASE)
+        match = _ISSN_RE.search(text)
         return match.group(1) if match else None
 
     def _find_journal_title(self, text: str) -> str:
@@ -221,22 +412,112 @@ class MetadataExtractor:
         Look for something like "Journal of X", "Annals of X", etc.
         Fallback: "Unknown Journal"
         """
-        pattern = re.compile(r'(Journal|Annals|Archives|International Journal|British Journal|American Journal|BMC)\s+of\s+[A-Z][A-Za-z\s]+')
-        match = pattern.search(text)
-        if match:
-            return match.group(0).strip()
+        # Only try the regex where one of the literal prefixes actually occurs
+        for pos in _find_all(text, _JOURNAL_TITLE_PREFIXES):
+            match = _JOURNAL_TITLE_RE.match(text, pos)
+            if match:
+                return match.group(0).strip()
         return "Unknown Journal"
 
+    def _scan_all(self, text: str) -> Dict[str, re.Match]:
+        """
+        Walk the text once and collect the first match of each metadata pattern.
+        Returns a dict keyed by pattern name (see _META_SCAN_PATTERNS).
+        """
+        matches = {}
+        if not text:
+            return matches
+
+        self._scan_pubdates(text, matches)
+
+        # Hyperscan works on bytes, so only use it when offsets map 1:1 to str
+        if _HS_DB is not None and text.isascii():
+            matches.update(self._scan_all_hs(text))
+            return matches
+
+        done = _META_SCAN_DONE if matches else _META_SCAN_DONE_WITH_YEAR
+        for m in _COMBINED_META_RE.finditer(text):
+            name = m.lastgroup
+            if name not in matches:
+                # Re-run the individual pattern to get its own capture groups
+                matches[name] = _META_SCAN_PATTERNS[name].match(text, m.start())
+                if done.issubset(matches):
+                    break
+        return matches
+
+    def _scan_pubdates(self, text: str, matches: Dict[str, re.Match]) -> None:
+        """Add the first ISO and long-form dates to matches, using a literal prescan."""
+        for pos in _find_all(text, _PUBDATE_KEYWORDS):
+            for name, pattern in _PUBDATE_PATTERNS.items():
+                if name not in matches:
+                    match = pattern.match(text, pos, pos + _PUBDATE_WINDOW)
+                    if match:
+                        matches[name] = match
+            if 'pubdate_iso' in matches:
+                break
+
+    def _scan_all_hs(self, text: str) -> Dict[str, re.Match]:
+        """Hyperscan version of _scan_all; text must be ASCII."""
+        starts = {}
+
+        def on_match(pattern_id, start, end, flags, context):
+            name = _HS_NAMES[pattern_id]
+            if start < starts.get(name, len(text)):
+                starts[name] = start
+
+        _HS_DB.scan(text.encode('ascii'), match_event_handler=on_match)
+
+        # Hyperscan only reports offsets; re-run each pattern there for its groups
+        matches = {}
+        for name, start in starts.items():
+            match = _META_SCAN_PATTERNS[name].match(text, start)
+            if match:
+                matches[name] = match
+        return matches
+
+    def _scan_bounded(self, text: str) -> Dict[str, re.Match]:
+        """
+        Like _scan_all, but first tries only the first _HEADER_WINDOW
+        characters, where front matter lives. The header result is used only
+        when it already holds the matches the full scan would pick (see
+        _scan_complete); otherwise the whole text is scanned.
+        """
+        text = text or ""
+        window = self._HEADER_WINDOW
+        if len(text) <= window:
+            return self._scan_all(text)
+
+        # Cut at a line boundary so the window edge does not split a match
+        header = text[:text.rfind('\n', 0, window) + 1 or window]
+        matches = self._scan_all(header)
+        if self._scan_complete(matches, len(header)):
+            return matches
+        return self._scan_all(text)
+
+    def _scan_complete(self, matches: Dict[str, re.Match], edge: int) -> bool:
+        """
+        True if matches has an ISO date, a labelled DOI and keywords, none of
+        them running up to edge. The full scan would pick these same matches:
+        they take precedence over long-form dates, bare years and unlabelled
+        DOIs that may occur later in the text.
+        """
+        return all(
+            name in matches and matches[name].end() < edge
+            for name in _SCAN_COMPLETE_NAMES
+        )
+
     def _find_keywords(self, text: str) -> List[str]:
         """
         Look for a line starting with "Keywords:" or "Key words:" and parse comma/semicolon.
         """
-        pattern = re.compile(r'(Key\s*words?|Keywords?)[:\-]+\s*(.+?)(?:\n\n|\n[A-Z]|\.\s+[A-Z])', re.IGNORECASE | re.DOTALL)
-        match = pattern.search(text)
+        return self._keywords_from_match(_KEYWORDS_RE.search(text))
+
+    def _keywords_from_match(self, match: Optional[re.Match]) -> List[str]:
+        """Split a keywords match on commas or semicolons."""
         if match:
             keywords_str = match.group(2).strip()
             # Split on commas or semicolons
-            parts = re.split(r'[;,]', keywords_str)
+            parts = _KEYWORD_SPLIT_RE.split(keywords_str)
             return [p.strip() for p in parts if p.strip()]
         return []
 
@@ -245,10 +526,14 @@ class MetadataExtractor:
         Look for publication date patterns in text.
         Return a dict with {"year": "...", "month": "...", "day": "..."}
         """
+        return self._pubdate_from_matches(self._scan_bounded(text))
+
+    def _pubdate_from_matches(self, matches: Dict[str, re.Match]) -> Dict[str, str]:
+        """Build the publication date dict from _scan_all results."""
         pubdate = {}
 
         # Try "YYYY-MM-DD"
-        match_iso = re.search(r'(?:Published|Received|Accepted)[:\s]+(\d{4})-(\d{2})-(\d{2})', text)
+        match_iso = matches.get('pubdate_iso')
         if match_iso:
             pubdate["year"] = match_iso.group(1)
             pubdate["month"] = match_iso.group(2)
@@ -256,7 +541,7 @@ class MetadataExtractor:
             return pubdate
 
         # Try "Published on Month DD, YYYY"
-        match_long = re.search(r'(?:Published|Received|Accepted)\s+(?:on\s+)?([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})', text)
+        match_long = matches.get('pubdate_long')
         if match_long:
             pubdate["year"] = match_long.group(3)
             pubdate["month"] = match_long.group(1)  # e.g. "January"
@@ -264,13 +549,9 @@ class MetadataExtractor:
             return pubdate
             
         # Just try to find a year
-        year_match = re.search(r'©\s*(\d{4})|(?:19|20)(\d{2})[^\d]', text)
+        year_match = matches.get('year')
         if year_match:
-            year = year_match.group(1) or year_match.group(2)
-            if year and len(year) == 2:  # Handle 2-digit year
-                prefix = '19' if int(year) > 50 else '20'  # Heuristic: 50+ is 1900s, else 2000s
-                year = prefix + year
-            pubdate["year"] = year
+            pubdate["year"] = year_match.group(1) or year_match.group(2)
             
         return pubdate
 
@@ -278,16 +559,18 @@ class MetadataExtractor:
         """
         Look for DOI pattern in text.
         """
+        return self._doi_from_matches(self._scan_bounded(text))
+
+    def _doi_from_matches(self, matches: Dict[str, re.Match]) -> Optional[str]:
+        """Pick the DOI from _scan_all results, preferring an explicit "doi:" label."""
         # Match DOI in various formats
-        doi_pattern = re.compile(r'(?:doi|DOI)[:\s]*(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)')
-        doi_match = doi_pattern.search(text)
-        
+        doi_match = matches.get('doi')
         if doi_match:
             return doi_match.group(1)
             
         # Try alternative pattern (just the DOI itself)
-        alt_doi_match = re.search(r'(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)', text)
+        alt_doi_match = matches.get('doi_alt')
         if alt_doi_match:
             return alt_doi_match.group(1)
             
-        return None
\ No newline at end of file
+        return None
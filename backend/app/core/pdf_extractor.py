@@ -1,14 +1,287 @@
 import logging
+import multiprocessing
 import os
+import pickle
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tempfile
 import re
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import chain
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from lxml import etree
-import pdfplumber
 from io import BytesIO
 
+from .text_patterns import (
+    DEDUP_PREFIX_CHARS, HEADER_FOOTER_RE, HYPHEN_BREAK_RE, REPEATED_CHAR_RE, compile_linear
+)
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:  # optional: fall back to requests' in-memory multipart body
+    MultipartEncoder = None
+
+# GROBID answers 503 when its worker pool is full and 408 when a request
+# waited too long for a worker; both are worth retrying with backoff.
+_GROBID_RETRY_STATUSES = frozenset({408, 429, 503})
+_GROBID_MAX_RETRIES = 3
+_GROBID_BACKOFF = 0.2
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_PARA_SPLIT_RE = re.compile(r'\n\s*\n')
+# Line boundaries recognised by str.splitlines
+_LINE_BREAKS = '\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+_LINE_BREAK_RE = re.compile(f'[{_LINE_BREAKS}]')
+_NON_SPACE_RE = re.compile(r'\S')
+_YEAR_RE = re.compile(r'(\d{4})')
+
+# Abstracts longer than this many characters are cut to their first sentences
+_ABSTRACT_MAX_CHARS = 1000
+_ABSTRACT_MAX_SENTENCES = 5
+_MONTH_RE = re.compile(r'\d{4}-(\d{2})')
+
+# Common section headings in academic papers, used by the text fallback
+_SECTION_HEADING_RE = re.compile(
+    r'(?:ABSTRACT|INTRODUCTION|(?:MATERIALS\s+AND\s+)?METHODS|RESULTS(?:\s+AND\s+DISCUSSION)?'
+    r'|DISCUSSION|CONCLUSIONS?|ACKNOWLEDGMENTS?|REFERENCES?|BIBLIOGRAPHY)[:\s]*',
+    re.IGNORECASE
+)
+
+
+# Reference list splitting and parsing. These run over arbitrary reference
+# text, so they use RE2 when available (note RE2's \s, \d and \w are ASCII-only)
+_REF_NUMBER_SPLIT_RE = compile_linear(r'\s*(?:\[\d+\]|\d+\.|\(\d+\))\s+')
+_REF_LINE_SPLIT_RE = compile_linear(r'\n\s*(?:\[\d+\]|\d+\.|\(\d+\))\s+')
+_REF_SECTION_RE = compile_linear(r'^(?:REFERENCES|BIBLIOGRAPHY)[:\s]*\n(.*?)(?:\n\s*\n|$)', 'ims')
+_REF_AUTHORS_RE = compile_linear(r'^([A-Z][a-z]+\s+[A-Z](?:\s*,\s*[A-Z][a-z]+\s+[A-Z])*(?:\s*,\s*et al\.)?)')
+_REF_YEAR_RE = compile_linear(r'\((\d{4})\)')
+_REF_JOURNAL_RE = compile_linear(r'([A-Z][A-Za-z\s]+)\.\s+(?:Vol\.?\s*)?(\d+)(?:\((\d+)\))?')
+_REF_PAGES_RE = compile_linear(r'(?::|,)\s*(?:pp?\.)?\s*(\d+(?:-\d+)?)')
+_REF_DOI_RE = compile_linear(r'doi:?\s*(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)', 'i')
+_REF_SCOPE_FIELDS = {'volume': 'volume', 'issue': 'issue', 'page': 'pages'}
+_REF_FIELD_ORDER = ('title', 'journal', 'volume', 'issue', 'pages', 'doi')
+
+# The pdfplumber fallback spreads page text extraction over worker processes
+# for documents at least this long; shorter ones don't repay the pool startup
+_FALLBACK_PARALLEL_MIN_PAGES = 20
+_FALLBACK_PAGES_PER_WORKER = 10
+# One pool per process, created on first use and capped, so concurrent
+# fallbacks queue for workers instead of each spawning a full pool
+_FALLBACK_MAX_WORKERS = min(4, os.cpu_count() or 1)
+_fallback_pool: Optional[ProcessPoolExecutor] = None
+_fallback_pool_lock = threading.Lock()
+
+_TEI_NS = {'tei': 'http://www.tei-c.org/ns/1.0'}
+# Clark-notation prefix for find/findtext/iter, which skip XPath setup
+_TEI = '{http://www.tei-c.org/ns/1.0}'
+_TEI_HEADER = _TEI + 'teiHeader'
+_TEI_TEXT = _TEI + 'text'
+_TEI_PERS_NAME = _TEI + 'persName'
+_TEI_AUTHOR = _TEI + 'author'
+_TEI_AFFILIATION = _TEI + 'affiliation'
+_TEI_DATE = _TEI + 'date'
+_TEI_TITLE = _TEI + 'title'
+_TEI_ANALYTIC = _TEI + 'analytic'
+_TEI_MONOGR = _TEI + 'monogr'
+_TEI_BIBL_SCOPE = _TEI + 'biblScope'
+_TEI_IDNO = _TEI + 'idno'
+_TEI_BIBL_STRUCT = _TEI + 'biblStruct'
+_TEI_TITLE_STMT = _TEI + 'titleStmt'
+_TEI_SOURCE_DESC = _TEI + 'sourceDesc'
+_TEI_DOC_TITLE = _TEI + 'docTitle'
+_TEI_TITLE_PAGE = _TEI + 'titlePage'
+_TEI_FRONT = _TEI + 'front'
+_TEI_ABSTRACT = _TEI + 'abstract'
+_TEI_SURNAME = _TEI + 'surname'
+_TEI_FORENAME = _TEI + 'forename'
+_TEI_EMAIL = _TEI + 'email'
+_TEI_DIV = _TEI + 'div'
+_TEI_HEAD = _TEI + 'head'
+_TEI_P = _TEI + 'p'
+_TEI_FIGURE = _TEI + 'figure'
+_TEI_TABLE = _TEI + 'table'
+_TEI_ROW = _TEI + 'row'
+_TEI_CELL = _TEI + 'cell'
+
+# Title fallback strategies, in priority order: titleStmt title, main title
+# and analytic title in sourceDesc, docTitle in titlePage and in front, and
+# finally the first head of the body
+(_TITLE_SOURCE_STMT, _TITLE_SOURCE_MAIN, _TITLE_SOURCE_ANALYTIC, _TITLE_SOURCE_DOC_TITLE,
+ _TITLE_SOURCE_FRONT, _TITLE_SOURCE_FIRST_HEAD) = range(6)
+_TITLE_SOURCE_COUNT = 6
+_XML_ID = '{http://www.w3.org/XML/1998/namespace}id'
+
+
+def _tei_xpath(path: str) -> etree.XPath:
+    return etree.XPath(path, namespaces=_TEI_NS)
+
+
+def _node_text(node) -> str:
+    """Descendant text of node joined by spaces (same nodes as xpath('.//text()'))."""
+    return " ".join(node.itertext())
+
+
+def _direct_text_nodes(elem) -> List[str]:
+    """Text nodes directly under elem, i.e. elem.xpath('text()')."""
+    texts = [elem.text] if elem.text is not None else []
+    texts.extend(child.tail for child in elem if child.tail is not None)
+    return texts
+
+
+def _outermost(elems) -> list:
+    """Drop elements nested inside another element of the list, so that
+    itertext over the result reads each text node once, like //text()."""
+    members = set(elems)
+    return [el for el in elems if not any(a in members for a in el.iterancestors())]
+
+
+def _title_sources(elem) -> List[int]:
+    """Which _extract_title strategies a _XP_TITLE_NODES match belongs to."""
+    sources = []
+    if elem.tag == _TEI_TITLE:
+        parent_tag = elem.getparent().tag
+        in_source_desc = any(True for _ in elem.iterancestors(_TEI_SOURCE_DESC))
+        if parent_tag == _TEI_TITLE_STMT:
+            sources.append(_TITLE_SOURCE_STMT)
+        if in_source_desc and elem.get('type') == 'main':
+            sources.append(_TITLE_SOURCE_MAIN)
+        if in_source_desc and parent_tag == _TEI_ANALYTIC:
+            sources.append(_TITLE_SOURCE_ANALYTIC)
+    elif elem.tag == _TEI_DOC_TITLE:
+        if any(True for _ in elem.iterancestors(_TEI_TITLE_PAGE)):
+            sources.append(_TITLE_SOURCE_DOC_TITLE)
+        if any(True for _ in elem.iterancestors(_TEI_FRONT)):
+            sources.append(_TITLE_SOURCE_FRONT)
+    else:
+        sources.append(_TITLE_SOURCE_FIRST_HEAD)
+    return sources
+
+
+def _first_text_node(elem) -> Optional[str]:
+    """First text node directly under elem, i.e. elem.xpath('text()')[0], or None."""
+    if elem.text is not None:
+        return elem.text
+    for child in elem:
+        if child.tail is not None:
+            return child.tail
+    return None
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Text of pages [start, stop) of the PDF at pdf_path; runs in a worker process."""
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages[start:stop]]
+
+
+def _get_fallback_pool() -> ProcessPoolExecutor:
+    """The process-wide page extraction pool, created on first call."""
+    global _fallback_pool
+    with _fallback_pool_lock:
+        if _fallback_pool is None:
+            # Spawned rather than forked: the extractor is used from threads
+            _fallback_pool = ProcessPoolExecutor(
+                max_workers=_FALLBACK_MAX_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _fallback_pool
+
+
+def _reset_fallback_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    global _fallback_pool
+    with _fallback_pool_lock:
+        if _fallback_pool is pool:
+            _fallback_pool = None
+    pool.shutdown(wait=False)
+
+
+def _first_nonblank_line(text: str) -> str:
+    """
+    First line of text (as split by str.splitlines) that is not all whitespace,
+    or "" if there is none; found without splitting the whole text.
+    """
+    first_char = _NON_SPACE_RE.search(text)
+    if first_char is None:
+        return ""
+    pos = first_char.start()
+    # Everything before pos is whitespace; the line starts after its last break
+    start = max(text.rfind(brk, 0, pos) for brk in _LINE_BREAKS) + 1
+    end = _LINE_BREAK_RE.search(text, pos)
+    return text[start:end.start() if end else len(text)]
+
+
+def _has_min_paragraphs(sections: List[Dict[str, Any]], n: int) -> bool:
+    """Whether sections hold at least n paragraphs in total; stops counting once they do."""
+    count = 0
+    for section in sections:
+        count += len(section.get('paragraphs', ()))
+        if count >= n:
+            return True
+    return False
+
+
+def _release_subtree(elem) -> None:
+    """Free a fully handled iterparse subtree and any siblings before it."""
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+# TEI XPath expressions, compiled once and reused for every document
+_XP_TITLE_NODES = _tei_xpath(
+    './/tei:titleStmt/tei:title'
+    ' | .//tei:sourceDesc//tei:title[@type="main"]'
+    ' | .//tei:sourceDesc//tei:analytic/tei:title'
+    ' | .//tei:titlePage//tei:docTitle'
+    ' | .//tei:front//tei:docTitle'
+    ' | .//tei:body//tei:head[1]'
+)
+_XP_AUTHOR_CANDIDATES = tuple(_tei_xpath(path) for path in (
+    './/tei:sourceDesc//tei:analytic/tei:author',
+    './/tei:fileDesc//tei:author',
+    './/tei:author'
+))
+_XP_TITLE_STMT = _tei_xpath('.//tei:titleStmt/tei:title/text()')
+_XP_ABSTRACT_NODES = _tei_xpath('.//tei:profileDesc/tei:abstract | .//tei:div[@type="abstract"]')
+_XP_SOURCE_VOLUME = _tei_xpath('.//tei:sourceDesc//tei:biblScope[@unit="volume"]/text()')
+_XP_SOURCE_ISSUE = _tei_xpath('.//tei:sourceDesc//tei:biblScope[@unit="issue"]/text()')
+_XP_SOURCE_FPAGE = _tei_xpath('.//tei:sourceDesc//tei:biblScope[@unit="page"]/@from')
+_XP_SOURCE_LPAGE = _tei_xpath('.//tei:sourceDesc//tei:biblScope[@unit="page"]/@to')
+_XP_SOURCE_DATE = _tei_xpath('.//tei:sourceDesc//tei:date/@when | .//tei:sourceDesc//tei:date/text()')
+_XP_SOURCE_DOI = _tei_xpath('.//tei:sourceDesc//tei:idno[@type="DOI"]/text()')
+_XP_KEYWORD_TERMS = _tei_xpath('.//tei:profileDesc//tei:keywords/tei:term/text()')
+_XP_AFFILIATIONS = _tei_xpath('.//tei:affiliation')
+_XP_BODY_TOP_DIVS = _tei_xpath('.//tei:body//tei:div[not(ancestor::tei:div)]')
+_XP_BODY_PARAGRAPHS = _tei_xpath('.//tei:body//tei:p')
+_XP_BODY_TEXT = _tei_xpath('.//tei:body//text()')
+_XP_BIBL_STRUCTS = _tei_xpath('.//tei:listBibl/tei:biblStruct')
+_XP_REFERENCE_DIVS = _tei_xpath('.//tei:div[@type="references" or @type="bibliography"]')
+_XP_REF_ITEMS = _tei_xpath('.//tei:p | .//tei:item')
+_XP_FIGURE_DESC_TEXT = _tei_xpath('.//tei:figDesc//text()')
+
+# One semaphore per GROBID server, shared by every PDFExtractor pointing at
+# it, so concurrent extractions never exceed the server's worker pool.
+_GROBID_SEMAPHORES: Dict[str, threading.BoundedSemaphore] = {}
+_GROBID_SEMAPHORES_LOCK = threading.Lock()
+
+
+def _grobid_semaphore(grobid_url: str, limit: int) -> threading.BoundedSemaphore:
+    with _GROBID_SEMAPHORES_LOCK:
+        semaphore = _GROBID_SEMAPHORES.get(grobid_url)
+        if semaphore is None:
+            semaphore = _GROBID_SEMAPHORES[grobid_url] = threading.BoundedSemaphore(limit)
+        return semaphore
+
 @dataclass
 class ExtractedContent:
     """Container for extracted PDF content."""
@@ -24,6 +297,9 @@ class ExtractedContent:
     sections: List[Dict[str, Any]] = field(default_factory=list)
     journal_metadata: Dict[str, Any] = field(default_factory=dict)
     original_pdf_path: Optional[str] = None
+    # True when GROBID was unavailable and this is pdfplumber-only (or empty)
+    # content, which callers should not cache
+    from_fallback: bool = False
 
 
 class PDFExtractor:
@@ -33,20 +309,102 @@ class PDFExtractor:
     body sections, and references from academic PDFs.
     """
 
-    def __init__(self, grobid_url: str = "http://localhost:8070", grobid_timeout: int = 120):
+    def __init__(self, grobid_url: str = "http://localhost:8070", grobid_timeout: int = 120,
+                 grobid_concurrency: int = 10, cache_dir: Optional[str] = None):
         """
         Args:
             grobid_url: Base URL of the GROBID service.
             grobid_timeout: Request timeout in seconds.
+            grobid_concurrency: Maximum in-flight requests to this GROBID server;
+                                match it to GROBID's own `concurrency` setting.
+            cache_dir: Optional directory for caching extraction results keyed
+                       by PDF content hash. Disabled when None.
         """
         self.grobid_url = grobid_url
         self.grobid_timeout = grobid_timeout
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._grobid_slots = _grobid_semaphore(grobid_url, grobid_concurrency)
+        self._session = self._create_session()
         self._setup_logging()
 
+    def _create_session(self) -> requests.Session:
+        """
+        Shared HTTP session so GROBID connections are kept alive and reused
+        across extractions. Only connection failures are retried here, since
+        nothing has been uploaded yet; status retries live in _post_to_grobid,
+        which can rewind the PDF before re-sending.
+        """
+        retry = Retry(
+            total=_GROBID_MAX_RETRIES,
+            connect=_GROBID_MAX_RETRIES,
+            read=0,
+            backoff_factor=_GROBID_BACKOFF,
+            allowed_methods=frozenset(['POST'])
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def close(self) -> None:
+        """Close pooled GROBID connections."""
+        self._session.close()
+
+    def __enter__(self) -> 'PDFExtractor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _post_to_grobid(self, url: str, pdf_file, data: Dict[str, Any]) -> requests.Response:
+        """
+        POST a PDF to GROBID, waiting for a free slot on the server first.
+        Busy/timeout responses are retried with exponential backoff.
+
+        Args:
+            url: GROBID endpoint
+            pdf_file: Readable, seekable binary file object holding the PDF, or
+                None to send the form fields on their own
+            data: Form fields sent alongside the PDF
+        """
+        start = pdf_file.tell() if pdf_file is not None else None
+        for attempt in range(_GROBID_MAX_RETRIES + 1):
+            if pdf_file is not None:
+                pdf_file.seek(start)
+                body = self._multipart_body(pdf_file, data)
+            else:
+                body = {'data': data}
+            with self._grobid_slots:
+                response = self._session.post(url, timeout=self.grobid_timeout, **body)
+            if response.status_code not in _GROBID_RETRY_STATUSES or attempt == _GROBID_MAX_RETRIES:
+                return response
+            delay = _GROBID_BACKOFF * (2 ** attempt)
+            self.logger.warning(f"GROBID returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+    def _multipart_body(self, pdf_file, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the request body. With requests_toolbelt installed the PDF is
+        streamed from the file object in chunks instead of being buffered.
+        """
+        if MultipartEncoder is None:
+            return {'files': {'input': pdf_file}, 'data': data}
+
+        filename = os.path.basename(getattr(pdf_file, 'name', '') or 'input.pdf')
+        fields = [('input', (filename, pdf_file, 'application/pdf'))]
+        for key, value in data.items():
+            for item in (value if isinstance(value, list) else [value]):
+                fields.append((key, item))
+        encoder = MultipartEncoder(fields=fields)
+        return {'data': encoder, 'headers': {'Content-Type': encoder.content_type}}
+
     def _setup_logging(self):
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
-        if not self.logger.handlers:
+        if not self.logger.hasHandlers():
             ch = logging.StreamHandler()
             ch.setFormatter(logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -82,46 +440,109 @@ class PDFExtractor:
             # Fallback to basic extraction if GROBID fails
             return self._fallback_extraction(pdf_path)
 
+    def extract_batch(self, pdf_paths: List[str], max_workers: int = 10) -> List[ExtractedContent]:
+        """
+        Extract many PDFs concurrently. Each extraction is dominated by the
+        GROBID HTTP call, so threads give near-linear speedup up to the
+        server's concurrency limit.
+
+        Args:
+            pdf_paths: Paths of the PDF files to extract
+            max_workers: Thread pool size, normally GROBID's `concurrency` setting
+
+        Returns:
+            ExtractedContent objects in the same order as pdf_paths
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.extract, pdf_paths))
+
     def _extract_with_merge(self, pdf_path: str) -> ExtractedContent:
         """
         Enhanced extraction that merges GROBID structured data with fallback
         extraction to ensure completeness.
         """
-        # 1. First get fallback extraction (we'll always need this)
-        fallback_content = self._fallback_extraction(pdf_path)
+        # Read the PDF once; every consumer below gets its own in-memory view
+        with open(pdf_path, 'rb') as pdf_file:
+            pdf_bytes = pdf_file.read()
+
+        # Identical PDF content was already extracted: reuse the stored result
+        cache_path = self._cache_path(pdf_bytes)
+        cached_content = self._load_cached(cache_path)
+        if cached_content is not None:
+            return cached_content
+
+        # 1. Fallback extraction is slow, so it only runs (once) if something needs it
+        @lru_cache(maxsize=None)
+        def load_fallback() -> ExtractedContent:
+            return self._fallback_extraction(BytesIO(pdf_bytes))
         
         # 2. Try GROBID extraction
-        tei_xml = self._process_fulltext(pdf_path)
+        tei_xml = self._process_fulltext(pdf_bytes)
         if not tei_xml:
             self.logger.warning("GROBID extraction failed, using fallback only")
-            return fallback_content
+            return load_fallback()
         
         # 3. Parse GROBID TEI into structured content
         grobid_content = self._parse_tei(tei_xml)
         
-        # 4. Enhance GROBID's header with dedicated header processing if needed
-        if not grobid_content.title or not grobid_content.authors:
-            self.logger.info("Title or authors missing, trying dedicated header processing")
-            self._enhance_with_header_processing(pdf_path, grobid_content)
+        # 4. Fall back to dedicated header processing only when the fulltext
+        #    TEI was unusable; fulltext already runs the consolidated header model
+        if not grobid_content.raw_text and (not grobid_content.title or not grobid_content.authors):
+            self.logger.info("Fulltext TEI empty, trying dedicated header processing")
+            self._enhance_with_header_processing(pdf_bytes, grobid_content)
         
         # 5. Merge GROBID and fallback content to ensure completeness
-        merged_content = self._merge_extractions(grobid_content, fallback_content)
+        merged_content = self._merge_extractions(grobid_content, load_fallback)
         
         # 6. Final post-processing to clean and normalize content
         final_content = self._post_process(merged_content)
         
+        # 7. Cache GROBID-backed results only, so a GROBID outage is not persisted
+        self._store_cached(cache_path, final_content)
+        
         return final_content
 
-    def _process_fulltext(self, pdf_path: str) -> Optional[str]:
+    def _cache_path(self, pdf_bytes: bytes) -> Optional[str]:
+        """Cache file for this PDF content, or None when caching is disabled."""
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{blake2b(pdf_bytes).hexdigest()}.pkl")
+
+    def _load_cached(self, cache_path: Optional[str]) -> Optional[ExtractedContent]:
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                content = pickle.load(cache_file)
+            self.logger.info(f"Using cached extraction {cache_path}")
+            return content
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable extraction cache {cache_path}: {e}")
+            return None
+
+    def _store_cached(self, cache_path: Optional[str], content: ExtractedContent) -> None:
+        if not cache_path:
+            return
+        # Write to a temp file and rename so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as cache_file:
+                pickle.dump(content, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to write extraction cache {cache_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _process_fulltext(self, pdf_bytes: bytes) -> Optional[bytes]:
         """
         Send the PDF to GROBID's /api/processFulltextDocument endpoint.
-        Returns the TEI XML as a string.
+        Returns the raw TEI XML bytes, left undecoded for lxml.
         """
         url = f"{self.grobid_url}/api/processFulltextDocument"
         
         try:
-            with open(pdf_path, 'rb') as pdf_file:
-                files = {'input': pdf_file}
+            with BytesIO(pdf_bytes) as pdf_file:
                 # Enhanced GROBID parameters for better extraction
                 data = {
                     'consolidateHeader': '1',       # Add header consolidation
@@ -136,27 +557,50 @@ class PDFExtractor:
                 }
 
                 self.logger.info(f"Sending PDF to GROBID at {url} with enhanced parameters")
-                response = requests.post(
-                    url,
-                    files=files,
-                    data=data,
-                    timeout=self.grobid_timeout
-                )
+                response = self._post_to_grobid(url, pdf_file, data)
                 
                 if response.status_code != 200:
                     self.logger.error(f"GROBID request failed with status {response.status_code}: {response.text}")
                     return None
                     
                 # Log the first 500 chars of TEI to aid debugging
-                tei_text = response.text
-                self.logger.debug(f"Received TEI response (first 500 chars): {tei_text[:500]}...")
-                return tei_text
+                tei_xml = response.content
+                self.logger.debug(
+                    f"Received TEI response (first 500 bytes): {tei_xml[:500].decode('utf-8', 'replace')}..."
+                )
+                return tei_xml
                 
         except Exception as e:
             self.logger.error(f"GROBID request failed: {e}", exc_info=True)
             return None
 
-    def _enhance_with_header_processing(self, pdf_path: str, content: ExtractedContent) -> None:
+    def _process_citation_list(self, citations: List[str]) -> Optional[bytes]:
+        """
+        Send raw citation strings to GROBID's /api/processCitationList endpoint
+        in a single request. Returns the raw TEI XML bytes.
+        """
+        url = f"{self.grobid_url}/api/processCitationList"
+        
+        try:
+            data = {
+                'citations': citations,
+                'consolidateCitations': '0'
+            }
+            
+            self.logger.info(f"Sending {len(citations)} raw citations to GROBID at {url}")
+            response = self._post_to_grobid(url, None, data)
+            
+            if response.status_code != 200:
+                self.logger.warning(f"Citation list request failed: {response.status_code}")
+                return None
+            
+            return response.content
+            
+        except Exception as e:
+            self.logger.warning(f"Citation list request failed: {e}")
+            return None
+
+    def _enhance_with_header_processing(self, pdf_bytes: bytes, content: ExtractedContent) -> None:
         """
         Enhance extraction with dedicated header processing.
         This can improve title, authors, and affiliations extraction.
@@ -164,87 +608,92 @@ class PDFExtractor:
         url = f"{self.grobid_url}/api/processHeaderDocument"
         
         try:
-            with open(pdf_path, 'rb') as pdf_file:
-                files = {'input': pdf_file}
+            with BytesIO(pdf_bytes) as pdf_file:
                 data = {'consolidateHeader': '1'}
                 
                 self.logger.info(f"Sending PDF for dedicated header processing")
-                response = requests.post(url, files=files, data=data, timeout=self.grobid_timeout)
+                response = self._post_to_grobid(url, pdf_file, data)
                 
                 if response.status_code != 200:
                     self.logger.warning(f"Header processing request failed: {response.status_code}")
                     return
                 
                 # Parse the header TEI
-                header_xml = response.text
-                header_root = etree.fromstring(header_xml.encode('utf-8'))
-                ns = {'tei': 'http://www.tei-c.org/ns/1.0'}
+                header_root = etree.fromstring(response.content)
+                tei_header = header_root.find(_TEI_HEADER)
+                if tei_header is None:
+                    tei_header = header_root
                 
                 # Extract title if missing
                 if not content.title:
-                    title_els = header_root.xpath('.//tei:titleStmt/tei:title/text()', namespaces=ns)
+                    title_els = _XP_TITLE_STMT(header_root)
                     if title_els:
                         content.title = title_els[0].strip()
                 
                 # Extract authors if missing
                 if not content.authors:
-                    content.authors = self._extract_authors(header_root, ns)
+                    content.authors = self._extract_authors(tei_header)
                 
         except Exception as e:
             self.logger.error(f"Header processing failed: {e}", exc_info=True)
 
-    def _parse_tei(self, tei_xml: str) -> ExtractedContent:
+    def _parse_tei(self, tei_xml: bytes) -> ExtractedContent:
         """
         Parse TEI XML from GROBID into structured ExtractedContent.
         Enhanced to handle nested divs and capture more text.
+
+        Args:
+            tei_xml: TEI document as bytes (a str is encoded to UTF-8 first)
         """
-        try:
-            root = etree.fromstring(tei_xml.encode("utf-8"))
-        except Exception as e:
-            self.logger.error(f"Failed to parse TEI XML: {e}", exc_info=True)
-            return ExtractedContent(raw_text="")
+        if isinstance(tei_xml, str):
+            tei_xml = tei_xml.encode('utf-8')
 
-        ns = {'tei': 'http://www.tei-c.org/ns/1.0'}
+        title = None
+        abstract = None
+        journal_metadata: Dict[str, Any] = {}
+        authors: List[Dict[str, Any]] = []
+        sections: List[Dict[str, Any]] = []
+        raw_text_chunks: List[str] = []
+        references: List[Dict[str, Any]] = []
+        figures: List[Dict[str, Any]] = []
+        tables: List[Dict[str, Any]] = []
 
-        # Extract title with fallbacks for different TEI structures
-        title = self._extract_title(root, ns)
+        # Stream the TEI: the header and the text are each handled as soon as
+        # they are complete and then freed, so the whole DOM is never held at once
+        try:
+            for _, elem in etree.iterparse(BytesIO(tei_xml), events=('end',),
+                                           tag=(_TEI_HEADER, _TEI_TEXT)):
+                if elem.tag == _TEI_HEADER:
+                    # Title, abstract, journal metadata and authors live in the header
+                    title = self._extract_title(elem)
+                    abstract = self._extract_abstract(elem)
+                    journal_metadata = self._extract_journal_metadata(elem)
+                    authors = self._extract_authors(elem)
+                else:
+                    # Title/abstract fallbacks (docTitle, first head, abstract div)
+                    # are found in the text
+                    if title is None:
+                        title = self._extract_title(elem)
+                    if abstract is None:
+                        abstract = self._extract_abstract(elem)
 
-        # Extract abstract
-        abstract = self._extract_abstract(root, ns)
+                    # Body sections - improved to handle nested divs
+                    sections, raw_text_chunks = self._extract_sections(elem)
+                    references = self._extract_references(elem)
+                    figures, tables = self._extract_figures_and_tables(elem)
+
+                _release_subtree(elem)
+        except etree.XMLSyntaxError as e:
+            self.logger.error(f"Failed to parse TEI XML: {e}", exc_info=True)
+            return ExtractedContent(raw_text="")
 
-        # Extract journal metadata
-        journal_metadata = self._extract_journal_metadata(root, ns)
-        
         # Force JCAD journal information regardless of extraction
         journal_metadata['journal_id'] = 'JCAD'
         journal_metadata['journal_title'] = 'The Journal of Clinical and Aesthetic Dermatology'
         journal_metadata['issn'] = '1941-2789'
         journal_metadata['publisher'] = 'Matrix Medical Communications'
 
-        # Extract authors with affiliations
-        authors = self._extract_authors(root, ns)
-
-        # Extract body text as sections - improved to handle nested divs
-        sections = self._extract_sections(root, ns)
-        
-        # Combine all section texts for raw_text
-        all_paragraphs = []
-        for section in sections:
-            if 'title' in section and section['title']:
-                all_paragraphs.append(section['title'])
-            for p in section.get('paragraphs', []):
-                all_paragraphs.append(p)
-        
-        raw_text = "\n\n".join(all_paragraphs)
-
-        # Extract references
-        references = self._extract_references(root, ns)
-
-        # Extract figures if available
-        figures = self._extract_figures(root, ns)
-        
-        # Extract tables if available
-        tables = self._extract_tables(root, ns)
+        raw_text = "\n\n".join(raw_text_chunks)
 
         # Create ExtractedContent
         extracted = ExtractedContent(
@@ -262,64 +711,94 @@ class PDFExtractor:
 
         return extracted
 
-    def _extract_title(self, root, ns) -> Optional[str]:
+    def _extract_title(self, part) -> Optional[str]:
         """Extract title with multiple fallback strategies"""
-        # Try different XPaths for title
-        title_paths = [
-            './/tei:titleStmt/tei:title/text()',
-            './/tei:sourceDesc//tei:title[@type="main"]/text()',
-            './/tei:titlePage//tei:docTitle//text()',
-            './/tei:front//tei:docTitle//text()'
-        ]
-        
-        for path in title_paths:
-            title_els = root.xpath(path, namespaces=ns)
-            if title_els:
-                title_text = " ".join([t.strip() for t in title_els if t.strip()])
-                if title_text:
-                    # Clean up title - remove line breaks, extra spaces
-                    title_text = re.sub(r'\s+', ' ', title_text).strip()
-                    return title_text
+        # Find every candidate title element in one query, then sort them into
+        # the fallback strategies they belong to (in priority order)
+        candidates = [[] for _ in range(_TITLE_SOURCE_COUNT)]
+        for elem in _XP_TITLE_NODES(part):
+            for source in _title_sources(elem):
+                candidates[source].append(elem)
+        
+        # Try the title strategies in order
+        for source in range(_TITLE_SOURCE_FIRST_HEAD):
+            if source < _TITLE_SOURCE_DOC_TITLE:
+                title_els = [t for el in candidates[source] for t in _direct_text_nodes(el)]
+            else:
+                title_els = [t for el in _outermost(candidates[source]) for t in el.itertext()]
+            title_text = " ".join([t.strip() for t in title_els if t.strip()])
+            if title_text:
+                # Clean up title - remove line breaks, extra spaces
+                title_text = " ".join(title_text.split())
+                return title_text
         
         # Look for title in first heading of body
-        first_head = root.xpath('.//tei:body//tei:head[1]//text()', namespaces=ns)
+        first_head = [
+            t for el in _outermost(candidates[_TITLE_SOURCE_FIRST_HEAD]) for t in el.itertext()
+        ]
         if first_head:
             title_text = " ".join([t.strip() for t in first_head if t.strip()])
             return title_text
             
         return None
 
-    def _extract_abstract(self, root, ns) -> Optional[str]:
+    def _extract_abstract(self, part) -> Optional[str]:
         """Extract abstract with better text handling"""
-        # Find abstract div or section
-        abstract_els = root.xpath('.//tei:profileDesc/tei:abstract//text()', namespaces=ns)
+        # Find the profileDesc abstract and any abstract divs in one query
+        abstract_nodes = _XP_ABSTRACT_NODES(part)
+        alt_abstract_nodes = [el for el in abstract_nodes if el.tag != _TEI_ABSTRACT]
+        
+        # Stream the profileDesc abstract's text nodes
+        text_nodes = chain.from_iterable(
+            el.itertext() for el in abstract_nodes if el.tag == _TEI_ABSTRACT
+        )
         
-        if abstract_els:
-            # Join all text, normalize whitespace
-            abstract_text = " ".join([t.strip() for t in abstract_els if t.strip()])
-            abstract_text = re.sub(r'\s+', ' ', abstract_text).strip()
+        seen_text = False
+        chunks = []
+        length = 0
+        boundaries = 0
+        for node_text in text_nodes:
+            seen_text = True
+            # Normalize whitespace per node; nodes are joined by single spaces
+            chunk = " ".join(node_text.split())
+            if not chunk:
+                continue
+            if chunks:
+                length += 1
+                if chunks[-1][-1] in '.!?':
+                    boundaries += 1
+            chunks.append(chunk)
+            length += len(chunk)
+            boundaries += len(_SENTENCE_SPLIT_RE.findall(chunk))
+            # Past the length cap with more than the allowed sentences, the
+            # truncated result cannot change, so stop reading
+            if length > _ABSTRACT_MAX_CHARS and boundaries >= _ABSTRACT_MAX_SENTENCES:
+                break
+        
+        if seen_text:
+            abstract_text = " ".join(chunks)
             
             # If abstract is very long, it might include non-abstract content
             # Limit to reasonable length (e.g., 1000 chars)
-            if len(abstract_text) > 1000:
-                sentences = re.split(r'(?<=[.!?])\s+', abstract_text)
-                if len(sentences) > 5:
+            if len(abstract_text) > _ABSTRACT_MAX_CHARS:
+                sentences = _SENTENCE_SPLIT_RE.split(abstract_text)
+                if len(sentences) > _ABSTRACT_MAX_SENTENCES:
                     # Take first 5 sentences or first 1000 chars, whichever is shorter
-                    abstract_text = " ".join(sentences[:5])
-                    if len(abstract_text) > 1000:
-                        abstract_text = abstract_text[:997] + "..."
+                    abstract_text = " ".join(sentences[:_ABSTRACT_MAX_SENTENCES])
+                    if len(abstract_text) > _ABSTRACT_MAX_CHARS:
+                        abstract_text = abstract_text[:_ABSTRACT_MAX_CHARS - 3] + "..."
             
             return abstract_text
         
         # Try alternate abstract locations
-        alt_abstract = root.xpath('.//tei:div[@type="abstract"]//text()', namespaces=ns)
+        alt_abstract = [t for el in _outermost(alt_abstract_nodes) for t in el.itertext()]
         if alt_abstract:
             abstract_text = " ".join([t.strip() for t in alt_abstract if t.strip()])
-            return re.sub(r'\s+', ' ', abstract_text).strip()
+            return " ".join(abstract_text.split())
             
         return None
 
-    def _extract_journal_metadata(self, root, ns) -> Dict[str, Any]:
+    def _extract_journal_metadata(self, header) -> Dict[str, Any]:
         """Extract journal metadata from TEI with improved paths"""
         metadata = {}
         
@@ -330,93 +809,101 @@ class PDFExtractor:
         metadata['publisher'] = 'Matrix Medical Communications'
         
         # Extract volume, issue, pages if available
-        volume = root.xpath('.//tei:sourceDesc//tei:biblScope[@unit="volume"]/text()', namespaces=ns)
+        volume = _XP_SOURCE_VOLUME(header)
         if volume:
             metadata['volume'] = volume[0].strip()
             
-        issue = root.xpath('.//tei:sourceDesc//tei:biblScope[@unit="issue"]/text()', namespaces=ns)
+        issue = _XP_SOURCE_ISSUE(header)
         if issue:
             metadata['issue'] = issue[0].strip()
             
-        fpage = root.xpath('.//tei:sourceDesc//tei:biblScope[@unit="page"]/@from', namespaces=ns)
+        fpage = _XP_SOURCE_FPAGE(header)
         if fpage:
             metadata['fpage'] = fpage[0].strip()
             
-        lpage = root.xpath('.//tei:sourceDesc//tei:biblScope[@unit="page"]/@to', namespaces=ns)
+        lpage = _XP_SOURCE_LPAGE(header)
         if lpage:
             metadata['lpage'] = lpage[0].strip()
         
         # Publication date
         pub_date = {}
-        year = root.xpath('.//tei:sourceDesc//tei:date/@when | .//tei:sourceDesc//tei:date/text()', namespaces=ns)
+        year = _XP_SOURCE_DATE(header)
         if year:
             year_text = year[0].strip()
             # Extract year from date format (e.g., 2024-01-15)
-            year_match = re.search(r'(\d{4})', year_text)
+            year_match = _YEAR_RE.search(year_text)
             if year_match:
                 pub_date['year'] = year_match.group(1)
                 
                 # Try to extract month if available
-                month_match = re.search(r'\d{4}-(\d{2})', year_text)
+                month_match = _MONTH_RE.search(year_text)
                 if month_match:
                     pub_date['month'] = month_match.group(1)
                 
         if pub_date:
             metadata['pub_date'] = pub_date
         
+        # Article DOI and author keywords, so MetadataExtractor can skip its regex scan
+        doi = _XP_SOURCE_DOI(header)
+        if doi:
+            metadata['doi'] = doi[0].strip()
+        
+        keywords = _XP_KEYWORD_TERMS(header)
+        keywords = [k.strip() for k in keywords if k.strip()]
+        if keywords:
+            metadata['keywords'] = keywords
+        
         return metadata
 
-    def _extract_authors(self, root, ns) -> List[Dict[str, Any]]:
+    def _extract_authors(self, header) -> List[Dict[str, Any]]:
         """Extract author information with affiliations - improved with better paths"""
         authors = []
         
         # Find all author nodes - multiple paths for robustness
-        author_paths = [
-            './/tei:sourceDesc//tei:analytic/tei:author',
-            './/tei:fileDesc//tei:author',
-            './/tei:teiHeader//tei:author'
-        ]
-        
         author_nodes = []
-        for path in author_paths:
-            nodes = root.xpath(path, namespaces=ns)
+        for author_xpath in _XP_AUTHOR_CANDIDATES:
+            nodes = author_xpath(header)
             if nodes:
                 author_nodes.extend(nodes)
                 break  # Use first successful path
         
         # Get all affiliations to reference later
         all_affiliations = {}
-        affiliation_nodes = root.xpath('.//tei:teiHeader//tei:affiliation', namespaces=ns)
+        affiliation_nodes = _XP_AFFILIATIONS(header)
         for aff in affiliation_nodes:
-            aff_id = aff.get('{http://www.w3.org/XML/1998/namespace}id')
+            aff_id = aff.get(_XML_ID)
             if aff_id:
-                aff_text = " ".join(aff.xpath('.//text()'))
-                all_affiliations[aff_id] = aff_text.strip()
+                aff_text = _node_text(aff)
+                all_affiliations[aff_id] = sys.intern(aff_text.strip())
         
         for i, author_node in enumerate(author_nodes):
             author_data = {
                 'surname': '',
                 'given_names': '',
+                'email': None,
                 'affiliations': [],
                 'is_corresponding': False
             }
             
             # Get name components
-            pers_name = author_node.find('.//tei:persName', namespaces=ns)
+            pers_name = author_node.find(f'.//{_TEI_PERS_NAME}')
             if pers_name is not None:
-                surname = pers_name.findtext('tei:surname', default="", namespaces=ns)
-                forename = pers_name.findtext('tei:forename', default="", namespaces=ns)
+                surname = pers_name.findtext(_TEI_SURNAME, default="")
+                forename = pers_name.findtext(_TEI_FORENAME, default="")
                 
                 author_data['surname'] = surname.strip()
                 author_data['given_names'] = forename.strip()
                 
                 # Check for possible middle names in additional forenames
-                middle_names = pers_name.xpath('.//tei:forename[@type="middle"]/text()', namespaces=ns)
+                middle_names = [
+                    t for fn in pers_name.iter(_TEI_FORENAME) if fn.get('type') == 'middle'
+                    for t in _direct_text_nodes(fn)
+                ]
                 if middle_names:
                     author_data['given_names'] += " " + " ".join([m.strip() for m in middle_names])
             else:
                 # If no structured name, try to get raw author name
-                raw_name = author_node.xpath('.//text()')
+                raw_name = list(author_node.itertext())
                 if raw_name:
                     name_text = " ".join([t.strip() for t in raw_name if t.strip()])
                     name_parts = name_text.split(',', 1)
@@ -431,26 +918,32 @@ class PDFExtractor:
                         else:
                             author_data['surname'] = name_text
             
-            # Get affiliations
+            # Get affiliations in one pass: the text of each affiliation node,
+            # then the header affiliations its key refers to, without repeats
             affiliations = []
+            seen_affiliations = set()
+            aff_refs = []
+            for aff in author_node.iter(_TEI_AFFILIATION):
+                aff_text = sys.intern(_node_text(aff).strip())
+                if aff_text and aff_text not in seen_affiliations:
+                    seen_affiliations.add(aff_text)
+                    affiliations.append(aff_text)
+                aff_key = aff.get('key')
+                if aff_key is not None:
+                    aff_refs.append(aff_key)
             
-            # Method 1: Direct affiliation nodes
-            aff_nodes = author_node.xpath('.//tei:affiliation', namespaces=ns)
-            for aff in aff_nodes:
-                aff_text = " ".join(aff.xpath('.//text()'))
-                if aff_text.strip():
-                    affiliations.append(aff_text.strip())
-            
-            # Method 2: Affiliation references
-            aff_refs = author_node.xpath('.//tei:affiliation/@key', namespaces=ns)
             for ref in aff_refs:
-                if ref in all_affiliations:
-                    affiliations.append(all_affiliations[ref])
+                aff_text = all_affiliations.get(ref)
+                if aff_text is not None and aff_text not in seen_affiliations:
+                    seen_affiliations.add(aff_text)
+                    affiliations.append(aff_text)
             
             # Get email if available
-            email = author_node.xpath('.//tei:email/text()', namespaces=ns)
-            if email:
-                author_data['email'] = email[0].strip()
+            email = next(
+                (t for el in author_node.iter(_TEI_EMAIL) for t in _direct_text_nodes(el)), None
+            )
+            if email is not None:
+                author_data['email'] = email.strip()
             
             # Check if this is corresponding author
             is_corresp = author_node.get('role') == 'corresp'
@@ -465,25 +958,29 @@ class PDFExtractor:
         
         return authors
 
-    def _extract_sections(self, root, ns) -> List[Dict[str, Any]]:
+    def _extract_sections(self, text) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Extract body text as structured sections.
         Improved to handle nested divs, multiple section types.
+
+        Returns:
+            (sections, chunks) where chunks are the non-empty section titles
+            and paragraphs in order, ready to be joined into raw_text.
         """
         sections = []
+        chunks = []
         
-        # Find all body divisions (sections) - handle nested divs
-        div_nodes = root.xpath('.//tei:body//tei:div', namespaces=ns)
+        # Find the outermost body divisions; nested divs are visited from their parent
+        div_nodes = _XP_BODY_TOP_DIVS(text)
         
         # If no divs found, try other containers
         if not div_nodes:
-            div_nodes = root.xpath('.//tei:body//tei:p', namespaces=ns)
+            div_nodes = _XP_BODY_PARAGRAPHS(text)
             if div_nodes:
                 # Create a single section with all paragraphs
                 paragraphs = []
                 for p in div_nodes:
-                    p_text = " ".join(p.xpath('.//text()'))
-                    p_text = re.sub(r'\s+', ' ', p_text).strip()
+                    p_text = " ".join(_node_text(p).split())
                     if p_text:
                         paragraphs.append(p_text)
                 
@@ -492,55 +989,20 @@ class PDFExtractor:
                         'title': '',
                         'paragraphs': paragraphs
                     })
-                return sections
-        
-        # Process each div as a section
-        processed_divs = set()  # Track processed divs to avoid duplicates
+                    chunks.extend(paragraphs)
+                return sections, chunks
         
+        # Process each div as a section, followed by its nested divs
         for div in div_nodes:
-            # Skip if already processed (can happen with nested divs)
-            div_id = div.get('{http://www.w3.org/XML/1998/namespace}id', '')
-            if div_id in processed_divs:
-                continue
-                
-            processed_divs.add(div_id)
-            
-            section = {}
-            
-            # Extract section title/heading
-            head = div.find('.//tei:head', namespaces=ns)
-            if head is not None:
-                section['title'] = " ".join(head.xpath('.//text()')).strip()
-                section['title'] = re.sub(r'\s+', ' ', section['title'])
-            else:
-                section['title'] = ""
-            
-            # Extract paragraphs directly under this div (not in nested divs)
-            paragraphs = []
-            p_nodes = div.xpath('./tei:p', namespaces=ns)
-            
-            for p in p_nodes:
-                # Get all text, including text inside formula, ref, etc.
-                p_text = " ".join(p.xpath('.//text()'))
-                p_text = re.sub(r'\s+', ' ', p_text).strip()
-                
-                if p_text:
-                    paragraphs.append(p_text)
-            
-            section['paragraphs'] = paragraphs
-            
-            # Add section if it has content
-            if section['title'] or paragraphs:
-                sections.append(section)
+            self._append_div_sections(div, sections, chunks)
         
         # If no structured sections were found, create a single section with all paragraphs
         if not sections:
             all_paragraphs = []
-            p_nodes = root.xpath('.//tei:body//tei:p', namespaces=ns)
+            p_nodes = _XP_BODY_PARAGRAPHS(text)
             
             for p in p_nodes:
-                p_text = " ".join(p.xpath('.//text()')).strip()
-                p_text = re.sub(r'\s+', ' ', p_text)
+                p_text = " ".join(_node_text(p).split())
                 if p_text:
                     all_paragraphs.append(p_text)
             
@@ -549,37 +1011,59 @@ class PDFExtractor:
                     'title': "BODY",
                     'paragraphs': all_paragraphs
                 })
+                chunks.append("BODY")
+                chunks.extend(all_paragraphs)
         
         # Detect section boundaries from all text if sections look incomplete
-        body_text = " ".join(root.xpath('.//tei:body//text()', namespaces=ns))
-        if body_text and not sections:
-            sections = self._extract_sections_from_text(body_text)
+        if not sections:
+            body_text = " ".join(_XP_BODY_TEXT(text))
+            if body_text:
+                sections = self._extract_sections_from_text(body_text)
+                for section in sections:
+                    if section['title']:
+                        chunks.append(section['title'])
+                    chunks.extend(section['paragraphs'])
                 
-        return sections
+        return sections, chunks
+
+    def _append_div_sections(self, div, sections: List[Dict[str, Any]], chunks: List[str]) -> None:
+        """Append div as a section, then recurse into its nested divs in document order."""
+        section = {}
+        
+        # Extract section title/heading (the div's own head, not a nested one)
+        head = div.find(_TEI_HEAD)
+        if head is not None:
+            # Interned: the same headings recur across every document in a batch
+            section['title'] = sys.intern(" ".join(_node_text(head).split()))
+        else:
+            section['title'] = ""
+        
+        # Extract paragraphs directly under this div (not in nested divs)
+        paragraphs = []
+        for p in div.iterchildren(_TEI_P):
+            # Get all text, including text inside formula, ref, etc.
+            p_text = " ".join(_node_text(p).split())
+            if p_text:
+                paragraphs.append(p_text)
+        
+        section['paragraphs'] = paragraphs
+        
+        # Add section if it has content
+        if section['title'] or paragraphs:
+            sections.append(section)
+            if section['title']:
+                chunks.append(section['title'])
+            chunks.extend(paragraphs)
+        
+        for child_div in div.iterchildren(_TEI_DIV):
+            self._append_div_sections(child_div, sections, chunks)
 
     def _extract_sections_from_text(self, text: str) -> List[Dict[str, Any]]:
         """Fallback method to extract sections from raw text"""
         sections = []
         
-        # Common section headings in academic papers
-        section_patterns = [
-            r'ABSTRACT[:\s]*',
-            r'INTRODUCTION[:\s]*',
-            r'(?:MATERIALS\s+AND\s+)?METHODS[:\s]*',
-            r'RESULTS(?:\s+AND\s+DISCUSSION)?[:\s]*',
-            r'DISCUSSION[:\s]*',
-            r'CONCLUSION[S]?[:\s]*',
-            r'ACKNOWLEDGMENT[S]?[:\s]*',
-            r'REFERENCE[S]?[:\s]*',
-            r'BIBLIOGRAPHY[:\s]*'
-        ]
-        
-        # Create regex pattern to find all section headings
-        pattern = '|'.join(f'({p})' for p in section_patterns)
-        section_regex = re.compile(pattern, re.IGNORECASE)
-        
         # Find all section matches
-        matches = list(section_regex.finditer(text))
+        matches = list(_SECTION_HEADING_RE.finditer(text))
         
         # If no sections found, return text as one section
         if not matches:
@@ -589,18 +1073,15 @@ class PDFExtractor:
             }]
             
         # Extract each section
-        for i, match in enumerate(matches):
-            title = match.group(0).strip()
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            title = sys.intern(match.group(0).strip())
             
             # Get section content (from this match to next match or end)
-            start_pos = match.end()
-            end_pos = matches[i+1].start() if i < len(matches)-1 else len(text)
-            
-            section_text = text[start_pos:end_pos].strip()
+            end_pos = next_match.start() if next_match is not None else len(text)
+            section_text = text[match.end():end_pos].strip()
             
             # Split into paragraphs
-            paragraphs = re.split(r'\n\s*\n', section_text)
-            paragraphs = [p.strip() for p in paragraphs if p.strip()]
+            paragraphs = [p for p in map(str.strip, _PARA_SPLIT_RE.split(section_text)) if p]
             
             # Add section
             sections.append({
@@ -610,115 +1091,154 @@ class PDFExtractor:
             
         return sections
 
-    def _extract_references(self, root, ns) -> List[Dict[str, Any]]:
+    def _extract_references(self, text) -> List[Dict[str, Any]]:
         """Extract references from TEI with improved parsing"""
         references = []
         
         # Find all reference nodes
-        ref_nodes = root.xpath('.//tei:listBibl/tei:biblStruct', namespaces=ns)
+        ref_nodes = _XP_BIBL_STRUCTS(text)
         
         # If no structured references, try to find raw reference list
         if not ref_nodes:
-            ref_div = root.xpath('.//tei:div[@type="references" or @type="bibliography"]', namespaces=ns)
+            ref_div = _XP_REFERENCE_DIVS(text)
             if ref_div:
-                return self._extract_references_from_div(ref_div[0], ns)
+                return self._extract_references_from_div(ref_div[0])
         
         for i, ref in enumerate(ref_nodes, 1):
-            ref_data = {'ref_id': str(i)}
-            
             # Get raw text for full reference
-            ref_text = " ".join(ref.xpath('.//text()')).strip()
-            ref_text = re.sub(r'\s+', ' ', ref_text)  # Normalize whitespace
-            ref_data['raw_text'] = ref_text
-            
-            # Get authors
-            authors = []
-            author_nodes = ref.xpath('.//tei:author/tei:persName', namespaces=ns)
-            
-            for author in author_nodes:
-                surname = author.findtext('.//tei:surname', default="", namespaces=ns).strip()
-                forename = author.findtext('.//tei:forename', default="", namespaces=ns).strip()
-                
-                if surname or forename:
-                    authors.append(f"{surname}, {forename}")
-            
-            ref_data['authors'] = authors
-            
-            # Get year
-            year = ref.xpath('.//tei:date/@when', namespaces=ns)
-            if not year:
-                year = ref.xpath('.//tei:date/text()', namespaces=ns)
-            
-            if year:
-                year_text = year[0].strip()
-                # Extract year from date format
-                year_match = re.search(r'(\d{4})', year_text)
-                if year_match:
-                    ref_data['year'] = year_match.group(1)
-            
-            # Get title
-            title = ref.xpath('.//tei:analytic/tei:title/text()', namespaces=ns)
-            if title:
-                ref_data['title'] = title[0].strip()
-            
-            # Get journal/source
-            journal = ref.xpath('.//tei:monogr/tei:title[@level="j"]/text()', namespaces=ns)
-            if journal:
-                ref_data['journal'] = journal[0].strip()
-            
-            # Get volume, issue, pages
-            volume = ref.xpath('.//tei:biblScope[@unit="volume"]/text()', namespaces=ns)
-            if volume:
-                ref_data['volume'] = volume[0].strip()
-                
-            issue = ref.xpath('.//tei:biblScope[@unit="issue"]/text()', namespaces=ns)
-            if issue:
-                ref_data['issue'] = issue[0].strip()
-                
-            pages = ref.xpath('.//tei:biblScope[@unit="page"]/text()', namespaces=ns)
-            if pages:
-                ref_data['pages'] = pages[0].strip()
-            
-            # Get DOI
-            doi = ref.xpath('.//tei:idno[@type="DOI"]/text()', namespaces=ns)
-            if doi:
-                ref_data['doi'] = doi[0].strip()
-            
-            references.append(ref_data)
+            ref_text = " ".join(_node_text(ref).split())  # Normalize whitespace
+            references.append(self._parse_bibl_struct(ref, i, ref_text))
             
         return references
 
-    def _extract_references_from_div(self, ref_div, ns) -> List[Dict[str, Any]]:
+    def _parse_bibl_struct(self, ref, ref_id: int, raw_text: str) -> Dict[str, Any]:
+        """Parse a TEI biblStruct into structured reference data"""
+        ref_data = {'ref_id': str(ref_id), 'raw_text': raw_text}
+        
+        # Walk the biblStruct once, keeping the first value of each field
+        # in document order
+        authors = []
+        fields: Dict[str, str] = {}
+        date_when = None
+        date_text = None
+        
+        for elem in ref.iter(etree.Element):
+            tag = elem.tag
+            if tag == _TEI_PERS_NAME:
+                if elem.getparent().tag == _TEI_AUTHOR:
+                    surname = elem.findtext(f'.//{_TEI_SURNAME}', default="").strip()
+                    forename = elem.findtext(f'.//{_TEI_FORENAME}', default="").strip()
+                    if surname or forename:
+                        authors.append(f"{surname}, {forename}")
+            elif tag == _TEI_DATE:
+                if date_when is None:
+                    date_when = elem.get('when')
+                if date_text is None:
+                    date_text = _first_text_node(elem)
+            else:
+                field_name = None
+                if tag == _TEI_TITLE:
+                    parent_tag = elem.getparent().tag
+                    if parent_tag == _TEI_ANALYTIC:
+                        field_name = 'title'
+                    elif parent_tag == _TEI_MONOGR and elem.get('level') == 'j':
+                        field_name = 'journal'
+                elif tag == _TEI_BIBL_SCOPE:
+                    field_name = _REF_SCOPE_FIELDS.get(elem.get('unit'))
+                elif tag == _TEI_IDNO and elem.get('type') == 'DOI':
+                    field_name = 'doi'
+                
+                if field_name and field_name not in fields:
+                    value = _first_text_node(elem)
+                    if value is not None:
+                        fields[field_name] = value.strip()
+        
+        ref_data['authors'] = authors
+        
+        # Year from date/@when, else from the date text
+        year_text = date_when if date_when is not None else date_text
+        if year_text is not None:
+            year_match = _YEAR_RE.search(year_text.strip())
+            if year_match:
+                ref_data['year'] = year_match.group(1)
+        
+        # Title, journal/source, volume, issue, pages, DOI
+        for field_name in _REF_FIELD_ORDER:
+            if field_name in fields:
+                ref_data[field_name] = fields[field_name]
+
+        return ref_data
+
+    def _extract_references_from_div(self, ref_div) -> List[Dict[str, Any]]:
         """Extract references from a references div when no structured biblStruct exists"""
-        references = []
+        # 1. Collect the raw citation strings, numbered as they appear
+        raw_refs = []
         
         # Try to find reference items
-        ref_items = ref_div.xpath('.//tei:p | .//tei:item', namespaces=ns)
+        ref_items = _XP_REF_ITEMS(ref_div)
         
         if ref_items:
             for i, item in enumerate(ref_items, 1):
-                ref_text = " ".join(item.xpath('.//text()')).strip()
-                ref_text = re.sub(r'\s+', ' ', ref_text)
+                ref_text = " ".join(_node_text(item).split())
                 
                 if ref_text:
-                    # Try to parse basic information
-                    ref_data = self._parse_reference_text(ref_text, i)
-                    references.append(ref_data)
+                    raw_refs.append((i, ref_text))
         else:
             # No items found, try to split text by common patterns
-            text = " ".join(ref_div.xpath('.//text()')).strip()
+            text = _node_text(ref_div).strip()
             
             # Try different splitting patterns
             # 1. Numbered refs: [1], 1., (1)
-            ref_matches = re.split(r'\s*(?:\[\d+\]|\d+\.|\(\d+\))\s+', '\n' + text)
+            ref_matches = _REF_NUMBER_SPLIT_RE.split('\n' + text)
             
             if len(ref_matches) > 2:  # First element is empty due to \n
                 for i, ref_text in enumerate(ref_matches[1:], 1):
                     if ref_text.strip():
-                        ref_data = self._parse_reference_text(ref_text.strip(), i)
-                        references.append(ref_data)
+                        raw_refs.append((i, ref_text.strip()))
         
-        return references
+        if not raw_refs:
+            return []
+        
+        # 2. Let GROBID parse them all in one request
+        references = self._parse_citation_list(raw_refs)
+        if references is not None:
+            return references
+        
+        # 3. Otherwise parse basic information locally
+        return [self._parse_reference_text(ref_text, i) for i, ref_text in raw_refs]
+
+    def _parse_citation_list(self, raw_refs: List[Tuple[int, str]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse raw citation strings with GROBID's citation model.
+        Returns None if GROBID is unavailable or its answer can't be matched
+        up with the input citations.
+
+        Args:
+            raw_refs: (ref_id, citation text) pairs
+        """
+        tei_xml = self._process_citation_list([ref_text for _, ref_text in raw_refs])
+        if not tei_xml:
+            return None
+        
+        try:
+            root = etree.fromstring(tei_xml)
+        except etree.XMLSyntaxError as e:
+            self.logger.warning(f"Could not parse citation list TEI: {e}")
+            return None
+        
+        bibl_structs = root.findall(f'.//{_TEI_BIBL_STRUCT}')
+        if root.tag == _TEI_BIBL_STRUCT:
+            bibl_structs.insert(0, root)
+        if len(bibl_structs) != len(raw_refs):
+            self.logger.warning(
+                f"GROBID returned {len(bibl_structs)} citations for {len(raw_refs)} raw references"
+            )
+            return None
+        
+        return [
+            self._parse_bibl_struct(ref, i, ref_text)
+            for (i, ref_text), ref in zip(raw_refs, bibl_structs)
+        ]
 
     def _parse_reference_text(self, text: str, ref_id: int) -> Dict[str, Any]:
         """Parse a reference text string into structured data"""
@@ -729,18 +1249,18 @@ class PDFExtractor:
         
         # Try to extract authors
         # Pattern: Surname A, Surname B, et al.
-        authors_match = re.match(r'^([A-Z][a-z]+\s+[A-Z](?:\s*,\s*[A-Z][a-z]+\s+[A-Z])*(?:\s*,\s*et al\.)?)', text)
+        authors_match = _REF_AUTHORS_RE.match(text)
         if authors_match:
             author_text = authors_match.group(1)
             ref_data['authors'] = [author_text]
         
         # Try to extract year
-        year_match = re.search(r'\((\d{4})\)', text)
+        year_match = _REF_YEAR_RE.search(text)
         if year_match:
             ref_data['year'] = year_match.group(1)
         
         # Try to extract journal and volume/issue
-        journal_match = re.search(r'([A-Z][A-Za-z\s]+)\.\s+(?:Vol\.?\s*)?(\d+)(?:\((\d+)\))?', text)
+        journal_match = _REF_JOURNAL_RE.search(text)
         if journal_match:
             ref_data['journal'] = journal_match.group(1)
             ref_data['volume'] = journal_match.group(2)
@@ -748,105 +1268,141 @@ class PDFExtractor:
                 ref_data['issue'] = journal_match.group(3)
         
         # Try to extract pages
-        pages_match = re.search(r'(?::|,)\s*(?:pp?\.)?\s*(\d+(?:-\d+)?)', text)
+        pages_match = _REF_PAGES_RE.search(text)
         if pages_match:
             ref_data['pages'] = pages_match.group(1)
         
         # Try to extract DOI
-        doi_match = re.search(r'doi:?\s*(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)', text, re.IGNORECASE)
+        doi_match = _REF_DOI_RE.search(text)
         if doi_match:
             ref_data['doi'] = doi_match.group(1)
         
         return ref_data
 
-    def _extract_figures(self, root, ns) -> List[Dict[str, Any]]:
-        """Extract figures from TEI"""
+    def _extract_figures_and_tables(self, text) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Extract figures and tables from TEI in a single walk of the text"""
         figures = []
-        
-        # Find all figure nodes
-        figure_nodes = root.xpath('.//tei:figure', namespaces=ns)
-        
-        for i, fig in enumerate(figure_nodes, 1):
-            figure_data = {'id': f"fig{i}"}
-            
-            # Extract figure label/number
-            label = fig.findtext('.//tei:head', default="", namespaces=ns)
-            if label:
-                figure_data['label'] = label.strip()
-            
-            # Extract figure caption
-            caption_parts = []
-            for desc in fig.xpath('.//tei:figDesc//text()', namespaces=ns):
-                if desc.strip():
-                    caption_parts.append(desc.strip())
-            
-            if caption_parts:
-                figure_data['caption'] = " ".join(caption_parts)
-            
-            # If we have caption or label, add the figure
-            if 'caption' in figure_data or 'label' in figure_data:
-                figures.append(figure_data)
-        
-        return figures
-
-    def _extract_tables(self, root, ns) -> List[Dict[str, Any]]:
-        """Extract tables from TEI"""
         tables = []
-        
-        # Find all table nodes
-        table_nodes = root.xpath('.//tei:table', namespaces=ns)
-        
-        for i, table in enumerate(table_nodes, 1):
-            table_data = {'id': f"table{i}"}
-            
-            # Extract table title/caption
-            # Try preceding head element first
-            caption = table.xpath('preceding::tei:head[1]/text()', namespaces=ns)
-            if caption:
-                table_data['caption'] = caption[0].strip()
+        figure_count = 0
+        table_count = 0
+        # Heads in document order, for finding the head just before each table
+        heads = []
+        
+        # Figures and tables are numbered by position among all figure/table nodes
+        for elem in text.iter(_TEI_HEAD, _TEI_FIGURE, _TEI_TABLE):
+            if elem.tag == _TEI_HEAD:
+                heads.append(elem)
+            elif elem.tag == _TEI_FIGURE:
+                figure_count += 1
+                figure_data = self._extract_figure(elem, figure_count)
+                if figure_data is not None:
+                    figures.append(figure_data)
             else:
-                # Try parent div's head
-                parent_div = table.xpath('./parent::tei:div', namespaces=ns)
-                if parent_div:
-                    caption = parent_div[0].xpath('./tei:head/text()', namespaces=ns)
-                    if caption:
-                        table_data['caption'] = caption[0].strip()
-            
-            # Extract rows/content as simplified text
-            rows = []
-            for row in table.xpath('.//tei:row', namespaces=ns):
-                cells = []
-                for cell in row.xpath('.//tei:cell//text()', namespaces=ns):
-                    if cell.strip():
-                        cells.append(cell.strip())
-                
-                if cells:
-                    rows.append(" | ".join(cells))
+                table_count += 1
+                # The last head started before the table that doesn't contain
+                # it, i.e. preceding::tei:head[1]
+                enclosing = set(elem.iterancestors(_TEI_HEAD))
+                preceding_head = next((h for h in reversed(heads) if h not in enclosing), None)
+                table_data = self._extract_table(elem, table_count, preceding_head)
+                if table_data is not None:
+                    tables.append(table_data)
+        
+        return figures, tables
+
+    def _extract_figure(self, fig, index: int) -> Optional[Dict[str, Any]]:
+        """Extract a TEI figure; None if it has neither label nor caption"""
+        figure_data = {'id': f"fig{index}"}
+        
+        # Extract figure label/number
+        label = fig.findtext(f'.//{_TEI_HEAD}', default="")
+        if label:
+            figure_data['label'] = label.strip()
+        
+        # Extract figure caption
+        caption_parts = []
+        for desc in _XP_FIGURE_DESC_TEXT(fig):
+            if desc.strip():
+                caption_parts.append(desc.strip())
+        
+        if caption_parts:
+            figure_data['caption'] = " ".join(caption_parts)
+        
+        # If we have caption or label, add the figure
+        if 'caption' in figure_data or 'label' in figure_data:
+            return figure_data
+        return None
+
+    def _extract_table(self, table, index: int, preceding_head) -> Optional[Dict[str, Any]]:
+        """
+        Extract a TEI table; None if it has no non-empty rows
+
+        Args:
+            table: The TEI table element
+            index: 1-based position among all tables, used for its id
+            preceding_head: Nearest head before the table in document order, or None
+        """
+        table_data = {'id': f"table{index}"}
+        
+        # Extract table title/caption
+        # Try preceding head element first
+        caption = _first_text_node(preceding_head) if preceding_head is not None else None
+        if caption is not None:
+            table_data['caption'] = caption.strip()
+        else:
+            # Try parent div's head
+            parent = table.getparent()
+            if parent is not None and parent.tag == _TEI_DIV:
+                caption = next(
+                    (t for h in parent.iterchildren(_TEI_HEAD) for t in _direct_text_nodes(h)), None
+                )
+                if caption is not None:
+                    table_data['caption'] = caption.strip()
+        
+        # Extract rows/content as simplified text
+        rows = []
+        for row in table.iter(_TEI_ROW):
+            cells = []
+            for cell in row.iterchildren(_TEI_CELL):
+                # All of a cell's text, including text inside hi/ref children
+                cell_text = " ".join(_node_text(cell).split())
+                if cell_text:
+                    cells.append(cell_text)
             
-            if rows:
-                table_data['content'] = "\n".join(rows)
-                tables.append(table_data)
+            if cells:
+                rows.append(" | ".join(cells))
         
-        return tables
+        if rows:
+            table_data['content'] = "\n".join(rows)
+            return table_data
+        return None
         
-    def _merge_extractions(self, grobid_content: ExtractedContent, fallback_content: ExtractedContent) -> ExtractedContent:
+    def _merge_extractions(self, grobid_content: ExtractedContent,
+                           load_fallback: Callable[[], ExtractedContent]) -> ExtractedContent:
         """
         Merge GROBID extraction with fallback extraction to ensure completeness.
         Prioritize GROBID structure but use fallback text when GROBID text is missing.
+
+        Args:
+            grobid_content: Content parsed from the GROBID TEI
+            load_fallback: Returns the pdfplumber extraction; only called when
+                           the GROBID content is missing something
         """
         # Start with GROBID content as the base
         merged = grobid_content
         
+        # Nothing to fill in: skip the pdfplumber pass entirely
+        if not self._needs_fallback(merged):
+            return merged
+        
+        fallback_content = load_fallback()
+        
         # Keep the raw fallback content in case we need it
         merged.pages = fallback_content.pages
         
         # 1. If GROBID didn't find a title, use the fallback's first text as possible title
         if not merged.title and fallback_content.raw_text:
             # Take first non-empty line as potential title
-            first_line = next(
-                (line for line in fallback_content.raw_text.splitlines() if line.strip()),
-                ""
-            )
+            first_line = _first_nonblank_line(fallback_content.raw_text)
             if len(first_line) > 10 and len(first_line) < 200:  # Reasonable title length
                 merged.title = first_line.strip()
         
@@ -855,7 +1411,7 @@ class PDFExtractor:
             merged.raw_text = fallback_content.raw_text
         
         # 3. If GROBID has no or very few sections, try to extract from fallback
-        if not merged.sections or sum(len(s.get('paragraphs', [])) for s in merged.sections) < 3:
+        if not _has_min_paragraphs(merged.sections, 3):
             # Try to extract sections from fallback text
             if fallback_content.raw_text:
                 merged.sections = self._extract_sections_from_text(fallback_content.raw_text)
@@ -865,8 +1421,12 @@ class PDFExtractor:
             # Get all fallback paragraphs
             fallback_paragraphs = []
             if fallback_content.raw_text:
-                fallback_paragraphs = re.split(r'\n\s*\n', fallback_content.raw_text)
-                fallback_paragraphs = [p.strip() for p in fallback_paragraphs if p.strip()]
+                fallback_paragraphs = [
+                    p for p in map(str.strip, _PARA_SPLIT_RE.split(fallback_content.raw_text)) if p
+                ]
+            
+            # Lowercased copies for title matching, built on first use
+            fallback_paragraphs_lower = None
             
             # Check each section for completeness
             for i, section in enumerate(merged.sections):
@@ -875,17 +1435,19 @@ class PDFExtractor:
                 # If section has no paragraphs but has a title, try to find content in fallback
                 if section.get('title') and not paragraphs:
                     title = section['title'].lower()
+                    if fallback_paragraphs_lower is None:
+                        fallback_paragraphs_lower = [p.lower() for p in fallback_paragraphs]
                     
                     # Find matching paragraph in fallback that might contain this section
-                    for j, fb_para in enumerate(fallback_paragraphs):
-                        if title in fb_para.lower():
+                    for j, fb_para in enumerate(fallback_paragraphs_lower):
+                        if title in fb_para:
                             # Take this and next paragraph as content
                             if j + 1 < len(fallback_paragraphs):
                                 section['paragraphs'] = [fallback_paragraphs[j+1]]
                             break
                 
                 # If section has very short paragraphs, might be incomplete
-                elif paragraphs and all(len(p) < 100 for p in paragraphs):
+                elif paragraphs and max(map(len, paragraphs)) < 100:
                     # Try to find matching content in fallback
                     # Use simple text matching - look for the first paragraph in fallback
                     if paragraphs[0] and fallback_content.raw_text:
@@ -898,16 +1460,12 @@ class PDFExtractor:
         
         # 5. If no references found, try to extract from fallback
         if not merged.references and fallback_content.raw_text:
-            ref_section_match = re.search(
-                r'^(?:REFERENCES|BIBLIOGRAPHY)[:\s]*\n(.*?)(?:\n\s*\n|$)',
-                fallback_content.raw_text,
-                re.IGNORECASE | re.MULTILINE | re.DOTALL
-            )
+            ref_section_match = _REF_SECTION_RE.search(fallback_content.raw_text)
             
             if ref_section_match:
                 ref_text = ref_section_match.group(1)
                 # Split by likely reference patterns
-                refs = re.split(r'\n\s*(?:\[\d+\]|\d+\.|\(\d+\))\s+', '\n' + ref_text)
+                refs = _REF_LINE_SPLIT_RE.split('\n' + ref_text)
                 
                 for i, ref in enumerate(refs[1:], 1):  # Skip first empty element
                     if ref.strip():
@@ -918,6 +1476,22 @@ class PDFExtractor:
         
         return merged
     
+    def _needs_fallback(self, content: ExtractedContent) -> bool:
+        """Whether any step of _merge_extractions would use the fallback content."""
+        if not content.title or not content.raw_text or len(content.raw_text) < 100:
+            return True
+        if not content.references:
+            return True
+        if not _has_min_paragraphs(content.sections, 3):
+            return True
+        for section in content.sections:
+            paragraphs = section.get('paragraphs', [])
+            if section.get('title') and not paragraphs:
+                return True
+            if paragraphs and max(map(len, paragraphs)) < 100:
+                return True
+        return False
+
     def _post_process(self, content: ExtractedContent) -> ExtractedContent:
         """
         Final post-processing to clean up merged content:
@@ -926,18 +1500,19 @@ class PDFExtractor:
         - Remove page numbers and headers/footers
         - Ensure standard JCAD journal info
         """
-        # 1. Ensure journal metadata is JCAD regardless of input
-        content.journal_metadata = {
+        # 1. Ensure journal metadata is JCAD regardless of input, keeping the
+        #    article-level fields (volume, pub_date, doi, ...) GROBID found
+        content.journal_metadata.update({
             'journal_id': 'JCAD',
             'journal_title': 'The Journal of Clinical and Aesthetic Dermatology',
             'issn': '1941-2789',
             'publisher': 'Matrix Medical Communications'
-        }
+        })
         
         # 2. Ensure title is properly formatted
         if content.title:
             # Normalize whitespace
-            content.title = re.sub(r'\s+', ' ', content.title).strip()
+            content.title = " ".join(content.title.split())
             
             # Title case if all uppercase or all lowercase
             if content.title.isupper() or content.title.islower():
@@ -947,7 +1522,8 @@ class PDFExtractor:
         for section in content.sections:
             paragraphs = section.get('paragraphs', [])
             cleaned_paragraphs = []
-            seen_paragraphs = set()
+            # Paragraphs seen so far, grouped by their opening characters
+            seen_paragraphs: Dict[str, List[str]] = {}
             
             for p in paragraphs:
                 # Skip empty paragraphs
@@ -965,11 +1541,14 @@ class PDFExtractor:
                 if self._is_header_footer(p):
                     continue
                 
-                # Skip if we've seen this paragraph before
-                if p in seen_paragraphs:
+                # Skip if we've seen this paragraph before. Only the prefix is
+                # hashed; full comparisons happen just between paragraphs that
+                # start the same way
+                same_prefix = seen_paragraphs.setdefault(p[:DEDUP_PREFIX_CHARS], [])
+                if p in same_prefix:
                     continue
                 
-                seen_paragraphs.add(p)
+                same_prefix.append(p)
                 cleaned_paragraphs.append(p)
             
             section['paragraphs'] = cleaned_paragraphs
@@ -990,61 +1569,107 @@ class PDFExtractor:
         
         return content
     
-    def _clean_paragraph(self, text: str) -> str:
-        """Clean a paragraph by normalizing whitespace and fixing common issues."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _clean_paragraph(text: str) -> str:
+        """
+        Clean a paragraph by normalizing whitespace and fixing common issues.
+        Cached: GROBID and fallback text often repeat the same paragraphs.
+        """
         # Normalize whitespace
         text = " ".join(text.split())
         
         # Fix hyphenated words that were split across lines
-        text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', text)
+        text = HYPHEN_BREAK_RE.sub(r'\1\2', text)
         
         # Remove repeated characters (possible OCR errors)
-        text = re.sub(r'(.)\1{3,}', r'\1', text)
+        text = REPEATED_CHAR_RE.sub(r'\1', text)
         
         return text
     
     def _is_header_footer(self, text: str) -> bool:
         """Check if text is likely a header or footer."""
-        header_footer_patterns = [
-            r'^Page \d+( of \d+)?$',
-            r'^\d+$',
-            r'^Copyright © \d{4}',
-            r'^All rights reserved',
-            r'www\..+\.\w+',
-            r'http://|https://'
-        ]
-        
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in header_footer_patterns)
+        return HEADER_FOOTER_RE.search(text) is not None
     
     def _clean_references(self, references: List[Dict[str, Any]]) -> None:
         """Clean reference data"""
-        for ref in references:
+        for i, ref in enumerate(references, 1):
             if 'raw_text' in ref:
                 # Normalize whitespace
-                ref['raw_text'] = re.sub(r'\s+', ' ', ref['raw_text']).strip()
+                ref['raw_text'] = " ".join(ref['raw_text'].split())
                 
                 # Ensure ref_id is present
                 if 'ref_id' not in ref or not ref['ref_id']:
-                    ref['ref_id'] = str(references.index(ref) + 1)
+                    ref['ref_id'] = str(i)
 
-    def _fallback_extraction(self, pdf_path: str) -> ExtractedContent:
+    def _extract_page_texts(self, pdf, pdf_source) -> List[str]:
+        """
+        Text of every page of an open pdfplumber document, in page order.
+        Long documents are split into page ranges handled by a process pool.
+
+        Args:
+            pdf: The open pdfplumber document
+            pdf_source: Path to the PDF or a binary file object with its bytes
+        """
+        page_count = len(pdf.pages)
+        workers = min(_FALLBACK_MAX_WORKERS, -(-page_count // _FALLBACK_PAGES_PER_WORKER))
+        if page_count < _FALLBACK_PARALLEL_MIN_PAGES or workers < 2:
+            return [page.extract_text() or "" for page in pdf.pages]
+        
+        temp_path = None
+        pool = _get_fallback_pool()
+        try:
+            # Workers reopen the PDF themselves from a path; in-memory PDFs are
+            # written to a temporary file rather than pickled to every worker
+            if isinstance(pdf_source, (str, os.PathLike)):
+                pdf_path = os.fspath(pdf_source)
+            else:
+                pdf_source.seek(0)
+                with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_pdf:
+                    temp_path = temp_pdf.name
+                    temp_pdf.write(pdf_source.read())
+                pdf_path = temp_path
+            
+            step = -(-page_count // workers)
+            starts = range(0, page_count, step)
+            stops = [min(start + step, page_count) for start in starts]
+            
+            chunks = pool.map(_extract_page_range, [pdf_path] * len(starts), starts, stops)
+            return [text for chunk in chunks for text in chunk]
+        except Exception as e:
+            self.logger.warning(f"Parallel page extraction failed, extracting serially: {e}")
+            if isinstance(e, BrokenProcessPool):
+                _reset_fallback_pool(pool)
+            return [page.extract_text() or "" for page in pdf.pages]
+        finally:
+            if temp_path:
+                os.unlink(temp_path)
+
+    def _fallback_extraction(self, pdf_source) -> ExtractedContent:
         """
         Fallback extraction using pdfplumber to get basic text.
         Used when GROBID fails or as a complement to GROBID.
+
+        Args:
+            pdf_source: Path to the PDF or a binary file object with its bytes
         """
         self.logger.info("Using fallback extraction with pdfplumber")
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            # Imported here: pdfplumber (and pdfminer behind it) is slow to load
+            # and only needed on this rarely-taken path
+            import pdfplumber
+            
+            with pdfplumber.open(pdf_source) as pdf:
                 pages = []
-                raw_text = ""
                 
                 # Extract text from each page
-                for page in pdf.pages:
-                    text = page.extract_text() or ""
+                for text in self._extract_page_texts(pdf, pdf_source):
                     if text.strip():
                         pages.append(text)
-                        raw_text += text + "\n\n"
+                
+                # Join once rather than growing a string page by page
+                raw_text = "".join(text + "\n\n" for text in pages)
                 
                 # Try to identify title from first page
                 title = None
@@ -1064,9 +1689,10 @@ class PDFExtractor:
                     raw_text=raw_text,
                     pages=pages,
                     title=title,
-                    sections=sections
+                    sections=sections,
+                    from_fallback=True
                 )
         except Exception as e:
             self.logger.error(f"pdfplumber fallback failed: {e}", exc_info=True)
             # Last resort: Return empty content
-            return ExtractedContent(raw_text="", pages=[])
\ No newline at end of file
+            return ExtractedContent(raw_text="", pages=[], from_fallback=True)
\ No newline at end of file
@@ -0,0 +1,41 @@
+import re
+
+try:
+    import re2
+except ImportError:  # optional: fall back to the backtracking re engine
+    re2 = None
+
+
+def compile_linear(pattern: str, flags: str = ''):
+    """
+    Compile a pattern with RE2 when it is installed, so matching stays linear
+    in the input even on garbled OCR text; otherwise fall back to re.
+
+    Args:
+        pattern: Regular expression without backreferences
+        flags: Inline flag letters understood by both engines, e.g. 'ims'
+    """
+    if flags:
+        pattern = f'(?{flags}){pattern}'
+    if re2 is not None:
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
+
+# Duplicate paragraphs are detected by hashing only this many leading characters
+DEDUP_PREFIX_CHARS = 128
+
+# Paragraph cleanup (REPEATED_CHAR_RE needs a backreference, so it stays on re)
+HYPHEN_BREAK_RE = re.compile(r'(\w+)-\s+(\w+)')
+# Runs of 4+ identical characters. Spelled out rather than (.)\1{3,}, which
+# matches the same runs but is much slower on the usual paragraph with none
+REPEATED_CHAR_RE = re.compile(r'(.)\1\1\1+')
+# One alternation, so each paragraph is scanned once rather than once per pattern
+HEADER_FOOTER_RE = re.compile('|'.join(f'(?:{p})' for p in (
+    r'^Page \d+(?: of \d+)?$',
+    r'^\d+$',
+    r'^Copyright © \d{4}',
+    r'^All rights reserved',
+    r'www\..+\.\w+',
+    r'https?://'
+)), re.IGNORECASE)
@@ -3,6 +3,84 @@ import re
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple
 from .pdf_extractor import ExtractedContent
+from .text_patterns import (
+    DEDUP_PREFIX_CHARS, HEADER_FOOTER_RE, HYPHEN_BREAK_RE, REPEATED_CHAR_RE, compile_linear
+)
+
+# Common section headings in medical articles
+_SECTION_HEADINGS = [
+    'ABSTRACT', 'INTRODUCTION', 'BACKGROUND',
+    'METHODS', 'MATERIALS AND METHODS', 'METHODOLOGY',
+    'RESULTS', 'FINDINGS', 'OUTCOMES',
+    'DISCUSSION', 'CONCLUSION', 'CONCLUSIONS',
+    'REFERENCES', 'ACKNOWLEDGMENTS'
+]
+
+# Pattern for identifying heading candidates
+_HEADING_RE = re.compile(
+    r'^(?:\d+\.?\s*)?(' + '|'.join(_SECTION_HEADINGS) + r')',
+    re.IGNORECASE
+)
+
+# Pattern for identifying reference citations
+_CITATION_RE = re.compile(
+    r'(?:\[(\d+(?:[,-]\d+)*)\])|'  # [1] or [1,2] or [1-3]
+    r'(?:\(([^)]+?(?:\d{4})[^)]*?)\))'  # (Author et al., 2020)
+)
+
+# Paragraph splitting
+_BLANK_LINE_RE = re.compile(r'\n\s*\n')
+
+# Paragraph cleanup
+_OCR_DIGIT_L_RE = re.compile(r'(\d)l')  # digit followed by lowercase L
+
+# Keywords section in raw text. This and the raw-text section and reference
+# patterns below scan whole documents when GROBID fails, so they use RE2 when
+# it is installed (RE2's \s, \d and \w are ASCII-only)
+_KEYWORD_RES = [
+    compile_linear(pattern, 'is') for pattern in (
+        r'(?:Key\s*words?|Keywords?)[:\-]+\s*(.+?)(?:\n\n|\n[A-Z])',
+        r'(?:Key\s*words?|Keywords?)[:\-]+\s*(.+?)\.'
+    )
+]
+
+# Reference components
+_REF_YEAR_RE = re.compile(r'\((\d{4})\)')
+# Author list at beginning: "Surname A, Surname B, et al.". A lone
+# "Surname A et al." also matches here, with just the first author
+_REF_AUTHORS_RE = re.compile(
+    r'^([A-Z][a-z]+(?:\s+[A-Z](?:\.)?)(?:,\s+[A-Z][a-z]+(?:\s+[A-Z](?:\.)?))*)\.?'
+)
+_REF_AUTHOR_SPLIT_RE = re.compile(r',\s+(?=\w)')
+# Title follows the first author, journal follows the title; both are
+# matched right after a literal occurrence of the preceding field
+_REF_TITLE_AFTER_AUTHOR_RE = re.compile(r'.*?\.\s+(.*?)(?:\.|(?:In:|Journal|Volume))', re.DOTALL)
+_REF_JOURNAL_AFTER_TITLE_RE = re.compile(r'\.?\s+(.*?)(?:\.|\d{4}|Vol\.|Volume|\()')
+_REF_VOLUME_RE = re.compile(r'(?:Vol(?:\.|ume)?\s+)?(\d+)(?:\s*\((\d+)\))?')
+_REF_PAGES_RE = re.compile(r'(?::|,)\s*(?:p(?:p|ages?)?\.?\s*)?(\d+(?:-\d+)?)')
+_REF_DOI_RE = re.compile(r'(?:doi:?\s*|DOI:?\s*|https?://doi\.org/)(\d{2}\.\d{4}/\S+)', re.IGNORECASE)
+
+# Section headings in raw text, with variations. Only match.group(0) is
+# used, so the alternatives are not captured
+_RAW_SECTION_RE = compile_linear(
+    r'ABSTRACT[:\s]*'
+    r'|INTRODUCTION[:\s]*'
+    r'|(?:MATERIALS\s+AND\s+)?METHODS[:\s]*'
+    r'|RESULTS(?:\s+AND\s+DISCUSSION)?[:\s]*'
+    r'|DISCUSSION[:\s]*'
+    r'|CONCLUSION[S]?[:\s]*'
+    r'|ACKNOWLEDGMENT[S]?[:\s]*'
+    r'|REFERENCE[S]?[:\s]*'
+    r'|BIBLIOGRAPHY[:\s]*',
+    'im'
+)
+
+# Reference list in raw text
+_REF_SECTION_RE = compile_linear(r'^(REFERENCES|BIBLIOGRAPHY)[:\s]*\n(.*?)(?:^\s*$|$)', 'ims')
+_NUMBERED_REF_SPLIT_RE = compile_linear(r'\n\s*(?:\[\d+\]|\d+\.|\(\d+\))\s+')
+_AUTHOR_YEAR_REF_SPLIT_RE = compile_linear(
+    r'\n\s*(?:[A-Z][a-z]+(?:,?\s+(?:and|&)\s+[A-Z][a-z]+)?(?:,?\s+et\s+al\.?)?,\s+\d{4})'
+)
 
 @dataclass
 class ProcessedSection:
@@ -48,41 +126,17 @@ class TextProcessor:
     
     def __init__(self):
         self._setup_logging()
-        self._setup_patterns()
 
     def _setup_logging(self) -> None:
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
-        if not self.logger.handlers:
+        if not self.logger.hasHandlers():
             handler = logging.StreamHandler()
             handler.setFormatter(logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             ))
             self.logger.addHandler(handler)
             
-    def _setup_patterns(self):
-        """Initialize regex and processing patterns."""
-        # Common section headings in medical articles
-        self.SECTION_HEADINGS = [
-            'ABSTRACT', 'INTRODUCTION', 'BACKGROUND',
-            'METHODS', 'MATERIALS AND METHODS', 'METHODOLOGY',
-            'RESULTS', 'FINDINGS', 'OUTCOMES',
-            'DISCUSSION', 'CONCLUSION', 'CONCLUSIONS',
-            'REFERENCES', 'ACKNOWLEDGMENTS'
-        ]
-        
-        # Pattern for identifying heading candidates
-        self.heading_pattern = re.compile(
-            r'^(?:\d+\.?\s*)?(' + '|'.join(self.SECTION_HEADINGS) + r')',
-            re.IGNORECASE
-        )
-        
-        # Pattern for identifying reference citations
-        self.citation_pattern = re.compile(
-            r'(?:\[(\d+(?:[,-]\d+)*)\])|'  # [1] or [1,2] or [1-3]
-            r'(?:\(([^)]+?(?:\d{4})[^)]*?)\))'  # (Author et al., 2020)
-        )
-
     def process(
         self,
         extracted_content: ExtractedContent,
@@ -141,24 +195,22 @@ class TextProcessor:
         # If GROBID extracted sections, use them
         if content.sections:
             for section in content.sections:
+                title = section.get('title', '')
+                raw_paragraphs = section.get('paragraphs')
+                
                 # Skip sections without meaningful content
-                if not section.get('paragraphs') and not section.get('title'):
+                if not raw_paragraphs and not title:
                     continue
                     
                 # Clean section title
-                title = section.get('title', '').strip()
+                title = title.strip()
                 
                 # Fix title case if all uppercase
                 if title.isupper():
                     title = title.title()
                 
-                # Process paragraphs
-                paragraphs = []
-                for p in section.get('paragraphs', []):
-                    # Clean paragraph text
-                    cleaned_p = self._clean_paragraph(p)
-                    if cleaned_p:
-                        paragraphs.append(cleaned_p)
+                # Keep non-empty paragraphs; they are cleaned in _post_process_sections
+                paragraphs = [p for p in raw_paragraphs or () if p.strip()]
                 
                 if title or paragraphs:
                     processed_sections.append(ProcessedSection(
@@ -190,30 +242,34 @@ class TextProcessor:
         Enhanced with better parsing of reference components.
         """
         processed_refs = []
+        enhance = self._enhance_reference_data
         
         # Process each GROBID reference
         for ref in content.references:
+            get = ref.get
+            raw_text = get('raw_text')
+            
             # Skip empty references
-            if not ref.get('raw_text'):
+            if not raw_text:
                 continue
                 
             # Convert to ReferenceData format
             ref_data = ReferenceData(
-                raw_text=ref.get('raw_text', ''),
-                ref_id=ref.get('ref_id'),
-                authors=ref.get('authors', []),
-                year=ref.get('year'),
-                title=ref.get('title'),
-                journal=ref.get('journal'),
-                volume=ref.get('volume'),
-                issue=ref.get('issue'),
-                pages=ref.get('pages'),
-                doi=ref.get('doi')
+                raw_text=raw_text,
+                ref_id=get('ref_id'),
+                authors=get('authors', []),
+                year=get('year'),
+                title=get('title'),
+                journal=get('journal'),
+                volume=get('volume'),
+                issue=get('issue'),
+                pages=get('pages'),
+                doi=get('doi')
             )
             
             # Try to extract more info if fields are missing
             if not (ref_data.authors and ref_data.title and ref_data.journal):
-                self._enhance_reference_data(ref_data)
+                enhance(ref_data)
             
             processed_refs.append(ref_data)
             
@@ -229,17 +285,12 @@ class TextProcessor:
         
         # Look for keywords section in raw text
         if content.raw_text:
-            keyword_patterns = [
-                r'(?:Key\s*words?|Keywords?)[:\-]+\s*(.+?)(?:\n\n|\n[A-Z])',
-                r'(?:Key\s*words?|Keywords?)[:\-]+\s*(.+?)\.'
-            ]
-            
-            for pattern in keyword_patterns:
-                match = re.search(pattern, content.raw_text, re.IGNORECASE | re.DOTALL)
+            for pattern in _KEYWORD_RES:
+                match = pattern.search(content.raw_text)
                 if match:
                     keyword_text = match.group(1).strip()
                     # Split on commas or semicolons
-                    keyword_parts = re.split(r'[;,]', keyword_text)
+                    keyword_parts = keyword_text.replace(';', ',').split(',')
                     keywords = [p.strip() for p in keyword_parts if p.strip()]
                     break
         
@@ -261,7 +312,8 @@ class TextProcessor:
                 continue
                 
             cleaned_paragraphs = []
-            seen_paragraphs = set()
+            # Paragraphs seen so far, grouped by their opening characters
+            seen_paragraphs: Dict[str, List[str]] = {}
             
             for p in section.paragraphs:
                 # Skip empty paragraphs
@@ -279,11 +331,13 @@ class TextProcessor:
                 if self._is_header_footer(p):
                     continue
                 
-                # Skip duplicates
-                if p in seen_paragraphs:
+                # Skip duplicates. Only the prefix is hashed; full comparisons
+                # happen just between paragraphs that start the same way
+                same_prefix = seen_paragraphs.setdefault(p[:DEDUP_PREFIX_CHARS], [])
+                if p in same_prefix:
                     continue
                     
-                seen_paragraphs.add(p)
+                same_prefix.append(p)
                 cleaned_paragraphs.append(p)
             
             # Only add section if it has content
@@ -307,42 +361,43 @@ class TextProcessor:
             return references
             
         # Clean each reference
-        for ref in references:
+        for i, ref in enumerate(references, 1):
             # Ensure ref_id exists
             if not ref.ref_id:
-                ref.ref_id = str(references.index(ref) + 1)
+                ref.ref_id = str(i)
             
             # Clean raw_text
             if ref.raw_text:
-                ref.raw_text = re.sub(r'\s+', ' ', ref.raw_text).strip()
+                ref.raw_text = " ".join(ref.raw_text.split())
             
             # Clean title
             if ref.title:
-                ref.title = re.sub(r'\s+', ' ', ref.title).strip()
+                ref.title = " ".join(ref.title.split())
                 # Remove period at end if present
                 if ref.title.endswith('.'):
                     ref.title = ref.title[:-1]
             
             # Clean journal
             if ref.journal:
-                ref.journal = re.sub(r'\s+', ' ', ref.journal).strip()
+                ref.journal = " ".join(ref.journal.split())
         
         # Remove duplicates by raw_text
         unique_refs = []
         seen_texts = set()
         
         for ref in references:
-            if ref.raw_text and ref.raw_text in seen_texts:
-                continue
-                
-            if ref.raw_text:
-                seen_texts.add(ref.raw_text)
+            raw_text = ref.raw_text
+            if raw_text:
+                if raw_text in seen_texts:
+                    continue
+                seen_texts.add(raw_text)
                 
             unique_refs.append(ref)
             
         return unique_refs
 
-    def _clean_paragraph(self, text: str) -> str:
+    @staticmethod
+    def _clean_paragraph(text: str) -> str:
         """
         Clean a paragraph by fixing common issues:
         - Normalize whitespace
@@ -352,88 +407,77 @@ class TextProcessor:
         if not text:
             return ""
             
-        # Normalize whitespace
+        # Normalize whitespace. From here on every gap is a single space, so the
+        # passes below are skipped when their literal trigger is absent
         text = " ".join(text.split())
         
         # Fix hyphenated words that were split across lines
-        text = re.sub(r'(\w+)-\s+(\w+)', r'\1\2', text)
+        if '- ' in text:
+            text = HYPHEN_BREAK_RE.sub(r'\1\2', text)
         
         # Remove repeated characters (possible OCR errors)
-        text = re.sub(r'(.)\1{3,}', r'\1\1', text)
+        text = REPEATED_CHAR_RE.sub(r'\1\1', text)
         
-        # Fix common OCR errors
-        text = re.sub(r'l\s+\.', 'I.', text)  # lowercase L followed by period
-        text = re.sub(r'(\d)l', r'\1I', text)  # digit followed by lowercase L
+        # Fix common OCR errors. With single spaces, "l\s+\." is just "l ."
+        text = text.replace('l .', 'I.')  # lowercase L followed by period
+        if 'l' in text:
+            text = _OCR_DIGIT_L_RE.sub(r'\1I', text)  # digit followed by lowercase L
         
         return text
 
-    def _is_header_footer(self, text: str) -> bool:
+    @staticmethod
+    def _is_header_footer(text: str) -> bool:
         """Check if text is likely a header or footer."""
-        header_footer_patterns = [
-            r'^Page \d+( of \d+)?$',
-            r'^\d+$',  # Just a number
-            r'^Copyright © \d{4}',
-            r'^All rights reserved',
-            r'www\..+\.\w+',
-            r'http://|https://'
-        ]
-        
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in header_footer_patterns)
+        return HEADER_FOOTER_RE.search(text) is not None
 
     def _enhance_reference_data(self, ref: ReferenceData) -> None:
         """
         Try to extract more information from raw_text for incomplete references.
         """
-        if not ref.raw_text:
-            return
-            
         # Skip if we already have all important fields
         if ref.authors and ref.title and ref.journal and ref.year:
             return
             
+        if not ref.raw_text:
+            return
+            
         raw_text = ref.raw_text
         
         # Try to extract year if missing
         if not ref.year:
-            year_match = re.search(r'\((\d{4})\)', raw_text)
+            year_match = _REF_YEAR_RE.search(raw_text)
             if year_match:
                 ref.year = year_match.group(1)
         
         # Try to extract authors if missing
         if not ref.authors:
             # Pattern for author list at beginning: "Surname A, Surname B, et al."
-            authors_match = re.match(r'^([A-Z][a-z]+(?:\s+[A-Z](?:\.)?)(?:,\s+[A-Z][a-z]+(?:\s+[A-Z](?:\.)?))*)\.?', raw_text)
+            authors_match = _REF_AUTHORS_RE.match(raw_text)
             if authors_match:
                 author_text = authors_match.group(1)
                 # Split into individual authors
-                author_parts = re.split(r',\s+(?=\w)', author_text)
+                author_parts = _REF_AUTHOR_SPLIT_RE.split(author_text)
                 ref.authors = [p.strip() for p in author_parts if p.strip()]
-            
-            # Try "et al." pattern
-            elif et_al_match := re.match(r'^([A-Z][a-z]+(?:\s+[A-Z](?:\.)?)(?:\s+et\s+al\.))\.?', raw_text):
-                ref.authors = [et_al_match.group(1)]
         
         # Try to extract title if missing
         if not ref.title and ref.authors:
             # Title typically follows authors and a period
-            first_author_pattern = re.escape(ref.authors[0]) if ref.authors else ""
-            if first_author_pattern:
-                title_match = re.search(f"{first_author_pattern}.*?\\.\s+(.*?)(?:\\.|(?:In:|Journal|Volume))", raw_text, re.DOTALL)
+            first_author = ref.authors[0]
+            if first_author:
+                title_match = self._match_after(first_author, _REF_TITLE_AFTER_AUTHOR_RE, raw_text)
                 if title_match:
                     ref.title = title_match.group(1).strip()
         
         # Try to extract journal if missing
         if not ref.journal and ref.title:
             # Journal typically follows title
-            title_pattern = re.escape(ref.title) if ref.title else ""
-            if title_pattern:
-                journal_match = re.search(f"{title_pattern}\.?\s+(.*?)(?:\\.|\d{{4}}|Vol\\.|Volume|\\()", raw_text)
-                if journal_match:
-                    ref.journal = journal_match.group(1).strip()
+            journal_match = self._match_after(ref.title, _REF_JOURNAL_AFTER_TITLE_RE, raw_text)
+            if journal_match:
+                ref.journal = journal_match.group(1).strip()
         
         # Try to extract volume/issue if missing
         if not ref.volume:
-            volume_match = re.search(r'(?:Vol(?:\.|ume)?\s+)?(\d+)(?:\s*\((\d+)\))?', raw_text)
+            volume_match = _REF_VOLUME_RE.search(raw_text)
             if volume_match:
                 ref.volume = volume_match.group(1)
                 if volume_match.group(2) and not ref.issue:
@@ -441,16 +485,31 @@ class TextProcessor:
         
         # Try to extract pages if missing
         if not ref.pages:
-            pages_match = re.search(r'(?::|,)\s*(?:p(?:p|ages?)?\.?\s*)?(\d+(?:-\d+)?)', raw_text)
+            pages_match = _REF_PAGES_RE.search(raw_text)
             if pages_match:
                 ref.pages = pages_match.group(1)
         
-        # Try to extract DOI if missing
-        if not ref.doi:
-            doi_match = re.search(r'(?:doi:?\s*|DOI:?\s*|https?://doi\.org/)(\d{2}\.\d{4}/\S+)', raw_text, re.IGNORECASE)
+        # Try to extract DOI if missing (every DOI form contains a slash)
+        if not ref.doi and '/' in raw_text:
+            doi_match = _REF_DOI_RE.search(raw_text)
             if doi_match:
                 ref.doi = doi_match.group(1)
 
+    @staticmethod
+    def _match_after(prefix: str, pattern: re.Pattern, text: str) -> Optional[re.Match]:
+        """
+        Match pattern immediately after the first occurrence of prefix in text
+        where it fits. Equivalent to searching for re.escape(prefix) + pattern,
+        without compiling a new regex for every prefix.
+        """
+        start = text.find(prefix)
+        while start != -1:
+            match = pattern.match(text, start + len(prefix))
+            if match:
+                return match
+            start = text.find(prefix, start + 1)
+        return None
+
     # ----------------------------------------------------------------------
     # Fallback Methods (if GROBID extraction fails)
     # ----------------------------------------------------------------------
@@ -463,25 +522,8 @@ class TextProcessor:
         if not text:
             return []
             
-        # Common section headings in academic papers with variations
-        section_patterns = [
-            r'ABSTRACT[:\s]*',
-            r'INTRODUCTION[:\s]*',
-            r'(?:MATERIALS\s+AND\s+)?METHODS[:\s]*',
-            r'RESULTS(?:\s+AND\s+DISCUSSION)?[:\s]*',
-            r'DISCUSSION[:\s]*',
-            r'CONCLUSION[S]?[:\s]*',
-            r'ACKNOWLEDGMENT[S]?[:\s]*',
-            r'REFERENCE[S]?[:\s]*',
-            r'BIBLIOGRAPHY[:\s]*'
-        ]
-        
-        # Create regex pattern to match all section headings
-        pattern = '|'.join(f'({p})' for p in section_patterns)
-        section_regex = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-        
         # Find all section matches
-        matches = list(section_regex.finditer(text))
+        matches = list(_RAW_SECTION_RE.finditer(text))
         
         # If no sections found, return empty list
         if not matches:
@@ -508,27 +550,16 @@ class TextProcessor:
                 
         return sections
 
-    def _split_into_paragraphs(self, text: str) -> List[str]:
+    @staticmethod
+    def _split_into_paragraphs(text: str) -> List[str]:
         """Split text into paragraphs based on blank lines."""
         if not text:
             return []
             
-        # Split on blank lines
-        paragraphs = re.split(r'\n\s*\n', text)
-        
-        # Clean each paragraph
-        cleaned = []
-        for p in paragraphs:
-            p = p.strip()
-            if p:
-                # Replace single line breaks with spaces
-                p = re.sub(r'\n', ' ', p)
-                # Normalize whitespace
-                p = re.sub(r'\s+', ' ', p)
-                
-                cleaned.append(p)
-                
-        return cleaned
+        # Split on blank lines, then join each paragraph's lines and collapse
+        # whitespace in one str.split pass
+        paragraphs = (" ".join(p.split()) for p in _BLANK_LINE_RE.split(text))
+        return [p for p in paragraphs if p]
 
     def _extract_references_from_raw_text(self, text: str) -> List[ReferenceData]:
         """
@@ -538,11 +569,7 @@ class TextProcessor:
         refs = []
         
         # Find references section
-        ref_section_match = re.search(
-            r'^(REFERENCES|BIBLIOGRAPHY)[:\s]*\n(.*?)(?:^\s*$|$)',
-            text,
-            re.IGNORECASE | re.MULTILINE | re.DOTALL
-        )
+        ref_section_match = _REF_SECTION_RE.search(text)
         
         if not ref_section_match:
             return refs
@@ -551,7 +578,7 @@ class TextProcessor:
         
         # Try to split references by common patterns
         # 1. Numbered references: [1], 1., (1), etc.
-        numbered_refs = re.split(r'\n\s*(?:\[\d+\]|\d+\.|\(\d+\))\s+', '\n' + ref_text)
+        numbered_refs = _NUMBERED_REF_SPLIT_RE.split('\n' + ref_text)
         
         if len(numbered_refs) > 1:
             # Remove first empty element
@@ -568,10 +595,7 @@ class TextProcessor:
                     refs.append(ref_data)
         else:
             # 2. Try author-year format
-            author_year_refs = re.split(
-                r'\n\s*(?:[A-Z][a-z]+(?:,?\s+(?:and|&)\s+[A-Z][a-z]+)?(?:,?\s+et\s+al\.?)?,\s+\d{4})', 
-                '\n' + ref_text
-            )
+            author_year_refs = _AUTHOR_YEAR_REF_SPLIT_RE.split('\n' + ref_text)
             
             if len(author_year_refs) > 1:
                 # Remove first empty element
@@ -588,7 +612,7 @@ class TextProcessor:
                         refs.append(ref_data)
             else:
                 # 3. Just split by blank lines as last resort
-                blank_line_refs = re.split(r'\n\s*\n', ref_text)
+                blank_line_refs = _BLANK_LINE_RE.split(ref_text)
                 
                 for i, ref in enumerate(blank_line_refs, 1):
                     if ref.strip():
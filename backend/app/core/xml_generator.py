@@ -1,14 +1,66 @@
+import copy
 import logging
 import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, List, Iterable, Iterator, Tuple
 from lxml import etree
 
-from dataclasses import asdict
-from .metadata_extractor import JournalMetadata, ArticleMetadata, AuthorMetadata
-from .text_processor import ProcessedContent, ProcessedSection, ReferenceData
+from .metadata_extractor import JournalMetadata, ArticleMetadata
+from .text_processor import ProcessedContent, ReferenceData
+
+# DTD directories already found to contain every required file. Only
+# successes are remembered, so a directory that was incomplete is re-checked
+_VERIFIED_DTD_DIRS = set()
+
+# XML namespaces declared on the <article> root
+_ARTICLE_NSMAP = {
+    'xlink': 'http://www.w3.org/1999/xlink',
+    'xml': 'http://www.w3.org/XML/1998/namespace'
+}
+
+# Subject heading written to article-categories for each known article type
+_ARTICLE_TYPE_SUBJECTS = {
+    "research-article": "Original Research",
+    "review-article": "Review Article",
+    "review": "Review Article",
+    "case-report": "Case Report",
+    "letter": "Letter to the Editor",
+    "editorial": "Editorial",
+    "abstract": "Abstract",
+}
+
+# Blank line between abstract paragraphs, with Unix or Windows line endings
+_ABSTRACT_PARA_RE = re.compile(r'(?:\r?\n){2,}')
+
+# Runs of characters not allowed in a title slug; each run becomes one "_"
+_SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+# Any citation style that marks a paragraph for citation processing:
+# [1], [1,2] or [1-3], (2020), (Smith et al.), (Smith and Jones, 2020)
+_CITATION_DETECT_RE = re.compile(
+    r'\[\d+(?:[-,]\d+)*\]'
+    r'|\(\d{4}\)'
+    r'|\([A-Za-z]+ et al\.\)'
+    r'|\([A-Za-z]+ and [A-Za-z]+, \d{4}\)'
+)
+
+# [n] style citations that become <xref> elements; group 1 is the first number
+_CITATION_NUMERIC_RE = re.compile(r'\[(\d+)(?:[-,]\d+)*\]')
+
+# Elements _ensure_required_elements checks for or adds children to
+_ENSURED_TAGS = (
+    "journal-meta", "journal-id", "journal-title", "issn", "article-meta",
+    "title-group", "article-title", "contrib-group", "pub-date",
+    "permissions", "body"
+)
+
+# Season text for numeric months 1-12
+_MONTH_ABBREVIATIONS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
+)
 
 class XMLGeneratorConfig:
     """Configuration for XML generation, including DTD and entity file management."""
@@ -54,6 +106,13 @@ class XMLGeneratorConfig:
         
         # Verify DTD setup
         self._verify_dtd_files()
+        
+        # The DOCTYPE only depends on the settings above, so build it once
+        system_path = self.dtd_file_path.as_posix()  # Convert to forward slashes
+        self._doctype_declaration = (
+            f'<!DOCTYPE article PUBLIC "{self.dtd_public_id}" '
+            f'"{system_path}">\n'
+        )
 
     def _resolve_dtd_path(self, custom_path: Optional[str] = None) -> Path:
         """
@@ -85,6 +144,9 @@ class XMLGeneratorConfig:
         """
         Verify all required DTD and entity files are present and accessible.
         """
+        if self.dtd_base_path in _VERIFIED_DTD_DIRS:
+            return
+            
         missing_files = []
         
         for filename in self.REQUIRED_DTD_FILES:
@@ -97,6 +159,8 @@ class XMLGeneratorConfig:
                 f"Missing required DTD files: {', '.join(missing_files)}\n"
                 f"Expected location: {self.dtd_base_path}"
             )
+            
+        _VERIFIED_DTD_DIRS.add(self.dtd_base_path)
 
     def get_catalog_path(self) -> Optional[str]:
         """
@@ -109,11 +173,7 @@ class XMLGeneratorConfig:
         """
         Generate DOCTYPE declaration with proper paths.
         """
-        system_path = self.dtd_file_path.as_posix()  # Convert to forward slashes
-        return (
-            f'<!DOCTYPE article PUBLIC "{self.dtd_public_id}" '
-            f'"{system_path}">\n'
-        )
+        return self._doctype_declaration
 
 class XMLGenerator:
     """
@@ -124,11 +184,12 @@ class XMLGenerator:
     def __init__(self, config: Optional[XMLGeneratorConfig] = None):
         self.config = config or XMLGeneratorConfig()
         self._setup_logging()
+        self._journal_meta_template = self._build_journal_meta_template()
 
     def _setup_logging(self) -> None:
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
-        if not self.logger.handlers:
+        if not self.logger.hasHandlers():
             handler = logging.StreamHandler()
             handler.setFormatter(logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -154,13 +215,102 @@ class XMLGenerator:
         """
         self.logger.info("Starting XML generation.")
 
+        # 1-3. Build <article> with <front>, <body> and an empty <back>
+        root = self._build_article_tree(journal_meta, article_meta, processed_content)
+
+        # 4. Build <back> with references (if any)
+        if processed_content.references:
+            self._build_references(root.find("back"), processed_content.references)
+
+        # 5. Convert the element tree to a string with DOCTYPE
+        xml_string = self._generate_xml_string(root)
+
+        self.logger.info("XML generation complete.")
+        return xml_string
+
+    def generate_to_file(
+        self,
+        output_path: str,
+        journal_meta: JournalMetadata,
+        article_meta: ArticleMetadata,
+        processed_content: ProcessedContent
+    ) -> None:
+        """
+        Generate the same XML as generate() and write it to a file. The
+        references are built and written one at a time, so the <ref-list> is
+        never held in memory as a whole; only its indentation differs.
+
+        Args:
+            output_path: Path of the XML file to write.
+            journal_meta: JournalMetadata from metadata_extractor.
+            article_meta: ArticleMetadata from metadata_extractor.
+            processed_content: ProcessedContent from text_processor.
+        """
+        self.logger.info(f"Starting XML generation to {output_path}.")
+
+        # 1-3. Build <article> with <front>, <body> and an empty <back>
+        root = self._build_article_tree(journal_meta, article_meta, processed_content)
+        xml_content = etree.tostring(root, encoding='unicode', pretty_print=True)
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            # 4. XML declaration and DOCTYPE
+            f.write(self._xml_header())
+
+            if not processed_content.references:
+                f.write(xml_content)
+            else:
+                # 5. <back> is the last element and still empty; write the
+                # reference list in its place, one <ref> at a time. Escaped text
+                # cannot contain "<back/>", so only the real element matches
+                before_back, after_back = xml_content.rsplit('<back/>', 1)
+                f.write(before_back)
+                f.write('<back>\n<ref-list>\n')
+                f.write(etree.tostring(self._build_ref_list_title(), encoding='unicode', pretty_print=True))
+
+                # Each <ref> is built under a scratch parent and dropped once written
+                scratch = etree.Element("ref-list")
+                for i, ref in enumerate(processed_content.references, 1):
+                    self._build_reference(scratch, ref, i)
+                    f.write(etree.tostring(scratch[0], encoding='unicode', pretty_print=True))
+                    del scratch[0]
+
+                f.write('</ref-list>\n</back>')
+                f.write(after_back)
+
+        self.logger.info("XML generation complete.")
+
+    def generate_many(
+        self,
+        articles: Iterable[Tuple[JournalMetadata, ArticleMetadata, ProcessedContent]]
+    ) -> Iterator[str]:
+        """
+        Generate XML for a batch of articles with this generator, so the DTD
+        check and logger setup are paid once for the whole batch.
+
+        Args:
+            articles: (journal_meta, article_meta, processed_content) triples.
+
+        Returns:
+            An iterator over the XML strings, in input order.
+        """
+        for journal_meta, article_meta, processed_content in articles:
+            yield self.generate(journal_meta, article_meta, processed_content)
+
+    def _build_article_tree(
+        self,
+        journal_meta: JournalMetadata,
+        article_meta: ArticleMetadata,
+        processed_content: ProcessedContent
+    ) -> etree.Element:
+        """
+        Build the <article> tree with front matter and body, and an empty
+        <back> for the references.
+        """
+        # Fallback dates (article id, year, copyright) share one clock reading
+        now = datetime.now()
+
         # 1. Create root <article> with proper namespaces
-        # Define XML namespaces
-        nsmap = {
-            'xlink': 'http://www.w3.org/1999/xlink',
-            'xml': 'http://www.w3.org/XML/1998/namespace'
-        }
-        root = etree.Element("article", nsmap=nsmap)
+        root = etree.Element("article", nsmap=_ARTICLE_NSMAP)
         root.set("dtd-version", self.config.dtd_version)
         root.set("article-type", article_meta.article_type or "research-article")
         # Set xml:lang attribute using proper namespace
@@ -169,25 +319,19 @@ class XMLGenerator:
         # 2. Build <front> (journal-meta, article-meta)
         front = etree.SubElement(root, "front")
         self._build_journal_meta(front, journal_meta)
-        self._build_article_meta(front, article_meta, processed_content)
+        self._build_article_meta(front, article_meta, processed_content, now)
 
         # 3. Build <body> from processed_content.sections
         body = etree.SubElement(root, "body")
         self._build_body(body, processed_content)
 
-        # 4. Build <back> with references (if any)
-        back = etree.SubElement(root, "back")
-        if processed_content.references:
-            self._build_references(back, processed_content.references)
+        # 4. Add <back>; references are added by the caller
+        etree.SubElement(root, "back")
 
         # 5. Final validation to ensure required elements exist
-        self._ensure_required_elements(root, journal_meta, article_meta, processed_content)
+        self._ensure_required_elements(root, journal_meta, article_meta, processed_content, now)
 
-        # 6. Convert the element tree to a string with DOCTYPE
-        xml_string = self._generate_xml_string(root)
-
-        self.logger.info("XML generation complete.")
-        return xml_string
+        return root
 
     # ----------------------------------------------------------------------
     # FRONT: Journal + Article Metadata
@@ -195,7 +339,15 @@ class XMLGenerator:
 
     def _build_journal_meta(self, parent: etree.Element, jmeta: JournalMetadata) -> None:
         """Create <journal-meta> element with journal metadata."""
-        journal_meta_elem = etree.SubElement(parent, "journal-meta")
+        # Later steps may add to journal-meta, so each article gets its own copy
+        parent.append(copy.deepcopy(self._journal_meta_template))
+
+    def _build_journal_meta_template(self) -> etree.Element:
+        """
+        Build the <journal-meta> subtree once. It only holds the constant JCAD
+        data, not anything from the article.
+        """
+        journal_meta_elem = etree.Element("journal-meta")
 
         # Always use JCAD data for consistency
         journal_id_elem = etree.SubElement(journal_meta_elem, "journal-id")
@@ -217,12 +369,15 @@ class XMLGenerator:
         publisher_name = etree.SubElement(publisher_elem, "publisher-name")
         publisher_name.text = self.config.JOURNAL_METADATA['publisher']
 
-    def _build_article_meta(self, parent: etree.Element, ameta: ArticleMetadata, content: ProcessedContent) -> None:
+        return journal_meta_elem
+
+    def _build_article_meta(self, parent: etree.Element, ameta: ArticleMetadata, content: ProcessedContent,
+                            now: datetime) -> None:
         """Create complete <article-meta> with all required PubMed elements."""
         article_meta_elem = etree.SubElement(parent, "article-meta")
 
         # 1. Article IDs
-        self._build_article_ids(article_meta_elem, ameta)
+        self._build_article_ids(article_meta_elem, ameta, now)
         
         # 2. Article Categories
         self._build_article_categories(article_meta_elem, ameta)
@@ -237,7 +392,7 @@ class XMLGenerator:
         self._build_author_notes(article_meta_elem, ameta)
         
         # 6. Publication Dates
-        self._build_pub_dates(article_meta_elem, ameta)
+        self._build_pub_dates(article_meta_elem, ameta, now)
         
         # 7. Volume/Issue/Pagination
         self._build_issue_data(article_meta_elem, ameta)
@@ -246,9 +401,9 @@ class XMLGenerator:
         self._build_abstract_block(article_meta_elem, content)
         
         # 9. Permissions Block
-        self._build_permissions(article_meta_elem, ameta)
+        self._build_permissions(article_meta_elem, ameta, now)
 
-    def _build_article_ids(self, parent: etree.Element, ameta: ArticleMetadata) -> None:
+    def _build_article_ids(self, parent: etree.Element, ameta: ArticleMetadata, now: datetime) -> None:
         """Build article identifiers section."""
         # Generate article ID if not provided
         article_id = ameta.article_id
@@ -256,12 +411,11 @@ class XMLGenerator:
             # Try to create a meaningful ID based on title or current timestamp
             if ameta.title and ameta.title != "Untitled":
                 # Convert title to slug-like ID (lowercase, only alphanumeric and underscore)
-                slug = re.sub(r'[^a-z0-9]', '_', ameta.title.lower())
-                slug = re.sub(r'_+', '_', slug)  # Replace multiple underscores with one
+                slug = _SLUG_SEPARATOR_RE.sub('_', ameta.title.lower())
                 article_id = slug[:50]  # Limit length
             else:
                 # Use timestamp if no meaningful title
-                article_id = f"article-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+                article_id = f"article-{now.strftime('%Y%m%d%H%M%S')}"
         
         # Add the publisher ID
         id_elem = etree.SubElement(parent, "article-id")
@@ -281,57 +435,23 @@ class XMLGenerator:
         
         # Add primary category based on article type
         subject = etree.SubElement(subj_group, "subject")
-        if ameta.article_type == "research-article":
-            subject.text = "Original Research"
-        elif ameta.article_type == "review-article" or ameta.article_type == "review":
-            subject.text = "Review Article"
-        elif ameta.article_type == "case-report":
-            subject.text = "Case Report"
-        elif ameta.article_type == "letter":
-            subject.text = "Letter to the Editor"
-        elif ameta.article_type == "editorial":
-            subject.text = "Editorial"
-        elif ameta.article_type == "abstract":
-            subject.text = "Abstract"
-        else:
+        subject_text = _ARTICLE_TYPE_SUBJECTS.get(ameta.article_type)
+        if subject_text:
+            subject.text = subject_text
+        elif ameta.keywords:
             # If keywords available, use first one as subject
-            if hasattr(ameta, 'keywords') and ameta.keywords:
-                subject.text = ameta.keywords[0]
-            else:
-                # Default fallback - use capitalized article type
-                subject.text = ameta.article_type.replace("-", " ").title()
+            subject.text = ameta.keywords[0]
+        else:
+            # Default fallback - use capitalized article type
+            subject.text = ameta.article_type.replace("-", " ").title()
 
     def _build_title_group(self, parent: etree.Element, ameta: ArticleMetadata) -> None:
         """Build title group with main title."""
         title_group = etree.SubElement(parent, "title-group")
         
-        # Main article title
+        # Main article title; lxml escapes markup characters on serialization
         article_title = etree.SubElement(title_group, "article-title")
-        
-        # Clean title text - replace character entities
-        title_text = ameta.title or "Untitled Article"
-        title_text = self._clean_text_for_xml(title_text)
-        
-        article_title.text = title_text
-
-    def _clean_text_for_xml(self, text: str) -> str:
-        """Clean text for XML by replacing problematic characters."""
-        if not text:
-            return ""
-            
-        # Replace common characters that need entities
-        replacements = {
-            '&': '&amp;',
-            '<': '&lt;',
-            '>': '&gt;',
-            '"': '&quot;',
-            "'": '&apos;',
-        }
-        
-        for char, entity in replacements.items():
-            text = text.replace(char, entity)
-            
-        return text
+        article_title.text = ameta.title or "Untitled Article"
 
     def _build_contrib_group(self, parent: etree.Element, ameta: ArticleMetadata) -> None:
         """Build contributor group with complete author information."""
@@ -342,11 +462,10 @@ class XMLGenerator:
         contrib_group = etree.SubElement(parent, "contrib-group")
         
         # Track all unique affiliations
-        all_affiliations = {}
-        for author in ameta.authors:
-            for aff in author.affiliations:
-                if aff and aff not in all_affiliations:
-                    all_affiliations[aff] = len(all_affiliations) + 1
+        unique_affiliations = dict.fromkeys(
+            aff for author in ameta.authors for aff in author.affiliations if aff
+        )
+        all_affiliations = {aff: i for i, aff in enumerate(unique_affiliations, 1)}
         
         # Add each author
         for i, author in enumerate(ameta.authors):
@@ -384,8 +503,8 @@ class XMLGenerator:
             
             # Add affiliation references
             for aff_text in author.affiliations:
-                if aff_text in all_affiliations:
-                    aff_id = all_affiliations[aff_text]
+                aff_id = all_affiliations.get(aff_text)
+                if aff_id:
                     xref = etree.SubElement(contrib, "xref")
                     xref.set("ref-type", "aff")
                     xref.set("rid", f"aff{aff_id}")
@@ -454,7 +573,7 @@ class XMLGenerator:
             p = etree.SubElement(fn, "p")
             p.text = ameta.conflict_statement
 
-    def _build_pub_dates(self, parent: etree.Element, ameta: ArticleMetadata) -> None:
+    def _build_pub_dates(self, parent: etree.Element, ameta: ArticleMetadata, now: datetime) -> None:
         """Build publication dates section."""
         # Create pub-date element
         pub_date = etree.SubElement(parent, "pub-date")
@@ -472,12 +591,8 @@ class XMLGenerator:
                     try:
                         month_num = int(month_value)
                         if 1 <= month_num <= 12:
-                            month_names = [
-                                "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
-                            ]
                             season = etree.SubElement(pub_date, "season")
-                            season.text = month_names[month_num - 1]
+                            season.text = _MONTH_ABBREVIATIONS[month_num - 1]
                     except ValueError:
                         # If conversion fails, just use as-is
                         month = etree.SubElement(pub_date, "month")
@@ -494,7 +609,7 @@ class XMLGenerator:
             else:
                 # Default to current year if missing
                 year = etree.SubElement(pub_date, "year")
-                year.text = str(datetime.now().year)
+                year.text = str(now.year)
             
             # Add day if available
             if 'day' in ameta.publication_date:
@@ -503,7 +618,7 @@ class XMLGenerator:
         else:
             # Default to current year
             year = etree.SubElement(pub_date, "year")
-            year.text = str(datetime.now().year)
+            year.text = str(now.year)
 
     def _build_issue_data(self, parent: etree.Element, ameta: ArticleMetadata) -> None:
         """Build volume, issue, and page number elements."""
@@ -529,29 +644,26 @@ class XMLGenerator:
         if content.abstract:
             abstract_elem = etree.SubElement(parent, "abstract")
             
-            # Clean abstract text
-            abstract_text = self._clean_text_for_xml(content.abstract)
-            
             # If abstract has paragraphs, split them
-            paragraphs = abstract_text.split('\n\n')
-            for para in paragraphs:
-                if para.strip():
+            for para in _ABSTRACT_PARA_RE.split(content.abstract):
+                para = para.strip()
+                if para:
                     p_elem = etree.SubElement(abstract_elem, "p")
-                    p_elem.text = para.strip()
+                    p_elem.text = para
         
         # Add keywords if present
-        if hasattr(content, 'keywords') and content.keywords:
+        if content.keywords:
             kwd_group = etree.SubElement(parent, "kwd-group")
             for kw in content.keywords:
                 kwd_elem = etree.SubElement(kwd_group, "kwd")
                 kwd_elem.text = kw.strip()
 
-    def _build_permissions(self, parent: etree.Element, ameta: ArticleMetadata) -> None:
+    def _build_permissions(self, parent: etree.Element, ameta: ArticleMetadata, now: datetime) -> None:
         """Build permissions block with copyright information."""
         permissions = etree.SubElement(parent, "permissions")
         
         # Copyright statement
-        copyright_year = ameta.publication_date.get("year", datetime.now().year)
+        copyright_year = ameta.publication_date.get("year", now.year)
         publisher_name = self.config.JOURNAL_METADATA['publisher']
         
         copyright_statement = etree.SubElement(permissions, "copyright-statement")
@@ -575,32 +687,44 @@ class XMLGenerator:
         ref_list = etree.SubElement(parent, "ref-list")
         
         # Title for reference list
-        title = etree.SubElement(ref_list, "title")
-        title.text = "REFERENCES"
+        ref_list.append(self._build_ref_list_title())
         
         # Add each reference
         for i, ref in enumerate(references, 1):
-            # Get reference ID - use ref.ref_id if available, otherwise use index
-            ref_id = ref.ref_id or str(i)
-            
-            ref_elem = etree.SubElement(ref_list, "ref")
-            ref_elem.set("id", f"B{ref_id}")  # Using B prefix for bibliography
-            
-            # Create mixed-citation element
-            mixed_citation = etree.SubElement(ref_elem, "mixed-citation")
-            mixed_citation.set("publication-type", ref.reference_type or "journal")
-            
-            # If we have structured data, build structured citation
-            if ref.authors or ref.year or ref.title or ref.journal:
-                self._build_structured_citation(mixed_citation, ref)
-            else:
-                # Just use raw text if no structured data
-                mixed_citation.text = self._clean_text_for_xml(ref.raw_text)
+            self._build_reference(ref_list, ref, i)
+
+    def _build_ref_list_title(self) -> etree.Element:
+        """Create the <title> of the reference list."""
+        title = etree.Element("title")
+        title.text = "REFERENCES"
+        return title
+
+    def _build_reference(self, parent: etree.Element, ref: ReferenceData, index: int) -> None:
+        """Add one <ref> with its <mixed-citation> to parent."""
+        # Get reference ID - use ref.ref_id if available, otherwise use index
+        ref_id = ref.ref_id or str(index)
+        
+        ref_elem = etree.SubElement(parent, "ref")
+        ref_elem.set("id", f"B{ref_id}")  # Using B prefix for bibliography
+        
+        # Create mixed-citation element
+        mixed_citation = etree.SubElement(ref_elem, "mixed-citation")
+        mixed_citation.set("publication-type", ref.reference_type or "journal")
+        
+        # If we have structured data, build structured citation
+        if ref.authors or ref.year or ref.title or ref.journal:
+            self._build_structured_citation(mixed_citation, ref)
+        else:
+            # Just use raw text if no structured data
+            mixed_citation.text = ref.raw_text
 
     def _build_structured_citation(self, parent: etree.Element, ref: ReferenceData) -> None:
         """Build a structured citation with parsed components."""
-        # Track the last element added to set tails correctly
+        # Track the last element added, and the separator text that follows it
+        # (the citation's leading text until an element exists). The text is
+        # set once, when the next element is added or at the end
         last_elem = None
+        pending = ""
         
         # 1. Authors
         if ref.authors:
@@ -609,16 +733,10 @@ class XMLGenerator:
                 if i > 0:
                     if i == len(ref.authors) - 1:
                         # Last author - add "and"
-                        if last_elem is not None:
-                            last_elem.tail = " and "
-                        else:
-                            parent.text = parent.text + " and " if parent.text else " and "
+                        pending = " and "
                     else:
                         # Not last author - add comma
-                        if last_elem is not None:
-                            last_elem.tail = ", "
-                        else:
-                            parent.text = parent.text + ", " if parent.text else ", "
+                        pending = ", "
                 
                 # Parse author name
                 name_parts = author.split(",", 1)
@@ -635,7 +753,8 @@ class XMLGenerator:
                         given_names = ""
                 
                 # Create name element
-                name_elem = etree.SubElement(parent, "string-name")
+                name_elem = self._append_citation_part(parent, last_elem, pending, "string-name")
+                pending = ""
                 
                 # Add surname
                 surname_elem = etree.SubElement(name_elem, "surname")
@@ -652,25 +771,21 @@ class XMLGenerator:
         # 2. Year
         if ref.year:
             # Add separator after authors
-            if last_elem is not None:
-                last_elem.tail = last_elem.tail + " " if last_elem.tail else " "
-                last_elem.tail += f"({ref.year})"
-            else:
-                parent.text = parent.text + " " if parent.text else ""
-                parent.text += f"({ref.year})"
+            if last_elem is not None or pending:
+                pending += " "
+            pending += f"({ref.year})"
             
             # No element added for year, keep last_elem the same
         
         # 3. Title
         if ref.title:
             # Add period after authors/year
-            if last_elem is not None:
-                last_elem.tail = last_elem.tail + ". " if last_elem.tail else ". "
-            else:
-                parent.text = parent.text + ". " if parent.text else ""
+            if last_elem is not None or pending:
+                pending += ". "
             
             # Create article-title element
-            article_title = etree.SubElement(parent, "article-title")
+            article_title = self._append_citation_part(parent, last_elem, pending, "article-title")
+            pending = ""
             article_title.text = ref.title.strip()
             
             # Update last element
@@ -679,13 +794,12 @@ class XMLGenerator:
         # 4. Journal
         if ref.journal:
             # Add period after title
-            if last_elem is not None:
-                last_elem.tail = last_elem.tail + ". " if last_elem.tail else ". "
-            else:
-                parent.text = parent.text + ". " if parent.text else ""
+            if last_elem is not None or pending:
+                pending += ". "
             
             # Create source element
-            source = etree.SubElement(parent, "source")
+            source = self._append_citation_part(parent, last_elem, pending, "source")
+            pending = ""
             source.text = ref.journal.strip()
             
             # Update last element
@@ -697,13 +811,12 @@ class XMLGenerator:
         # Add volume if available
         if ref.volume:
             # Add space after journal
-            if last_elem is not None:
-                last_elem.tail = last_elem.tail + " " if last_elem.tail else " "
-            else:
-                parent.text = parent.text + " " if parent.text else ""
+            if last_elem is not None or pending:
+                pending += " "
             
             # Create volume element
-            volume = etree.SubElement(parent, "volume")
+            volume = self._append_citation_part(parent, last_elem, pending, "volume")
+            pending = ""
             volume.text = ref.volume.strip()
             
             # Update last element
@@ -712,14 +825,12 @@ class XMLGenerator:
             
             # Add issue if available
             if ref.issue:
-                last_elem.tail = last_elem.tail + "(" if last_elem.tail else "("
-                
                 # Create issue element
-                issue = etree.SubElement(parent, "issue")
+                issue = self._append_citation_part(parent, last_elem, "(", "issue")
                 issue.text = ref.issue.strip()
                 
                 # Add closing parenthesis
-                issue.tail = ")"
+                pending = ")"
                 
                 # Update last element
                 last_elem = issue
@@ -727,39 +838,29 @@ class XMLGenerator:
         
         # Add pages if available
         if ref.pages:
-            # Add separator after volume/issue
-            if vol_issue_added:
-                if last_elem is not None:
-                    last_elem.tail = last_elem.tail + ":" if last_elem.tail else ":"
-                else:
-                    parent.text = parent.text + ":" if parent.text else ""
-            else:
-                # No volume/issue - add space if needed
-                if last_elem is not None:
-                    last_elem.tail = last_elem.tail + " " if last_elem.tail else " "
-                else:
-                    parent.text = parent.text + " " if parent.text else ""
+            # Add separator after volume/issue, or a space if there is none
+            if last_elem is not None or pending:
+                pending += ":" if vol_issue_added else " "
             
             # Try to split pages into first and last
             if "-" in ref.pages:
                 fpage, lpage = ref.pages.split("-", 1)
                 
                 # Create fpage element
-                fpage_elem = etree.SubElement(parent, "fpage")
+                fpage_elem = self._append_citation_part(parent, last_elem, pending, "fpage")
                 fpage_elem.text = fpage.strip()
                 
-                # Add hyphen
-                fpage_elem.tail = "-"
-                
-                # Create lpage element
-                lpage_elem = etree.SubElement(parent, "lpage")
+                # Create lpage element after a hyphen
+                lpage_elem = self._append_citation_part(parent, fpage_elem, "-", "lpage")
+                pending = ""
                 lpage_elem.text = lpage.strip()
                 
                 # Update last element
                 last_elem = lpage_elem
             else:
                 # Single page - use fpage only
-                fpage_elem = etree.SubElement(parent, "fpage")
+                fpage_elem = self._append_citation_part(parent, last_elem, pending, "fpage")
+                pending = ""
                 fpage_elem.text = ref.pages.strip()
                 
                 # Update last element
@@ -768,13 +869,12 @@ class XMLGenerator:
         # 6. DOI
         if ref.doi:
             # Add period after volume/issue/pages
-            if last_elem is not None:
-                last_elem.tail = last_elem.tail + ". " if last_elem.tail else ". "
-            else:
-                parent.text = parent.text + ". " if parent.text else ""
+            if last_elem is not None or pending:
+                pending += ". "
             
             # Create pub-id element
-            pub_id = etree.SubElement(parent, "pub-id")
+            pub_id = self._append_citation_part(parent, last_elem, pending, "pub-id")
+            pending = ""
             pub_id.set("pub-id-type", "doi")
             pub_id.text = ref.doi.strip()
             
@@ -782,46 +882,72 @@ class XMLGenerator:
             last_elem = pub_id
         
         # Ensure final period
-        if last_elem is not None and not (last_elem.tail and last_elem.tail.rstrip().endswith('.')):
-            last_elem.tail = last_elem.tail + "." if last_elem.tail else "."
+        if last_elem is not None:
+            if not pending.rstrip().endswith('.'):
+                pending += "."
+            last_elem.tail = pending
+        elif pending:
+            parent.text = pending
+
+    @staticmethod
+    def _append_citation_part(parent: etree.Element, last_elem: Optional[etree.Element],
+                              separator: str, tag: str) -> etree.Element:
+        """
+        Add a tag element to a citation, putting separator text after the
+        previous element (or before the first one).
+        """
+        if last_elem is not None:
+            last_elem.tail = separator
+        elif separator:
+            parent.text = separator
+        return etree.SubElement(parent, tag)
 
     def _ensure_required_elements(self, root: etree.Element, 
                                 journal_meta: JournalMetadata, 
                                 article_meta: ArticleMetadata,
-                                content: ProcessedContent) -> None:
+                                content: ProcessedContent,
+                                now: datetime) -> None:
         """
         Final validation to ensure all required elements are present.
         Add any missing critical elements.
         """
+        journal_metadata = self.config.JOURNAL_METADATA
+        current_year = str(now.year)
+
+        # Find the first element of each checked tag in one walk of the tree
+        found = {}
+        for elem in root.iter(*_ENSURED_TAGS):
+            found.setdefault(elem.tag, elem)
+
         # 1. Ensure journal metadata is correct (JCAD)
-        journal_id = root.find(".//journal-id")
+        journal_id = found.get("journal-id")
         if journal_id is not None:
-            journal_id.text = self.config.JOURNAL_METADATA['id']
+            journal_id.text = journal_metadata['id']
             
-        journal_title = root.find(".//journal-title")
+        journal_title = found.get("journal-title")
         if journal_title is not None:
-            journal_title.text = self.config.JOURNAL_METADATA['title']
+            journal_title.text = journal_metadata['title']
             
-        issn = root.find(".//issn")
+        issn = found.get("issn")
         if issn is None:
             # Add ISSN if missing
-            journal_meta_elem = root.find(".//journal-meta")
+            journal_meta_elem = found.get("journal-meta")
             if journal_meta_elem is not None:
                 issn = etree.SubElement(journal_meta_elem, "issn")
                 issn.set("pub-type", "ppub")
-                issn.text = self.config.JOURNAL_METADATA['issn']
+                issn.text = journal_metadata['issn']
         
         # 2. Ensure article title exists
-        title_group = root.find(".//title-group")
-        article_title = root.find(".//article-title")
+        title_group = found.get("title-group")
+        article_title = found.get("article-title")
         if title_group is not None and article_title is None:
             # Add article title
             article_title = etree.SubElement(title_group, "article-title")
             article_title.text = article_meta.title or "Untitled Article"
         
         # 3. Ensure at least one author exists
-        contrib_group = root.find(".//contrib-group")
-        if contrib_group is not None and len(contrib_group.findall(".//contrib")) == 0:
+        contrib_group = found.get("contrib-group")
+        if contrib_group is not None and contrib_group.find("contrib") is None:
             # Add placeholder author if none exists
             contrib = etree.SubElement(contrib_group, "contrib")
             contrib.set("contrib-type", "author")
@@ -833,7 +959,7 @@ class XMLGenerator:
             given_names.text = "Author"
         
         # 4. Ensure body has content
-        body = root.find(".//body")
+        body = found.get("body")
         if body is not None and len(body) == 0:
             # Add at least one section with content
             sec = etree.SubElement(body, "sec")
@@ -841,29 +967,28 @@ class XMLGenerator:
             p.text = "Article content not available."
             
         # 5. Ensure publication date has a year
-        pub_date = root.find(".//pub-date")
+        pub_date = found.get("pub-date")
         if pub_date is not None and pub_date.find(".//year") is None:
             # Add current year
             year = etree.SubElement(pub_date, "year")
-            year.text = str(datetime.now().year)
+            year.text = current_year
             
         # 6. Ensure permissions exist
-        permissions = root.find(".//permissions")
+        permissions = found.get("permissions")
         if permissions is None:
             # Add permissions block
-            article_meta_elem = root.find(".//article-meta")
+            article_meta_elem = found.get("article-meta")
             if article_meta_elem is not None:
                 permissions = etree.SubElement(article_meta_elem, "permissions")
                 
                 # Add copyright statement
-                copyright_year = datetime.now().year
-                publisher_name = self.config.JOURNAL_METADATA['publisher']
+                publisher_name = journal_metadata['publisher']
                 
                 copyright_statement = etree.SubElement(permissions, "copyright-statement")
-                copyright_statement.text = f"Copyright © {copyright_year}. {publisher_name}. All rights reserved."
+                copyright_statement.text = f"Copyright © {current_year}. {publisher_name}. All rights reserved."
                 
                 copyright_year_elem = etree.SubElement(permissions, "copyright-year")
-                copyright_year_elem.text = str(copyright_year)
+                copyright_year_elem.text = current_year
                 
                 copyright_holder = etree.SubElement(permissions, "copyright-holder")
                 copyright_holder.text = publisher_name
@@ -873,23 +998,23 @@ class XMLGenerator:
         Convert the lxml ElementTree to a string, including XML declaration
         and DOCTYPE referencing the local DTD.
         """
-        # 1. Create XML declaration
-        xml_declaration = '<?xml version="1.0" encoding="UTF-8"?>\n'
-
-        # 2. Get DOCTYPE from config
-        doctype_str = self.config.get_doctype_declaration()
-
-        # 3. Convert the XML tree to a string (without its own XML declaration)
-        xml_content = etree.tostring(
+        # lxml writes the XML declaration, DOCTYPE and tree into one buffer
+        xml_bytes = etree.tostring(
             root,
-            encoding='unicode',
+            encoding='UTF-8',
             pretty_print=True,
-            xml_declaration=False
+            xml_declaration=True,
+            doctype=self.config.get_doctype_declaration().rstrip('\n')
         )
+        return xml_bytes.decode('utf-8')
 
-        # 4. Combine all parts
-        final_xml = xml_declaration + doctype_str + xml_content
-        return final_xml
+    def _xml_header(self) -> str:
+        """
+        XML declaration followed by the DOCTYPE referencing the local DTD,
+        written the same way etree.tostring writes them.
+        """
+        xml_declaration = "<?xml version='1.0' encoding='UTF-8'?>\n"
+        return xml_declaration + self.config.get_doctype_declaration()
 
     def _build_body(self, parent: etree.Element, content: ProcessedContent) -> None:
         """
@@ -912,113 +1037,60 @@ class XMLGenerator:
             sec_elem = etree.SubElement(parent, "sec")
             
             # Add section title if present
-            if section.title and section.title.strip():
+            title = section.title.strip() if section.title else ""
+            if title:
                 title_elem = etree.SubElement(sec_elem, "title")
-                title_elem.text = section.title.strip()
+                title_elem.text = title
 
             # Convert each paragraph to <p>
             for paragraph in section.paragraphs:
-                if not paragraph or not paragraph.strip():
+                stripped = paragraph.strip() if paragraph else ""
+                if not stripped:
                     continue
                     
                 p_elem = etree.SubElement(sec_elem, "p")
                 
-                # Process paragraph for citations
-                paragraph = self._clean_text_for_xml(paragraph)
-                
                 # Check for citation references like [1], [2], etc.
                 if self._has_citation_refs(paragraph):
                     # Process paragraph with citations
                     self._process_paragraph_with_citations(p_elem, paragraph)
                 else:
                     # Simple paragraph without citations
-                    p_elem.text = paragraph.strip()
+                    p_elem.text = stripped
 
     def _has_citation_refs(self, text: str) -> bool:
         """Check if paragraph contains citation references."""
-        citation_patterns = [
-            r'\[\d+\]',                      # [1]
-            r'\[\d+(?:[-,]\d+)*\]',          # [1,2] or [1-3]
-            r'\(\d{4}\)',                    # (2020)
-            r'\([A-Za-z]+ et al\.\)',        # (Smith et al.)
-            r'\([A-Za-z]+ and [A-Za-z]+, \d{4}\)'  # (Smith and Jones, 2020)
-        ]
-        
-        return any(re.search(pattern, text) for pattern in citation_patterns)
+        return _CITATION_DETECT_RE.search(text) is not None
 
     def _process_paragraph_with_citations(self, parent: etree.Element, text: str) -> None:
         """
         Parse a paragraph with citation references.
         Converts [1], [2], etc. to <xref ref-type="bibr" rid="B1">[1]</xref>
         """
-        # Pattern for [n] style references
-        numeric_pattern = re.compile(r'\[(\d+(?:[-,]\d+)*)\]')
-        
-        # Find all citation matches
-        matches = list(numeric_pattern.finditer(text))
-        
-        if not matches:
-            # No numeric citations found, just set the text
-            parent.text = text
-            return
-            
-        # Sort matches by position (from end to beginning)
-        matches.sort(key=lambda m: m.start(), reverse=True)
-        
-        # Replace each citation from end to beginning
-        for match in matches:
-            ref_nums = match.group(1)
-            start = match.start()
-            end = match.end()
-            
-            # Check if we're dealing with a range or comma-separated list
-            if '-' in ref_nums:
-                # Range like [1-3]
-                start_num, end_num = ref_nums.split('-')
-                ref_ids = list(range(int(start_num), int(end_num) + 1))
-                ref_primary = start_num  # Use first number for the rid
-            elif ',' in ref_nums:
-                # List like [1,2,3]
-                ref_ids = [int(n) for n in ref_nums.split(',')]
-                ref_primary = ref_nums.split(',')[0]  # Use first number
-            else:
-                # Single reference [1]
-                ref_ids = [int(ref_nums)]
-                ref_primary = ref_nums
-            
-            # Text before and after this citation
-            pre_text = text[:start]
-            post_text = text[end:]
-            
-            # Create a placeholder for this citation
-            text = pre_text + f"__CITATION_R{ref_primary}__" + post_text
-        
-        # Process the modified text with placeholders
-        parts = re.split(r'(__CITATION_R\d+__)', text)
-        
-        # First part is regular text
-        parent.text = parts[0] if parts else ""
-        
-        # Process all parts
+        # Walk the citations in order. Each <xref> is added under the previous
+        # one; the text before a citation goes into the paragraph's text or
+        # the previous xref's tail
         current_element = parent
-        
-        for i in range(1, len(parts), 2):
-            if i >= len(parts):
-                break
-                
-            # Get citation placeholder
-            placeholder = parts[i]
-            ref_num = placeholder.replace("__CITATION_R", "").replace("__", "")
-            
-            # Create xref element
+        pos = 0
+        for match in _CITATION_NUMERIC_RE.finditer(text):
+            before = text[pos:match.start()]
+            if current_element is parent:
+                parent.text = before
+            else:
+                current_element.tail = before
+
+            # Lists [1,2,3] and ranges [1-3] link to their first reference
+            ref_num = match.group(1)
             xref = etree.SubElement(current_element, "xref")
             xref.set("ref-type", "bibr")
             xref.set("rid", f"B{ref_num}")  # Using B for bibliography/reference
             xref.text = f"[{ref_num}]"
-            
-            # Set text after this citation (if any)
-            if i + 1 < len(parts):
-                xref.tail = parts[i + 1]
-            
-            # Update current element
-            current_element = xref
\ No newline at end of file
+
+            current_element = xref
+            pos = match.end()
+
+        # Text after the last citation (the whole paragraph if there is none)
+        if current_element is parent:
+            parent.text = text
+        else:
+            current_element.tail = text[pos:]
\ No newline at end of file
@@ -1,12 +1,49 @@
+import io
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, TextIO
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 import re
+import threading
 from lxml import etree
+import json
 import os
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json encoder
+    orjson = None
+
+# Element name mentioned in a libxml2 DTD error message
+_DTD_ERROR_ELEMENT_RE = re.compile(r'Element ([\w-]+)')
+
+# Suggestions for DTD errors, as (message phrase, suggestion) pairs; the
+# first phrase found in the message wins
+_DTD_ERROR_SUGGESTIONS = (
+    ("Element x not allowed",
+     "Remove this element or replace with an allowed element"),
+    ("Element x content does not follow",
+     "Check element order and required child elements"),
+    ("no declaration for",
+     "This element is not defined in the DTD. Check spelling or use a different element."),
+    ("required but not found",
+     "Add the required element"),
+    ("attribute x not allowed",
+     "Remove this attribute or check attribute name spelling"),
+)
+
+@lru_cache(maxsize=None)
+def _load_dtd(dtd_path: str) -> Tuple[etree.DTD, threading.Lock]:
+    """
+    Parse a DTD file once per process, for every validator that uses it.
+    The DTD keeps its error log on itself, so it comes with the lock that
+    validations against it must hold.
+    """
+    with open(dtd_path, 'rb') as dtd_file:
+        return etree.DTD(dtd_file), threading.Lock()
+
 @dataclass
 class ValidationError:
     """Structured validation error."""
@@ -25,6 +62,21 @@ class ValidationResult:
     warnings: List[ValidationError] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
 
+    def to_dict(self) -> Dict:
+        """Plain dict of the result; the timestamp is rendered with str()."""
+        return {
+            'is_valid': self.is_valid,
+            'errors': [vars(error).copy() for error in self.errors],
+            'warnings': [vars(warning).copy() for warning in self.warnings],
+            'timestamp': str(self.timestamp),
+        }
+
+    def to_json(self) -> bytes:
+        """UTF-8 JSON of to_dict(), indented by two spaces."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False).encode('utf-8')
+
 class XMLValidator:
     """PubMed DTD 2.3 XML validator with enhanced error reporting."""
 
@@ -32,6 +84,9 @@ class XMLValidator:
         """Initialize validator with DTD path."""
         self.base_dir = Path(__file__).parent.parent.parent
         self.dtd_path = dtd_path or str(self.base_dir / "config" / "nlm-dtd-2.3" / "journalpublishing.dtd")
+        # lxml parsers must not be shared between threads, so each thread
+        # keeps its own once created
+        self._thread_local = threading.local()
         self._setup_logging()
         self._setup_validation_rules()
 
@@ -41,13 +96,15 @@ class XMLValidator:
         self.logger.setLevel(logging.INFO)
 
         if not self.logger.handlers:
-            # Console handler
-            console_handler = logging.StreamHandler()
             console_formatter = logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             )
-            console_handler.setFormatter(console_formatter)
-            self.logger.addHandler(console_handler)
+
+            # Console handler, unless the application already configured one
+            if not self.logger.hasHandlers():
+                console_handler = logging.StreamHandler()
+                console_handler.setFormatter(console_formatter)
+                self.logger.addHandler(console_handler)
 
             # File handler
             log_dir = Path("logs")
@@ -91,6 +148,19 @@ class XMLValidator:
             ]
         }
 
+        # allowed_values split into (element path, element name, attribute,
+        # allowed set, suggestion) once, for _check_attribute_values
+        self._attribute_rules = []
+        for xpath, allowed in self.allowed_values.items():
+            parts = xpath.split('/@')
+            if len(parts) != 2:
+                continue
+            element_path, attr_name = parts
+            self._attribute_rules.append(
+                (f".//{element_path}", element_path.split('/')[-1], attr_name,
+                 frozenset(allowed), f"Allowed values: {', '.join(allowed)}")
+            )
+
     def validate(self, xml_content: str) -> ValidationResult:
         """Validate XML against PubMed rules and DTD."""
         validation_errors = []
@@ -98,7 +168,7 @@ class XMLValidator:
         
         try:
             # Parse XML
-            parser = self._create_parser()
+            parser = self._get_parser()
             root = etree.fromstring(xml_content.encode('utf-8'), parser)
             
             # 1. DTD Validation
@@ -133,7 +203,7 @@ class XMLValidator:
         """Check presence of critical PubMed elements."""
         # Check required elements
         for xpath, message in self.required_elements.items():
-            if not root.findall(f".//{xpath.replace('/', '/')}"):
+            if not root.findall(f".//{xpath}"):
                 errors.append(ValidationError(
                     element=xpath.split('/')[-1],
                     message=message,
@@ -143,7 +213,7 @@ class XMLValidator:
         
         # Check recommended elements
         for xpath, message in self.recommended_elements.items():
-            if not root.findall(f".//{xpath.replace('/', '/')}"):
+            if not root.findall(f".//{xpath}"):
                 warnings.append(ValidationError(
                     element=xpath.split('/')[-1],
                     message=message,
@@ -153,40 +223,42 @@ class XMLValidator:
 
     def _check_attribute_values(self, root: etree.Element, errors: List[ValidationError]):
         """Check attribute values against allowed lists."""
-        for xpath, allowed in self.allowed_values.items():
-            # Split into element and attribute
-            parts = xpath.split('/@')
-            if len(parts) != 2:
-                continue
-                
-            element_path, attr_name = parts
-                
-            # Find elements
-            elements = root.findall(f".//{element_path.replace('/', '/')}")
-            for element in elements:
+        for element_path, element_name, attr_name, allowed, suggestion in self._attribute_rules:
+            for element in root.findall(element_path):
                 value = element.get(attr_name)
                 if value and value not in allowed:
                     errors.append(ValidationError(
-                        element=element_path.split('/')[-1],
+                        element=element_name,
                         message=f"Invalid value '{value}' for attribute {attr_name}",
                         severity="error",
-                        suggestion=f"Allowed values: {', '.join(allowed)}"
+                        suggestion=suggestion
                     ))
 
     def _check_author_content(self, root: etree.Element, errors: List[ValidationError], warnings: List[ValidationError]):
         """Validate author information."""
+        # The parts of a contrib and a ref checked here are direct children
+        # in JATS, so only the children are searched, not the whole subtree
         for i, contrib in enumerate(root.findall(".//contrib[@contrib-type='author']"), 1):
+            # Collect the first child of each kind checked below in one pass;
+            # xrefs are keyed by their ref-type
+            parts = {}
+            for child in contrib:
+                key = child.tag
+                if key == "xref":
+                    key = f"xref-{child.get('ref-type')}"
+                parts.setdefault(key, child)
+
             # Check for name components
-            name = contrib.find(".//name")
+            name = parts.get("name")
             if name is not None:
-                if not name.find(".//surname"):
+                if not name.find("surname"):
                     errors.append(ValidationError(
                         element="author",
                         message=f"Author {i} missing surname",
                         severity="error",
                         suggestion="Add surname for each author"
                     ))
-                if not name.find(".//given-names"):
+                if not name.find("given-names"):
                     warnings.append(ValidationError(
                         element="author",
                         message=f"Author {i} missing given names",
@@ -196,7 +268,7 @@ class XMLValidator:
             
             # Check if corresponding author has an email or xref
             if contrib.get("corresp") == "yes":
-                if not contrib.find(".//email") and not contrib.find(".//xref[@ref-type='corresp']"):
+                if not parts.get("email") and not parts.get("xref-corresp"):
                     warnings.append(ValidationError(
                         element="author",
                         message=f"Corresponding author {i} should have email or correspondence note",
@@ -205,7 +277,7 @@ class XMLValidator:
                     ))
             
             # Check if author has affiliation or xref to affiliation
-            if not contrib.find(".//aff") and not contrib.find(".//xref[@ref-type='aff']"):
+            if not parts.get("aff") and not parts.get("xref-aff"):
                 warnings.append(ValidationError(
                     element="author",
                     message=f"Author {i} should have affiliation information",
@@ -229,7 +301,7 @@ class XMLValidator:
                     ))
                 
                 # Check if reference has citation content
-                if not (ref.find(".//mixed-citation") or ref.find(".//element-citation")):
+                if not (ref.find("mixed-citation") or ref.find("element-citation")):
                     errors.append(ValidationError(
                         element="reference",
                         message=f"Reference {i} missing citation content",
@@ -238,7 +310,7 @@ class XMLValidator:
                     ))
                 
                 # Check content of mixed-citation
-                mixed_citation = ref.find(".//mixed-citation")
+                mixed_citation = ref.find("mixed-citation")
                 if mixed_citation is not None:
                     # Check if publication-type is set
                     if not mixed_citation.get("publication-type"):
@@ -258,6 +330,14 @@ class XMLValidator:
                             suggestion="Add citation text or structured elements"
                         ))
 
+    def _get_parser(self) -> etree.XMLParser:
+        """Return the calling thread's parser, creating it on first use."""
+        parser = getattr(self._thread_local, 'parser', None)
+        if parser is None:
+            parser = self._create_parser()
+            self._thread_local.parser = parser
+        return parser
+
     def _create_parser(self) -> etree.XMLParser:
         """Create XML parser with custom entity resolver."""
         class DTDResolver(etree.Resolver):
@@ -313,17 +393,18 @@ class XMLValidator:
             return
 
         try:
-            # Create a DTD object
-            dtd = etree.DTD(open(self.dtd_path, 'rb'))
-            
-            # Validate against DTD
-            is_valid = dtd.validate(root)
+            # Validate against the cached DTD. The error log lives on the DTD
+            # object, so validation and reading the log happen under the lock
+            dtd, dtd_lock = _load_dtd(self.dtd_path)
+            with dtd_lock:
+                is_valid = dtd.validate(root)
+                error_log = dtd.error_log
             
             if not is_valid:
                 # Process each validation error
-                for error in dtd.error_log:
+                for error in error_log:
                     # Extract more meaningful information
-                    element_match = re.search(r'Element ([\w-]+)', error.message)
+                    element_match = _DTD_ERROR_ELEMENT_RE.search(error.message)
                     element = element_match.group(1) if element_match else "unknown"
                     
                     # Try to provide helpful suggestions
@@ -351,56 +432,55 @@ class XMLValidator:
 
     def _get_suggestion_for_dtd_error(self, error_msg: str) -> str:
         """Provide helpful suggestions for common DTD validation errors."""
-        if "Element x not allowed" in error_msg:
-            return "Remove this element or replace with an allowed element"
-        
-        if "Element x content does not follow" in error_msg:
-            return "Check element order and required child elements"
-        
-        if "no declaration for" in error_msg:
-            return "This element is not defined in the DTD. Check spelling or use a different element."
-        
-        if "required but not found" in error_msg:
-            return "Add the required element"
-        
-        if "attribute x not allowed" in error_msg:
-            return "Remove this attribute or check attribute name spelling"
+        for phrase, suggestion in _DTD_ERROR_SUGGESTIONS:
+            if phrase in error_msg:
+                return suggestion
         
         return "Check XML structure against PubMed DTD requirements"
 
     def generate_report(self, result: ValidationResult) -> str:
         """Generate a human-readable validation report."""
-        lines = [
-            "PubMed XML Validation Report",
-            "===========================",
-            f"Timestamp: {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Valid: {'Yes' if result.is_valid else 'No'}",
-            f"Errors: {len(result.errors)}",
-            f"Warnings: {len(result.warnings)}",
-            ""
-        ]
+        buffer = io.StringIO()
+        self.write_report(result, buffer)
+        return buffer.getvalue()
+
+    def write_report(self, result: ValidationResult, out: TextIO) -> None:
+        """
+        Write the report produced by generate_report to a text stream, one
+        entry at a time, without building the whole report in memory first.
+
+        Args:
+            result: ValidationResult to report on.
+            out: Writable text stream, e.g. an open file.
+        """
+        out.write(
+            "PubMed XML Validation Report\n"
+            "===========================\n"
+            f"Timestamp: {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Valid: {'Yes' if result.is_valid else 'No'}\n"
+            f"Errors: {len(result.errors)}\n"
+            f"Warnings: {len(result.warnings)}\n"
+        )
         
+        # Every later line starts with its newline, so the report does not
+        # end with one
         if result.errors:
-            lines.append("Errors:")
-            lines.append("-------")
+            out.write("\nErrors:\n-------")
             for i, error in enumerate(result.errors, 1):
-                lines.append(f"{i}. {error.element}: {error.message}")
-                if error.line_number:
-                    lines.append(f"   Line: {error.line_number}")
-                if error.suggestion:
-                    lines.append(f"   Suggestion: {error.suggestion}")
-                lines.append("")
+                # One entry per error, ending in a newline for the blank line
+                out.write(
+                    f"\n{i}. {error.element}: {error.message}\n"
+                    + (f"   Line: {error.line_number}\n" if error.line_number else "")
+                    + (f"   Suggestion: {error.suggestion}\n" if error.suggestion else "")
+                )
         
         if result.warnings:
-            lines.append("Warnings:")
-            lines.append("---------")
+            out.write("\nWarnings:\n---------")
             for i, warning in enumerate(result.warnings, 1):
-                lines.append(f"{i}. {warning.element}: {warning.message}")
-                if warning.suggestion:
-                    lines.append(f"   Suggestion: {warning.suggestion}")
-                lines.append("")
+                out.write(
+                    f"\n{i}. {warning.element}: {warning.message}\n"
+                    + (f"   Suggestion: {warning.suggestion}\n" if warning.suggestion else "")
+                )
         
         if not result.errors and not result.warnings:
-            lines.append("Congratulations! The XML is valid and has no warnings.")
-        
-        return "\n".join(lines)
\ No newline at end of file
+            out.write("\nCongratulations! The XML is valid and has no warnings.")
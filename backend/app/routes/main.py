@@ -1,31 +1,179 @@
 # app/routes/main.py
 
-from flask import Blueprint, request, jsonify, send_file
+from flask import Blueprint, Response, request, jsonify, send_file
 from werkzeug.datastructures import FileStorage
-from typing import List, Dict, Optional, Tuple
+from werkzeug.exceptions import HTTPException, RequestEntityTooLarge
+from typing import BinaryIO, Callable, List, Dict, Iterator, Optional, Tuple
 import logging
 import os
 import time
 import hashlib
+import secrets
 import json
 import zipfile
 import tempfile
-from io import BytesIO
-from dataclasses import asdict
+import threading
+import uuid
+import unicodedata
+import re
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import quote
+from dataclasses import dataclass
 
 from app.core.pdf_extractor import PDFExtractor
 from app.core.metadata_extractor import MetadataExtractor
 from app.core.text_processor import TextProcessor
 from app.core.xml_generator import XMLGenerator
-from app.core.xml_validator import XMLValidator
+from app.core.xml_validator import XMLValidator, ValidationResult
 
 main = Blueprint('main', __name__)
 logger = logging.getLogger(__name__)
 
+# Recent conversion results keyed by (PDF digest, article type), so that
+# uploading the same PDF again skips the pipeline. The oldest entry is
+# dropped once the cache is full
+CONVERSION_CACHE_SIZE = 32
+_conversion_cache: "OrderedDict[Tuple[str, str], Tuple[str, ValidationResult]]" = OrderedDict()
+_conversion_cache_lock = threading.Lock()
+
+# Buffer size for copying uploads to disk; larger than Werkzeug's 16KB
+# default to cut the number of read/write calls on big PDFs
+UPLOAD_COPY_BUFFER_SIZE = 1 << 20
+
+# Figure uploads that are accepted, and the largest size a figure may have
+ALLOWED_FIGURE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.tiff', '.gif'})
+MAX_FIGURE_BYTES = 20 * 1024 * 1024
+
+# Background conversions started through POST /jobs run on this many
+# threads in the worker process that accepted them. Their state lives in
+# files under JOB_DIR, which every worker must share, so any worker can
+# answer /progress and /download. A job directory is removed once it has
+# not changed for JOB_RESULT_TTL seconds
+JOB_WORKERS = 2
+JOB_DIR = os.environ.get('PUBMED_JOB_DIR', os.path.join(tempfile.gettempdir(), 'pubmed-jobs'))
+JOB_RESULT_TTL = 60 * 60
+_job_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='jobs')
+_JOB_ID_RE = re.compile(r'[0-9a-f]{32}')
+
+# Stages after which a job publishes nothing more
+FINAL_JOB_STAGES = frozenset({'done', 'error'})
+STALLED_JOB_EVENT = {'stage': 'error', 'percent': 100, 'error': 'Conversion worker stopped'}
+
+# A running job touches its heartbeat file every JOB_HEARTBEAT_INTERVAL
+# seconds. Once started, a job whose heartbeat is older than
+# JOB_STALL_TIMEOUT is reported as failed: the worker process running it was
+# most likely restarted. Queued jobs have no heartbeat and never stall
+JOB_HEARTBEAT_INTERVAL = 30
+JOB_STALL_TIMEOUT = 5 * JOB_HEARTBEAT_INTERVAL
+
+# Progress streams poll the events file and close after
+# PROGRESS_STREAM_DURATION seconds, well inside the gunicorn timeout; the
+# browser's EventSource reconnects after PROGRESS_RETRY_MS and resumes from
+# Last-Event-ID, so a sync worker is never held for a whole conversion
+PROGRESS_POLL_INTERVAL = 0.5
+PROGRESS_STREAM_DURATION = 60
+PROGRESS_RETRY_MS = 1000
+
+# Seconds between keep-alive comments on an idle progress stream
+PROGRESS_HEARTBEAT = 15
+
+# Deflate level for the text entries of the archive (XML, validation report);
+# they compress well at a low level without spending zlib's default effort
+ZIP_COMPRESS_LEVEL = 3
+
+# Figure formats that are already compressed and are stored in the archive
+# without deflating them again
+PRECOMPRESSED_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif'})
+
+# Copies uploaded figures to disk while the request thread saves the PDF
+_figure_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='figures')
+
+class ZipChunkBuffer:
+    """
+    Write-only file object for zipfile that hands back what has been written
+    since the last take(). zipfile writes to it as an unseekable stream.
+    """
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        """Return and forget everything written so far"""
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def attachment_filenames(filename: str) -> Dict[str, str]:
+    """
+    Content-Disposition parameters for a download. Headers must be Latin-1,
+    so a non-ASCII name is sent as an ASCII fallback plus an RFC 5987
+    filename*, as send_file does. Werkzeug quotes the values.
+    """
+    try:
+        filename.encode('ascii')
+    except UnicodeEncodeError:
+        fallback = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+        return {'filename': fallback, 'filename*': f"UTF-8''{quote(filename, safe='!#$&+^`|~')}"}
+    return {'filename': filename}
+
+def upload_size(file: FileStorage) -> Optional[int]:
+    """
+    Size of an uploaded part: its declared length, or else the size of the
+    spooled stream Werkzeug has already written. None if neither is known.
+    """
+    if file.content_length:
+        return file.content_length
+    stream = file.stream
+    try:
+        if stream.seekable():
+            position = stream.tell()
+            size = stream.seek(0, os.SEEK_END)
+            stream.seek(position)
+            return size
+    except (AttributeError, OSError):
+        pass
+    return None
+
+def figure_too_large(figure: FileStorage) -> RequestEntityTooLarge:
+    """413 for a figure over MAX_FIGURE_BYTES"""
+    return RequestEntityTooLarge(
+        f"Figure {figure.filename} exceeds the {MAX_FIGURE_BYTES >> 20}MB limit"
+    )
+
+def file_digest(path: str) -> str:
+    """Content digest of a file, as used for the conversion cache key"""
+    with open(path, 'rb') as f:
+        return copy_with_digest(f, None)
+
+def copy_with_digest(src: BinaryIO, dst: Optional[BinaryIO]) -> str:
+    """
+    Copy src to dst in UPLOAD_COPY_BUFFER_SIZE chunks and return the BLAKE2b
+    digest of the content, so an upload is hashed while it is saved instead
+    of being read back afterwards.
+
+    Args:
+        src: Stream to read until exhausted
+        dst: Stream to write to, or None to only compute the digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    while chunk := src.read(UPLOAD_COPY_BUFFER_SIZE):
+        digest.update(chunk)
+        if dst is not None:
+            dst.write(chunk)
+    return digest.hexdigest()
+
 def setup_logging():
     """Configure detailed logging for the routes"""
     logger.setLevel(logging.INFO)
-    if not logger.handlers:
+    if not logger.hasHandlers():
         handler = logging.StreamHandler()
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -55,71 +203,139 @@ class ConversionManager:
             
         return True, None
         
-    def process_figures(self, figures: List[FileStorage]) -> List[Dict]:
-        """Process and validate figure files"""
-        processed_figures = []
-        allowed_extensions = {'.png', '.jpg', '.jpeg', '.tiff', '.gif'}
+    def check_figures(self, figures: List[FileStorage]) -> List[FileStorage]:
+        """
+        Return the figures worth copying, checked on name and size only, so
+        that an oversized figure is refused before any conversion work.
+        Figures with other extensions are skipped; a figure over
+        MAX_FIGURE_BYTES fails the request with a 413.
+        """
+        accepted = []
         
         for figure in figures:
             ext = os.path.splitext(figure.filename)[1].lower()
-            if ext not in allowed_extensions:
-                logger.warning(f"Skipping invalid figure file: {figure.filename}")
+            if ext not in ALLOWED_FIGURE_EXTENSIONS:
+                logger.warning("Skipping invalid figure file: %s", figure.filename)
                 continue
+            
+            size = upload_size(figure)
+            if size is not None and size > MAX_FIGURE_BYTES:
+                raise figure_too_large(figure)
+            accepted.append(figure)
+            
+        return accepted
+        
+    def process_figures(self, figures: List[FileStorage], directory: str) -> List[Dict]:
+        """
+        Copy figures accepted by check_figures() into files under directory,
+        so that figures are never held in memory.
+        """
+        processed_figures = []
+        
+        for index, figure in enumerate(figures):
+            ext = os.path.splitext(figure.filename)[1].lower()
+            
+            # Named by position, since the uploaded name is not safe as a path.
+            # The size is counted again while copying, for streams whose size
+            # could not be measured up front
+            path = os.path.join(directory, f"{index}{ext}")
+            with open(path, 'wb') as f:
+                written = 0
+                while chunk := figure.stream.read(UPLOAD_COPY_BUFFER_SIZE):
+                    written += len(chunk)
+                    if written > MAX_FIGURE_BYTES:
+                        raise figure_too_large(figure)
+                    f.write(chunk)
                 
             processed_figures.append({
                 'filename': figure.filename,
-                'data': figure.read(),
+                'path': path,
                 'mime_type': figure.content_type
             })
-            figure.seek(0)  # Reset file pointer
             
         return processed_figures
 
-    def create_zip_archive(self, pdf_file: FileStorage, xml_content: str, 
-                            figures: List[Dict]) -> BytesIO:
-        """Create ZIP archive with converted content"""
-        memory_file = BytesIO()
+    def create_zip_archive(self, pdf_path: str, pdf_filename: str, xml_content: str,
+                            figures: List[Dict],
+                            validation_result: ValidationResult) -> Iterator[bytes]:
+        """
+        Create ZIP archive with converted content, returned as an iterator of
+        chunks that can be streamed to the client while it is being built.
+        The validation report is serialized before the first chunk, so its
+        errors still surface as a normal failed request.
+        """
+        validation_result_json = validation_result.to_json()
+        return self._iter_zip_chunks(pdf_path, pdf_filename, xml_content,
+                                     figures, validation_result_json)
+
+    def _iter_zip_chunks(self, pdf_path: str, pdf_filename: str, xml_content: str,
+                         figures: List[Dict], validation_result_json: bytes) -> Iterator[bytes]:
+        """Write the archive entries one by one, yielding the bytes of each"""
+        buffer = ZipChunkBuffer()
         
-        with zipfile.ZipFile(memory_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-            # Add PDF
-            pdf_data = pdf_file.read()
-            pdf_file.seek(0)
-            zf.writestr(pdf_file.filename, pdf_data)
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=ZIP_COMPRESS_LEVEL) as zf:
+            # Add PDF, read from the saved temporary file. PDFs compress
+            # their streams internally, so it is stored as is
+            zf.write(pdf_path, arcname=pdf_filename, compress_type=zipfile.ZIP_STORED)
+            yield buffer.take()
             
             # Add XML
-            xml_filename = f"{os.path.splitext(pdf_file.filename)[0]}.xml"
+            xml_filename = f"{os.path.splitext(pdf_filename)[0]}.xml"
             zf.writestr(xml_filename, xml_content)
             
             # Add figures
             if figures:
                 for figure in figures:
-                    zf.writestr(f"figures/{figure['filename']}", figure['data'])
+                    ext = os.path.splitext(figure['filename'])[1].lower()
+                    compress_type = (zipfile.ZIP_STORED if ext in PRECOMPRESSED_EXTENSIONS
+                                     else zipfile.ZIP_DEFLATED)
+                    zf.write(figure['path'], arcname=f"figures/{figure['filename']}",
+                             compress_type=compress_type)
+                    yield buffer.take()
             
             # Add validation report
-            validation_result = self.xml_validator.validate(xml_content)
-            validation_result_json = json.dumps(
-                asdict(validation_result),
-                indent=2,
-                default=str  # This will convert datetime to string automatically
-            )
             zf.writestr("validation_report.json", validation_result_json)
-            
-        memory_file.seek(0)
-        return memory_file
+        
+        # Central directory, written when the archive is closed
+        yield buffer.take()
 
+    def convert_pdf(self, pdf_file: str, article_type: str,
+                    progress: Optional[Callable[[str, int], None]] = None,
+                    pdf_digest: Optional[str] = None) -> Tuple[str, ValidationResult]:
+        """
+        Convert PDF to XML using the full pipeline
 
-    def convert_pdf(self, pdf_file: str, article_type: str, figures: List[Dict]) -> Tuple[str, List[str]]:
-        """Convert PDF to XML using the full pipeline"""
+        Args:
+            pdf_file: Path of the PDF to convert
+            article_type: Article type chosen by the user
+            progress: Called with (stage, percent) as each stage starts
+            pdf_digest: copy_with_digest() result for the PDF, if the caller
+                already has it; otherwise the file is read to compute it
+        """
+        report = progress or (lambda stage, percent: None)
+        
+        # Reuse the result if this PDF was converted with the same article type
+        cache_key = (pdf_digest or file_digest(pdf_file), article_type)
+        with _conversion_cache_lock:
+            cached = _conversion_cache.get(cache_key)
+            if cached is not None:
+                _conversion_cache.move_to_end(cache_key)
+                return cached
+        
         # Extract content from PDF
+        report('extracting', 10)
         extracted_content = self.pdf_extractor.extract(pdf_file)
         
         # Extract metadata
+        report('metadata', 40)
         journal_meta, article_meta = self.metadata_extractor.extract_metadata(
             extracted_content,
             user_article_type=article_type  # Pass the article_type here
         )
         
         # Process content - Now passing the required article_title!
+        report('processing', 55)
         processed_content = self.text_processor.process(
             extracted_content=extracted_content,
             article_title=article_meta.title,  # Add this
@@ -127,89 +343,385 @@ class ConversionManager:
         )
         
         # Generate XML
+        report('generating', 70)
         xml_content = self.xml_generator.generate(
             journal_meta=journal_meta,
             article_meta=article_meta,
             processed_content=processed_content  # Pass the full processed_content object
         )
         
-        # Validate XML
+        # Validate XML; the result is reused for the archive's validation report
+        report('validating', 80)
         validation_result = self.xml_validator.validate(xml_content)
-        is_valid = validation_result.is_valid
-        validation_errors = validation_result.errors
         
-        return xml_content, validation_errors
+        # A pdfplumber-only result is left out, so the PDF is converted again
+        # once GROBID is back
+        if not extracted_content.from_fallback:
+            with _conversion_cache_lock:
+                _conversion_cache[cache_key] = (xml_content, validation_result)
+                if len(_conversion_cache) > CONVERSION_CACHE_SIZE:
+                    _conversion_cache.popitem(last=False)
+        
+        return xml_content, validation_result
+
+setup_logging()
+
+# Shared by all requests, so the extractors, DTDs and HTTP session are set
+# up once per process rather than on every conversion. Built on first use,
+# so importing the routes needs neither the DTDs nor GROBID
+_conversion_manager: Optional[ConversionManager] = None
+_conversion_manager_lock = threading.Lock()
+
+def get_conversion_manager() -> ConversionManager:
+    """Return the process-wide ConversionManager, creating it on first call"""
+    global _conversion_manager
+    if _conversion_manager is None:
+        with _conversion_manager_lock:
+            if _conversion_manager is None:
+                _conversion_manager = ConversionManager()
+    return _conversion_manager
 
 @main.route('/convert', methods=['POST'])
 def convert_pdf():
     """Convert PDF to XML with comprehensive error handling and validation"""
-    setup_logging()
-    conversion_manager = ConversionManager()
     start_time = time.time()
-    request_id = hashlib.md5(str(time.time()).encode()).hexdigest()[:8]
+    request_id = secrets.token_hex(4)
     
-    logger.info(f"Starting conversion request {request_id}")
+    logger.info("Starting conversion request %s", request_id)
     
     try:
+        conversion_manager = get_conversion_manager()
+        
         # Validate request
         if 'pdf' not in request.files:
-            logger.error(f"Request {request_id}: No PDF file in request")
+            logger.error("Request %s: No PDF file in request", request_id)
             return jsonify({'error': 'No PDF file provided'}), 400
         
         pdf_file = request.files['pdf']
         is_valid, error_msg = conversion_manager.validate_file(pdf_file)
         if not is_valid:
-            logger.error(f"Request {request_id}: {error_msg}")
+            logger.error("Request %s: %s", request_id, error_msg)
             return jsonify({'error': error_msg}), 400
             
-        # Process figures if present
-        figures = conversion_manager.process_figures(request.files.getlist('figures'))
+        figures_dir = tempfile.TemporaryDirectory()
+        figures_future = None
+        temp_path = None
         
-        # Save PDF temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
-            pdf_file.save(temp_pdf.name)
-            temp_path = temp_pdf.name
+        def cleanup():
+            # A figure copy may still be running if the conversion failed
+            if figures_future:
+                wait([figures_future])
+            figures_dir.cleanup()
+            if temp_path:
+                os.unlink(temp_path)
         
         try:
+            # Check figures here, then copy them in the background while the
+            # PDF is saved; a failed copy stops the request before conversion
+            accepted_figures = conversion_manager.check_figures(request.files.getlist('figures'))
+            figures_future = _figure_executor.submit(
+                conversion_manager.process_figures, accepted_figures, figures_dir.name
+            )
+            
+            # Save PDF temporarily
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
+                temp_path = temp_pdf.name
+                pdf_digest = copy_with_digest(pdf_file.stream, temp_pdf)
+            figures = figures_future.result()
+            
             # Convert PDF to XML
-            logger.info(f"Request {request_id}: Converting PDF")
+            logger.info("Request %s: Converting PDF", request_id)
             article_type = request.form.get('articleType', 'research-article')
             
-            xml_content, validation_errors = conversion_manager.convert_pdf(
+            xml_content, validation_result = conversion_manager.convert_pdf(
                 pdf_file=temp_path,
                 article_type=article_type,
-                figures=figures
+                pdf_digest=pdf_digest
             )
             
             # Create ZIP archive
-            logger.info(f"Request {request_id}: Creating ZIP archive")
-            memory_file = conversion_manager.create_zip_archive(pdf_file, xml_content, figures)
+            logger.info("Request %s: Creating ZIP archive", request_id)
+            zip_chunks = conversion_manager.create_zip_archive(
+                temp_path, pdf_file.filename, xml_content, figures, validation_result
+            )
             
             # Prepare response
             zip_filename = f"{os.path.splitext(pdf_file.filename)[0]}.zip"
-            processing_time = time.time() - start_time
+            logger.info("Request %s: Conversion completed in %.2f seconds",
+                        request_id, time.time() - start_time)
             
-            logger.info(f"Request {request_id}: Conversion completed in {processing_time:.2f} seconds")
+            response = Response(zip_chunks, mimetype='application/zip')
+            response.headers.set('Content-Disposition', 'attachment',
+                                 **attachment_filenames(zip_filename))
+            # The archive reads the temporary files while it streams, so they
+            # are removed once the response is closed
+            response.call_on_close(cleanup)
+            return response
             
-            return send_file(
-                memory_file,
-                mimetype='application/zip',
-                as_attachment=True,
-                download_name=zip_filename
-            )
-            
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_path)
+        except BaseException:
+            # Clean up temporary files
+            cleanup()
+            raise
             
+    except HTTPException:
+        # e.g. 413 from MAX_CONTENT_LENGTH; let Flask's error handlers answer
+        raise
     except Exception as e:
-        logger.exception(f"Request {request_id}: Unexpected error")
+        logger.exception("Request %s: Unexpected error", request_id)
         return jsonify({
             'error': str(e),
             'request_id': request_id,
             'processing_time': time.time() - start_time
         }), 500
 
+@dataclass
+class ConversionJob:
+    """
+    A background conversion, kept entirely in its directory under JOB_DIR so
+    that any worker process can report on it. The directory holds the
+    upload, job.json, events.jsonl (one progress event per line, appended
+    by the converting process) and, once done, result.zip.
+    """
+    job_id: str
+
+    @classmethod
+    def find(cls, job_id: str) -> Optional['ConversionJob']:
+        """The job with this id, or None if it is unknown or has expired"""
+        if not _JOB_ID_RE.fullmatch(job_id):
+            return None
+        job = cls(job_id)
+        return job if os.path.isfile(job.events_path) else None
+
+    @property
+    def directory(self) -> str:
+        return os.path.join(JOB_DIR, self.job_id)
+
+    @property
+    def events_path(self) -> str:
+        return os.path.join(self.directory, 'events.jsonl')
+
+    @property
+    def result_path(self) -> str:
+        return os.path.join(self.directory, 'result.zip')
+
+    def publish(self, stage: str, percent: int, error: Optional[str] = None) -> None:
+        """Append a progress event; a single short write, so readers see whole lines"""
+        event = {'stage': stage, 'percent': percent}
+        if error is not None:
+            event['error'] = error
+        with open(self.events_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(event) + '\n')
+
+    @property
+    def heartbeat_path(self) -> str:
+        return os.path.join(self.directory, 'heartbeat')
+
+    def read_events(self) -> List[Dict]:
+        """Events published so far, ignoring a line that is still being written"""
+        with open(self.events_path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.endswith('\n')]
+
+    def beat(self) -> None:
+        """Mark the job as still running"""
+        with open(self.heartbeat_path, 'a'):
+            os.utime(self.heartbeat_path)
+
+    def stalled(self, events: List[Dict]) -> bool:
+        """
+        True if the job started but its heartbeat stopped before it
+        finished, i.e. the process running it went away.
+        """
+        if events and events[-1]['stage'] in FINAL_JOB_STAGES:
+            return False
+        try:
+            heartbeat = os.path.getmtime(self.heartbeat_path)
+        except FileNotFoundError:
+            # Still queued
+            return False
+        return time.time() - heartbeat > JOB_STALL_TIMEOUT
+
+    def download_name(self) -> str:
+        with open(os.path.join(self.directory, 'job.json'), encoding='utf-8') as f:
+            return json.load(f)['download_name']
+
+def expire_jobs():
+    """Delete job directories that have not changed for JOB_RESULT_TTL seconds"""
+    if not os.path.isdir(JOB_DIR):
+        return
+    cutoff = time.time() - JOB_RESULT_TTL
+    for entry in os.scandir(JOB_DIR):
+        try:
+            if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                events_path = os.path.join(entry.path, 'events.jsonl')
+                if not os.path.exists(events_path) or os.path.getmtime(events_path) < cutoff:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+        except OSError:
+            # Removed by another worker in the meantime
+            continue
+
+def run_conversion_job(job: ConversionJob, pdf_path: str, pdf_digest: str,
+                       pdf_filename: str, article_type: str, figures: List[Dict]):
+    """Convert a job's saved upload and write its ZIP next to it"""
+    stopped = threading.Event()
+    
+    def keep_beating():
+        while not stopped.wait(JOB_HEARTBEAT_INTERVAL):
+            job.beat()
+    
+    job.beat()
+    threading.Thread(target=keep_beating, name=f'job-{job.job_id}-heartbeat',
+                     daemon=True).start()
+    try:
+        conversion_manager = get_conversion_manager()
+        xml_content, validation_result = conversion_manager.convert_pdf(
+            pdf_path, article_type, progress=job.publish, pdf_digest=pdf_digest
+        )
+        
+        job.publish('archiving', 90)
+        # Renamed into place once complete, so a download never sees half a ZIP
+        partial_path = job.result_path + '.part'
+        with open(partial_path, 'wb') as f:
+            for chunk in conversion_manager.create_zip_archive(
+                    pdf_path, pdf_filename, xml_content, figures, validation_result):
+                f.write(chunk)
+        os.replace(partial_path, job.result_path)
+        
+        logger.info("Job %s: Conversion completed", job.job_id)
+        job.publish('done', 100)
+    except Exception as e:
+        logger.exception("Job %s: Conversion failed", job.job_id)
+        job.publish('error', 100, error=str(e))
+    finally:
+        stopped.set()
+
+def iter_progress_events(job: ConversionJob, sent: int) -> Iterator[str]:
+    """
+    Server-sent events for a job, starting after the first `sent` events.
+    The stream ends when the job finishes or after PROGRESS_STREAM_DURATION;
+    in the latter case the client reconnects with Last-Event-ID and resumes.
+    """
+    yield f"retry: {PROGRESS_RETRY_MS}\n\n"
+    
+    started = last_output = time.monotonic()
+    while time.monotonic() - started < PROGRESS_STREAM_DURATION:
+        events = job.read_events()
+        for event in events[sent:]:
+            sent += 1
+            last_output = time.monotonic()
+            yield f"id: {sent}\ndata: {json.dumps(event)}\n\n"
+        if events and events[-1]['stage'] in FINAL_JOB_STAGES:
+            return
+        if job.stalled(events):
+            # Not a published event, so it carries no id and does not shift
+            # the ids a reconnecting client resumes from
+            yield f"data: {json.dumps(STALLED_JOB_EVENT)}\n\n"
+            return
+        
+        if time.monotonic() - last_output >= PROGRESS_HEARTBEAT:
+            # Comment line, keeps proxies from closing an idle stream
+            last_output = time.monotonic()
+            yield ": heartbeat\n\n"
+        time.sleep(PROGRESS_POLL_INTERVAL)
+
+@main.route('/jobs', methods=['POST'])
+def submit_conversion_job():
+    """Start a conversion in the background and return its job id"""
+    try:
+        expire_jobs()
+        
+        if 'pdf' not in request.files:
+            return jsonify({'error': 'No PDF file provided'}), 400
+        
+        conversion_manager = get_conversion_manager()
+        pdf_file = request.files['pdf']
+        is_valid, error_msg = conversion_manager.validate_file(pdf_file)
+        if not is_valid:
+            return jsonify({'error': error_msg}), 400
+        
+        job = ConversionJob(uuid.uuid4().hex)
+        os.makedirs(job.directory)
+        try:
+            # The upload can only be read during this request, so it is copied
+            # into the job's directory before the job is queued
+            figures = conversion_manager.process_figures(
+                conversion_manager.check_figures(request.files.getlist('figures')),
+                job.directory
+            )
+            pdf_path = os.path.join(job.directory, 'input.pdf')
+            with open(pdf_path, 'wb') as f:
+                pdf_digest = copy_with_digest(pdf_file.stream, f)
+            
+            download_name = f"{os.path.splitext(pdf_file.filename)[0]}.zip"
+            with open(os.path.join(job.directory, 'job.json'), 'w', encoding='utf-8') as f:
+                json.dump({'download_name': download_name}, f)
+            # Written last: a job is only visible once its inputs are in place
+            job.publish('queued', 0)
+        except BaseException:
+            shutil.rmtree(job.directory, ignore_errors=True)
+            raise
+        
+        _job_executor.submit(
+            run_conversion_job, job, pdf_path, pdf_digest, pdf_file.filename,
+            request.form.get('articleType', 'research-article'), figures
+        )
+        
+        logger.info("Job %s: Queued %s", job.job_id, pdf_file.filename)
+        return jsonify({'job_id': job.job_id}), 202
+        
+    except HTTPException:
+        # e.g. 413 for an oversized figure; let Flask's error handlers answer
+        raise
+    except Exception as e:
+        logger.exception("Job submission failed")
+        return jsonify({'error': str(e)}), 500
+
+@main.route('/progress/<job_id>', methods=['GET'])
+def job_progress(job_id):
+    """Stream a job's progress as server-sent events"""
+    job = ConversionJob.find(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    
+    # Set by EventSource when it reconnects: the number of events it has seen
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    sent = int(last_event_id) if last_event_id.isdigit() else 0
+    
+    return Response(
+        iter_progress_events(job, sent),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@main.route('/download/<job_id>', methods=['GET'])
+def download_job_result(job_id):
+    """Return the ZIP of a finished job"""
+    job = ConversionJob.find(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    
+    if not os.path.isfile(job.result_path):
+        events = job.read_events()
+        if events and events[-1]['stage'] == 'error':
+            return jsonify({'error': events[-1]['error']}), 500
+        if job.stalled(events):
+            return jsonify({'error': STALLED_JOB_EVENT['error']}), 500
+        return jsonify({'error': 'Conversion still running'}), 409
+    
+    return send_file(
+        job.result_path,
+        mimetype='application/zip',
+        as_attachment=True,
+        download_name=job.download_name()
+    )
+
+@main.app_errorhandler(413)
+def request_too_large(error):
+    """Return oversized uploads as a JSON error like the other failures"""
+    if error.description != RequestEntityTooLarge.description:
+        # Raised by the routes with a specific message, e.g. for a figure
+        return jsonify({'error': error.description}), 413
+    return jsonify({'error': 'Upload exceeds the 50MB limit'}), 413
+
 @main.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -0,0 +1,28 @@
+# tests/test_metadata_extractor.py
+#
+# Run from backend/: python -m pytest tests
+
+from app.core.metadata_extractor import MetadataExtractor
+
+WINDOW = MetadataExtractor._HEADER_WINDOW
+
+
+def test_bare_year_in_header_does_not_hide_later_full_date():
+    header = "A study from 2019\nKeywords: acne; rosacea\n\nDOI: 10.1234/abc.def\n"
+    text = header + "filler text\n" * (3 * WINDOW // 12) + "Published: 2021-03-04\n"
+    assert len(text) > 2 * WINDOW
+
+    pubdate = MetadataExtractor()._find_publication_date(text)
+
+    assert pubdate == {"year": "2021", "month": "03", "day": "04"}
+
+
+def test_doi_crossing_header_window_edge_is_not_truncated():
+    doi = "10.1234/abcdefghijk.lmn"
+    header = "Keywords: acne; rosacea\n\nPublished: 2021-03-04\n"
+    # The window edge falls right after "10.1234/abc"
+    prefix = header + "x" * (WINDOW - len(header) - 16) + " doi:"
+    text = prefix + doi + " and more text " * 500
+    assert text[:WINDOW].endswith("doi:10.1234/abc")
+
+    assert MetadataExtractor()._find_doi(text) == doi
@@ -0,0 +1,20 @@
+"""
+WSGI entry point for production servers.
+
+The conversion pipeline is CPU-bound, so run one worker process per core
+instead of the single-process development server in run.py, e.g.:
+
+    gunicorn -w $(nproc) -k sync --timeout 300 wsgi:app
+
+Background jobs (POST /jobs) run in the worker that accepted them, but their
+progress and result are kept under PUBMED_JOB_DIR (default: pubmed-jobs in
+the system temp directory), so /progress and /download can be answered by
+any worker. All workers must see the same directory; across several hosts
+it has to be a shared mount. A running job touches a heartbeat file there;
+if the worker running it dies, the job is reported as failed once the
+heartbeat goes stale. A progress stream holds a sync worker for at
+most a minute before the browser reconnects, well inside --timeout.
+"""
+from app import create_app
+
+app = create_app()